@@ -8,17 +8,11 @@ from alembic import context
 from app.config import settings
 from app.database import Base
 
-# Importar todos los modelos para que Alembic los detecte
-from app.models import (  # noqa: F401
-    Actividad,
-    ActividadProgreso,
-    Clase,
-    Partida,
-    Profesor,
-    Punto,
-    Sesion,
-    Usuario,
-)
+# Importar todos los modelos para que Alembic los detecte (incluidos los de
+# carga diferida de app.models)
+from app.models import load_all_models
+
+load_all_models()
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -7,8 +7,6 @@ Create Date: 2026-02-06 21:01:04.661765
 """
 from typing import Sequence, Union
 
-import sqlalchemy as sa
-
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -19,7 +17,11 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.add_column('evento', sa.Column('contenido', sa.Text(), nullable=True))
+    # Convención para añadir columnas: ADD COLUMN nullable y sin DEFAULT, que en
+    # PostgreSQL >= 11 es solo de metadatos (no reescribe la tabla). Si una columna
+    # debe ser NOT NULL, se añade así, se rellena en una migración de datos aparte
+    # y solo después se fijan el DEFAULT y el NOT NULL.
+    op.execute('ALTER TABLE evento ADD COLUMN contenido TEXT')
 
 
 def downgrade() -> None:
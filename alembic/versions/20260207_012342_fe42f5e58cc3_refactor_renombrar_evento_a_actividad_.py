@@ -5,6 +5,7 @@ Revises: 99feb955a1e1
 Create Date: 2026-02-07 01:23:42.224308
 
 """
+import contextlib
 from typing import Sequence, Union
 
 import sqlalchemy as sa
@@ -18,27 +19,72 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _checkpoint():
+    """Ejecuta el paso en su propia transacción en PostgreSQL.
+
+    Cada ALTER toma un lock ACCESS EXCLUSIVE; con autocommit_block se libera
+    al terminar cada paso en lugar de mantenerlo durante toda la migración.
+    En otros dialectos (SQLite en tests) no hace nada.
+
+    Como cada paso se confirma por separado, si la migración falla a mitad
+    alembic_version sigue en 99feb955a1e1 con parte de los cambios ya
+    aplicados. Por eso cada paso comprueba antes el catálogo y se salta si ya
+    está hecho: basta con volver a ejecutar ``alembic upgrade``.
+    """
+    if op.get_bind().dialect.name == 'postgresql':
+        return op.get_context().autocommit_block()
+    return contextlib.nullcontext()
+
+
+def _has_table(table: str) -> bool:
+    # Inspector nuevo en cada llamada: el catálogo cambia entre pasos
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def _columns(table: str) -> set[str]:
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
 def upgrade() -> None:
     # Paso 1: Renombrar tablas (orden correcto para evitar conflictos)
-    op.rename_table('evento_estado', 'actividad_progreso')
-    op.rename_table('actividad', 'punto')  # Liberar el nombre "actividad"
-    op.rename_table('evento', 'actividad')  # Ahora podemos usar "actividad"
+    with _checkpoint():
+        if _has_table('evento_estado'):
+            op.rename_table('evento_estado', 'actividad_progreso')
+    with _checkpoint():
+        if not _has_table('punto'):
+            op.rename_table('actividad', 'punto')  # Liberar el nombre "actividad"
+    with _checkpoint():
+        if _has_table('evento'):
+            op.rename_table('evento', 'actividad')  # Ahora podemos usar "actividad"
 
     # Paso 2: Renombrar columnas FK en actividad_progreso
     # id_actividad → id_punto (referencia a la antigua tabla actividad, ahora punto)
     # id_evento → id_actividad (referencia a la antigua tabla evento, ahora actividad)
-    op.alter_column('actividad_progreso', 'id_actividad', new_column_name='id_punto')
-    op.alter_column('actividad_progreso', 'id_evento', new_column_name='id_actividad')
+    with _checkpoint():
+        if 'id_punto' not in _columns('actividad_progreso'):
+            op.alter_column('actividad_progreso', 'id_actividad', new_column_name='id_punto')
+    with _checkpoint():
+        if 'id_evento' in _columns('actividad_progreso'):
+            op.alter_column('actividad_progreso', 'id_evento', new_column_name='id_actividad')
 
     # Paso 3: Renombrar columna FK en actividad (antes evento)
     # id_actividad → id_punto
-    op.alter_column('actividad', 'id_actividad', new_column_name='id_punto')
+    with _checkpoint():
+        if 'id_punto' not in _columns('actividad'):
+            op.alter_column('actividad', 'id_actividad', new_column_name='id_punto')
 
-    # Paso 4: Eliminar columna contenido de actividad (antes evento, ahora es template)
-    op.drop_column('actividad', 'contenido')
+    # Paso 4: Añadir columna respuesta_contenido a actividad_progreso
+    with _checkpoint():
+        if 'respuesta_contenido' not in _columns('actividad_progreso'):
+            op.add_column(
+                'actividad_progreso', sa.Column('respuesta_contenido', sa.Text(), nullable=True)
+            )
 
-    # Paso 5: Añadir columna respuesta_contenido a actividad_progreso
-    op.add_column('actividad_progreso', sa.Column('respuesta_contenido', sa.Text(), nullable=True))
+    # Paso 5 (último): Eliminar columna contenido de actividad (antes evento, ahora es
+    # template). En PostgreSQL >= 11 es un cambio solo de metadatos, sin reescribir la tabla.
+    with _checkpoint():
+        if 'contenido' in _columns('actividad'):
+            op.execute('ALTER TABLE actividad DROP COLUMN contenido')
 
 
 def downgrade() -> None:
@@ -6,11 +6,13 @@ Create Date: 2026-02-10 02:44:48.787500
 
 """
 
-import random
+import logging
+import os
 import string
 from collections.abc import Sequence
 
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 
 from alembic import op
 
@@ -20,54 +22,91 @@ down_revision: str | None = "044f4718d481"
 branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
+# Logger de Alembic: su nivel se controla en [logger_alembic] de alembic.ini
+# (INFO en desarrollo; subir a WARN para silenciar la migración en producción)
+logger = logging.getLogger("alembic.runtime.migration")
 
-def generar_codigo_clase() -> str:
-    """Genera un código alfanumérico único de 6 caracteres.
+# Número de filas actualizadas por cada executemany
+BATCH_SIZE = 1000
 
-    Evita caracteres ambiguos: 0/O, 1/I/l
+CODIGO_LEN = 6
+
+# Evita caracteres ambiguos: 0/O, 1/I/l. Son 32 símbolos, así que cada byte
+# aleatorio se asigna sin sesgo con `byte % 32`.
+_ALFABETO = (string.ascii_uppercase + string.digits).encode("ascii").translate(None, b"OI01")
+_TABLA_ALFABETO = bytes(_ALFABETO[b % len(_ALFABETO)] for b in range(256))
+
+
+def generar_codigos_unicos(cantidad: int, existentes: frozenset[str] = frozenset()) -> list[str]:
+    """Genera `cantidad` códigos de 6 caracteres distintos que no estén en `existentes`.
+
+    Extrae candidatos en bloque con una única llamada a os.urandom por
+    ronda, los traduce al alfabeto con bytes.translate y descarta los
+    duplicados por diferencia de conjuntos, sin bucles de reintento por fila.
     """
-    caracteres = string.ascii_uppercase.replace("O", "").replace("I", "") + string.digits.replace(
-        "0", ""
-    ).replace("1", "")
-    return "".join(random.choices(caracteres, k=6))
+    codigos: set[str] = set()
+    while len(codigos) < cantidad:
+        faltan = cantidad - len(codigos)
+        # Pedimos un 10% extra para cubrir colisiones en una sola ronda
+        num_candidatos = faltan + faltan // 10 + 1
+        bloque = os.urandom(CODIGO_LEN * num_candidatos).translate(_TABLA_ALFABETO).decode("ascii")
+        candidatos = {bloque[i : i + CODIGO_LEN] for i in range(0, len(bloque), CODIGO_LEN)}
+        codigos |= candidatos - existentes
+    return list(codigos)[:cantidad]
 
 
 def upgrade() -> None:
     """Genera códigos únicos para todas las clases existentes sin código."""
     conn = op.get_bind()
 
-    # Obtener clases sin código
-    result = conn.execute(text("SELECT id FROM clase WHERE codigo IS NULL"))
-    clases_sin_codigo = result.fetchall()
-
-    if not clases_sin_codigo:
-        print("✅ No hay clases sin código")
-        return
+    # Recorrer las clases sin código por lotes con un cursor de servidor.
+    # No se precargan los códigos existentes: el índice único ix_clase_codigo
+    # detecta las colisiones (muy raras con 32^6 combinaciones).
+    result = conn.execute(
+        text("SELECT id FROM clase WHERE codigo IS NULL").execution_options(
+            stream_results=True, yield_per=BATCH_SIZE
+        )
+    )
 
-    print(f"🔄 Generando códigos para {len(clases_sin_codigo)} clases...")
+    total = 0
+    for lote in result.partitions(BATCH_SIZE):
+        _actualizar_lote(conn, [clase_row[0] for clase_row in lote])
+        total += len(lote)
+        logger.debug("Lote de %d clases actualizado (%d en total)", len(lote), total)
 
-    # Obtener códigos existentes para evitar duplicados
-    result = conn.execute(text("SELECT codigo FROM clase WHERE codigo IS NOT NULL"))
-    codigos_existentes = {row[0] for row in result.fetchall()}
+    if not total:
+        logger.info("No hay clases sin código")
+        return
 
-    # Generar códigos únicos
-    for clase_row in clases_sin_codigo:
-        clase_id = clase_row[0]
+    logger.info("%d códigos de clase generados", total)
 
-        # Generar código único
-        codigo = generar_codigo_clase()
-        while codigo in codigos_existentes:
-            codigo = generar_codigo_clase()
 
-        # Actualizar clase con código
-        conn.execute(
-            text("UPDATE clase SET codigo = :codigo WHERE id = :id"),
-            {"codigo": codigo, "id": clase_id},
-        )
-        codigos_existentes.add(codigo)
-        print(f"  ✓ Clase {clase_id[:8]}... → {codigo}")
+def _actualizar_lote(conn, ids: list[str]) -> None:
+    """Asigna códigos a un lote de clases con un único executemany.
 
-    print(f"✅ {len(clases_sin_codigo)} códigos generados")
+    Si algún código choca con el índice único se deshace solo el lote
+    (SAVEPOINT) y se reintenta fila a fila regenerando el código en conflicto.
+    """
+    update_stmt = text("UPDATE clase SET codigo = :codigo WHERE id = :id")
+    params = [
+        {"codigo": codigo, "id": clase_id}
+        for clase_id, codigo in zip(ids, generar_codigos_unicos(len(ids)), strict=True)
+    ]
+    try:
+        with conn.begin_nested():
+            conn.execute(update_stmt, params)
+        return
+    except IntegrityError:
+        pass
+
+    for fila in params:
+        while True:
+            try:
+                with conn.begin_nested():
+                    conn.execute(update_stmt, fila)
+                break
+            except IntegrityError:
+                fila["codigo"] = generar_codigos_unicos(1)[0]
 
 
 def downgrade() -> None:
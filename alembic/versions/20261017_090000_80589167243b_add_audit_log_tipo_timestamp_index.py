@@ -0,0 +1,37 @@
+"""add_audit_log_tipo_timestamp_index
+
+Revision ID: 80589167243b
+Revises: 8f807dcaec9c
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "80589167243b"
+down_revision: str | None = "8f807dcaec9c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Índice compuesto para "WHERE tipo = ? ORDER BY timestamp DESC LIMIT N":
+    # un único range scan ordenado en lugar de filtrar por tipo y ordenar.
+    # Sustituye a ix_audit_log_tipo (tipo es su prefijo). ix_audit_log_timestamp
+    # se mantiene para el listado sin filtros.
+    op.create_index(
+        "ix_audit_log_tipo_timestamp",
+        "audit_log",
+        ["tipo", sa.text("timestamp DESC")],
+    )
+    op.drop_index("ix_audit_log_tipo", table_name="audit_log")
+
+
+def downgrade() -> None:
+    op.create_index("ix_audit_log_tipo", "audit_log", ["tipo"])
+    op.drop_index("ix_audit_log_tipo_timestamp", table_name="audit_log")
@@ -0,0 +1,173 @@
+"""uuid_native_id_columns
+
+Revision ID: 3c1f0e9a7d52
+Revises: 80589167243b
+Create Date: 2026-10-17 10:00:00.000000
+
+En PostgreSQL las columnas pasan a ``uuid``. En SQLite el tipo ``Uuid`` guarda
+los ids como 32 caracteres hexadecimales sin guiones, así que se reescriben
+los valores existentes (36 caracteres con guiones); sin esto ninguna búsqueda
+ni join encontraría las filas ya creadas.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f0e9a7d52"
+down_revision: str | None = "80589167243b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Columnas de identificador (PK y FK) que pasan de VARCHAR(36) a UUID nativo
+_UUID_COLUMNS: dict[str, tuple[str, ...]] = {
+    "profesor": ("id",),
+    "clase": ("id", "id_profesor"),
+    "usuario": ("id", "id_clase"),
+    "juego": ("id", "id_usuario"),
+    "punto": ("id",),
+    "actividad": ("id", "id_punto"),
+    "actividad_progreso": ("id", "id_juego", "id_punto", "id_actividad"),
+    "audit_log": ("id", "usuario_id", "profesor_id"),
+    "sesion": ("id",),
+}
+
+# Formatos que acepta el tipo uuid de PostgreSQL (con o sin guiones/llaves)
+_UUID_REGEX = r"^\{?[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}\}?$"
+
+
+def _existing_tables(bind) -> list[str]:
+    """Tablas de _UUID_COLUMNS presentes en la BD (sesion puede no existir)."""
+    inspector = sa.inspect(bind)
+    return [table for table in _UUID_COLUMNS if inspector.has_table(table)]
+
+
+def _drop_foreign_keys(bind, tables: list[str]) -> list[tuple[str, dict]]:
+    """Elimina las FKs entre columnas de identificador y las devuelve para recrearlas.
+
+    PostgreSQL no permite cambiar el tipo de una PK referenciada por una FK de
+    otro tipo, así que todas se quitan antes y se recrean después. Los nombres
+    se leen de la BD: las tablas las creó ``create_all`` con nombres automáticos.
+    """
+    inspector = sa.inspect(bind)
+    dropped = []
+    for table in tables:
+        for fk in inspector.get_foreign_keys(table):
+            if set(fk["constrained_columns"]) <= set(_UUID_COLUMNS[table]):
+                op.drop_constraint(fk["name"], table, type_="foreignkey")
+                dropped.append((table, fk))
+    return dropped
+
+
+def _create_foreign_keys(dropped: list[tuple[str, dict]]) -> None:
+    for table, fk in dropped:
+        op.create_foreign_key(
+            fk["name"],
+            table,
+            fk["referred_table"],
+            fk["constrained_columns"],
+            fk["referred_columns"],
+            **fk.get("options", {}),
+        )
+
+
+def _upgrade_sqlite(bind, tables: list[str]) -> None:
+    """Reescribe los ids de SQLite al formato de ``Uuid`` (hex en minúsculas, sin guiones)."""
+    invalid = []
+    for table in tables:
+        for column in _UUID_COLUMNS[table]:
+            hex_value = f"replace(\"{column}\", '-', '')"
+            count = bind.execute(
+                sa.text(
+                    f'SELECT count(*) FROM "{table}" WHERE "{column}" IS NOT NULL '
+                    f"AND (length({hex_value}) != 32 OR {hex_value} GLOB '*[^0-9a-fA-F]*')"
+                )
+            ).scalar_one()
+            if count:
+                invalid.append(f"{table}.{column} ({count})")
+    if invalid:
+        raise RuntimeError(
+            "Valores que no son UUID, corrígelos antes de migrar: " + ", ".join(invalid)
+        )
+
+    # SQLite solo comprueba las FKs con PRAGMA foreign_keys=ON (Alembic no lo activa):
+    # PKs y FKs se reescriben tabla a tabla dentro de la transacción de la migración
+    for table in tables:
+        for column in _UUID_COLUMNS[table]:
+            hex_value = f"replace(\"{column}\", '-', '')"
+            op.execute(
+                f'UPDATE "{table}" SET "{column}" = lower({hex_value}) '
+                f'WHERE "{column}" IS NOT NULL'
+            )
+
+
+def _downgrade_sqlite(tables: list[str]) -> None:
+    """Vuelve a poner los guiones en los ids de SQLite (formato de 36 caracteres)."""
+    for table in tables:
+        for column in _UUID_COLUMNS[table]:
+            partes = " || '-' || ".join(
+                f'substr("{column}", {inicio}, {longitud})'
+                for inicio, longitud in ((1, 8), (9, 4), (13, 4), (17, 4), (21, 12))
+            )
+            op.execute(f'UPDATE "{table}" SET "{column}" = {partes} WHERE length("{column}") = 32')
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    tables = _existing_tables(bind)
+    if bind.dialect.name == "sqlite":
+        _upgrade_sqlite(bind, tables)
+        return
+    if bind.dialect.name != "postgresql":
+        return
+
+    # Comprobar antes de tocar nada que todos los valores son UUID válidos
+    invalid = []
+    for table in tables:
+        for column in _UUID_COLUMNS[table]:
+            count = bind.execute(
+                sa.text(f'SELECT count(*) FROM "{table}" WHERE "{column}" !~* :pattern'),
+                {"pattern": _UUID_REGEX},
+            ).scalar_one()
+            if count:
+                invalid.append(f"{table}.{column} ({count})")
+    if invalid:
+        raise RuntimeError(
+            "Valores que no son UUID, corrígelos antes de migrar: " + ", ".join(invalid)
+        )
+
+    dropped = _drop_foreign_keys(bind, tables)
+    for table in tables:
+        for column in _UUID_COLUMNS[table]:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.Uuid(),
+                existing_type=sa.String(36),
+                postgresql_using=f'"{column}"::uuid',
+            )
+    _create_foreign_keys(dropped)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    tables = _existing_tables(bind)
+    if bind.dialect.name == "sqlite":
+        _downgrade_sqlite(tables)
+        return
+    if bind.dialect.name != "postgresql":
+        return
+    dropped = _drop_foreign_keys(bind, tables)
+    for table in tables:
+        for column in _UUID_COLUMNS[table]:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.String(36),
+                existing_type=sa.Uuid(),
+                postgresql_using=f'"{column}"::text',
+            )
+    _create_foreign_keys(dropped)
@@ -0,0 +1,54 @@
+"""add_audit_log_filter_indexes
+
+Revision ID: b7d4e2a19f60
+Revises: 3c1f0e9a7d52
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d4e2a19f60"
+down_revision: str | None = "3c1f0e9a7d52"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Filtros de GET /audit-logs con ORDER BY timestamp DESC: cada índice resuelve
+    # su filtro con un único range scan ya ordenado.
+    # Sustituye a ix_audit_log_accion (accion es su prefijo).
+    op.create_index(
+        "ix_audit_log_accion_timestamp",
+        "audit_log",
+        ["accion", sa.text("timestamp DESC")],
+    )
+    op.drop_index("ix_audit_log_accion", table_name="audit_log")
+
+    # Parciales: un log es de usuario o de profesor, no de ambos
+    op.create_index(
+        "ix_audit_log_usuario_timestamp",
+        "audit_log",
+        ["usuario_id", sa.text("timestamp DESC")],
+        postgresql_where=sa.text("usuario_id IS NOT NULL"),
+        sqlite_where=sa.text("usuario_id IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_audit_log_profesor_timestamp",
+        "audit_log",
+        ["profesor_id", sa.text("timestamp DESC")],
+        postgresql_where=sa.text("profesor_id IS NOT NULL"),
+        sqlite_where=sa.text("profesor_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_log_profesor_timestamp", table_name="audit_log")
+    op.drop_index("ix_audit_log_usuario_timestamp", table_name="audit_log")
+    op.create_index("ix_audit_log_accion", "audit_log", ["accion"])
+    op.drop_index("ix_audit_log_accion_timestamp", table_name="audit_log")
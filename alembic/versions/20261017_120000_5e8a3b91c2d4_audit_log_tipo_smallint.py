@@ -0,0 +1,102 @@
+"""audit_log_tipo_smallint
+
+Revision ID: 5e8a3b91c2d4
+Revises: b7d4e2a19f60
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e8a3b91c2d4"
+down_revision: str | None = "b7d4e2a19f60"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Mismos códigos que app.models.audit_log.AuditLogTipo (copiados: una migración
+# no debe cambiar si el modelo cambia después)
+_TIPO_CODIGOS = {"audit_log": 0, "web": 1, "app": 2}
+
+
+def _check_tipos(bind) -> None:
+    """Aborta si hay valores de tipo que no se pueden convertir a su código."""
+    invalid = bind.execute(
+        sa.text("SELECT count(*) FROM audit_log WHERE tipo NOT IN :tipos").bindparams(
+            sa.bindparam("tipos", expanding=True)
+        ),
+        {"tipos": list(_TIPO_CODIGOS)},
+    ).scalar_one()
+    if invalid:
+        raise RuntimeError(f"audit_log tiene {invalid} filas con un tipo desconocido")
+
+
+def _case_to_codigo() -> str:
+    cases = " ".join(f"WHEN '{nombre}' THEN {codigo}" for nombre, codigo in _TIPO_CODIGOS.items())
+    return f"CASE tipo {cases} END"
+
+
+def _case_to_nombre() -> str:
+    cases = " ".join(f"WHEN {codigo} THEN '{nombre}'" for nombre, codigo in _TIPO_CODIGOS.items())
+    return f"CASE tipo {cases} END"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        # Las BDs SQLite existentes también avanzan con Alembic (ver 3c1f0e9a7d52).
+        # Se convierten los valores y luego se recrea la tabla (modo batch) con la
+        # columna SMALLINT: con la afinidad TEXT de VARCHAR los códigos se leerían
+        # como '1'/'2' en lugar de enteros
+        _check_tipos(bind)
+        op.execute(f"UPDATE audit_log SET tipo = {_case_to_codigo()}")
+        with op.batch_alter_table("audit_log") as batch_op:
+            batch_op.alter_column(
+                "tipo",
+                type_=sa.SmallInteger(),
+                existing_type=sa.String(20),
+                existing_nullable=False,
+            )
+        return
+    if bind.dialect.name != "postgresql":
+        return
+
+    _check_tipos(bind)
+    # PostgreSQL reconstruye ix_audit_log_tipo_timestamp con el nuevo tipo
+    op.alter_column(
+        "audit_log",
+        "tipo",
+        type_=sa.SmallInteger(),
+        existing_type=sa.String(20),
+        existing_nullable=False,
+        postgresql_using=_case_to_codigo(),
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        with op.batch_alter_table("audit_log") as batch_op:
+            batch_op.alter_column(
+                "tipo",
+                type_=sa.String(20),
+                existing_type=sa.SmallInteger(),
+                existing_nullable=False,
+            )
+        op.execute(f"UPDATE audit_log SET tipo = {_case_to_nombre()}")
+        return
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.alter_column(
+        "audit_log",
+        "tipo",
+        type_=sa.String(20),
+        existing_type=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=_case_to_nombre(),
+    )
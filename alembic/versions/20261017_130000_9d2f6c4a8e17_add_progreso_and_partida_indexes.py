@@ -0,0 +1,45 @@
+"""add_progreso_and_partida_indexes
+
+Revision ID: 9d2f6c4a8e17
+Revises: 5e8a3b91c2d4
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d2f6c4a8e17"
+down_revision: str | None = "5e8a3b91c2d4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Estadísticas y perfil: partidas de un usuario unidas a sus progresos
+    op.create_index(
+        "ix_juego_usuario_fecha_inicio",
+        "juego",
+        ["id_usuario", "fecha_inicio"],
+        postgresql_include=["id"],
+    )
+    op.create_index(
+        "ix_actividad_progreso_juego_estado", "actividad_progreso", ["id_juego", "estado"]
+    )
+    op.create_index(
+        "ix_actividad_progreso_punto_juego", "actividad_progreso", ["id_punto", "id_juego"]
+    )
+    op.create_index(
+        "ix_actividad_progreso_actividad_juego",
+        "actividad_progreso",
+        ["id_actividad", "id_juego"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_actividad_progreso_actividad_juego", table_name="actividad_progreso")
+    op.drop_index("ix_actividad_progreso_punto_juego", table_name="actividad_progreso")
+    op.drop_index("ix_actividad_progreso_juego_estado", table_name="actividad_progreso")
+    op.drop_index("ix_juego_usuario_fecha_inicio", table_name="juego")
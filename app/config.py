@@ -6,7 +6,9 @@ desde variables de entorno y el archivo .env.
 Autor: Gernibide
 """
 
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -24,6 +26,11 @@ class Settings(BaseSettings):
         PROJECT_NAME: Nombre del proyecto.
         API_KEY: Clave API para autenticación administrativa.
         API_KEY_HEADER: Nombre del header para la API Key.
+        WEB_USE_FLASK: Servir la interfaz web con Flask (True) o con rutas FastAPI.
+        DOCS_ENABLED: Servir la documentación OpenAPI (/docs, /redoc, /openapi.json).
+        LOG_INCOMING_REQUESTS: Emitir también un log DEBUG al recibir cada petición.
+        AUTO_CREATE_SCHEMA: Crear las tablas con ``create_all`` al arrancar (solo desarrollo).
+        CORS_ORIGINS: Orígenes permitidos por CORS en las rutas ``/api`` (``["*"]``: todos).
     """
 
     DATABASE_URL: str
@@ -42,13 +49,46 @@ class Settings(BaseSettings):
     RATE_LIMIT_ENABLED: bool = True
     RATE_LIMIT_PER_MINUTE: int = 10
 
-    class Config:
-        """Configuración de Pydantic Settings."""
+    # Interfaz web: Flask montado vía WSGI (requisito académico) o, con False,
+    # las mismas páginas como rutas FastAPI nativas (app/web/routes.py)
+    WEB_USE_FLASK: bool = True
+
+    # Documentación interactiva (/docs, /redoc, /openapi.json)
+    DOCS_ENABLED: bool = True
+
+    # Logging: log DEBUG adicional al recibir cada petición (además del de respuesta)
+    LOG_INCOMING_REQUESTS: bool = False
+
+    # Esquema de BD: en despliegue lo gestiona ``alembic upgrade head`` (railway.json).
+    # Con True se ejecuta además ``Base.metadata.create_all`` en cada arranque
+    AUTO_CREATE_SCHEMA: bool = False
+
+    # CORS (solo rutas /api). Lista JSON en el entorno, p. ej.
+    # CORS_ORIGINS='["https://gernibide.up.railway.app"]'. Con "*" no se
+    # envían credenciales (cookies), como exige la especificación CORS
+    CORS_ORIGINS: list[str] = ["*"]
 
-        env_file = ".env"
-        # Variables de entorno del sistema tienen prioridad sobre .env
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    # Variables de entorno del sistema tienen prioridad sobre .env.
+    # frozen: la configuración es de solo lectura una vez cargada.
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Devuelve la instancia única de configuración.
+
+    El archivo .env se lee y valida una sola vez por proceso; las
+    llamadas posteriores reutilizan la misma instancia.
+
+    Returns:
+        Settings: Configuración de la aplicación.
+    """
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -6,8 +6,10 @@ y la clase base para los modelos. Soporta tanto SQLite como PostgreSQL.
 Autor: Gernibide
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+import uuid
+
+from sqlalchemy import Dialect, TypeDecorator, Uuid, create_engine, make_url
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.config import settings
 
@@ -23,17 +25,63 @@ if is_sqlite:
         echo=False,
     )
 else:
+    # Opciones de escritura por lotes según el driver de PostgreSQL
+    driver = make_url(settings.DATABASE_URL).get_dialect().driver
+    if driver == "psycopg2":
+        # INSERT multi-fila y UPDATE/DELETE agrupados con execute_batch
+        driver_options = {
+            "executemany_mode": "values_plus_batch",
+            "insertmanyvalues_page_size": 1000,
+            "executemany_batch_page_size": 500,
+        }
+    elif driver == "psycopg":
+        # psycopg 3: reutiliza prepared statements del servidor tras 5 ejecuciones
+        driver_options = {"connect_args": {"prepare_threshold": 5}}
+    else:
+        driver_options = {}
+
     # PostgreSQL: con pool de conexiones optimizado
     engine = create_engine(
         settings.DATABASE_URL,
         pool_pre_ping=True,  # Verifica conexiones antes de usarlas
         pool_size=5,  # Número de conexiones en el pool
         max_overflow=10,  # Conexiones adicionales permitidas
+        pool_recycle=3600,  # Renueva conexiones con más de 1 hora
         echo=False,  # Cambiar a True para debug SQL
+        **driver_options,
     )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
+
+
+class Base(DeclarativeBase):
+    """Clase base declarativa (SQLAlchemy 2.0) para todos los modelos."""
+
+
+class UUIDString(TypeDecorator[str]):
+    """Identificador UUID con almacenamiento nativo, expuesto como ``str``.
+
+    En PostgreSQL es el tipo ``uuid`` (16 bytes, frente a los 36+ de un
+    VARCHAR(36)), lo que reduce a menos de la mitad los índices de PK y FK;
+    en SQLite se guarda como CHAR(32). En Python sigue siendo el str de
+    siempre (``"3f2b...-..."``).
+
+    Un valor que no es un UUID válido lanza ``ValueError`` (SQLAlchemy lo
+    envuelve en ``StatementError``): nunca se guarda como NULL en silencio. Los
+    ids que llegan de fuera se validan antes con ``app.schemas.common.UUIDStr``
+    en los routers y schemas, que responden 422.
+    """
+
+    impl = Uuid
+    cache_ok = True
+
+    def __init__(self):
+        super().__init__(as_uuid=False)
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        return str(uuid.UUID(str(value)))
 
 
 # Dependencia para obtener la sesión de BD
@@ -6,10 +6,14 @@ validando tokens JWT y extrayendo información del usuario actual.
 Autor: Gernibide
 """
 
+import time
+
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jwt.algorithms import HMACAlgorithm, get_default_algorithms
 from jwt.exceptions import InvalidTokenError
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -19,6 +23,99 @@ from app.models.profesor import Profesor
 security = HTTPBearer()
 
 
+class _PreparedKeyHMACAlgorithm(HMACAlgorithm):
+    """HMACAlgorithm que valida y prepara la clave de firma una sola vez.
+
+    PyJWT vuelve a validar la clave (PEM/SSH/DER/JWK) en cada decode; aquí
+    se reutiliza el resultado para la clave de la aplicación.
+    """
+
+    def __init__(self, hash_alg, key: bytes):
+        super().__init__(hash_alg)
+        self._key = key
+        self._prepared_key = super().prepare_key(key)
+
+    def prepare_key(self, key: str | bytes) -> bytes:
+        if key == self._key:
+            return self._prepared_key
+        return super().prepare_key(key)
+
+
+class _PreparedKeyJWT(jwt.PyJWT):
+    """PyJWT cuyo algoritmo HMAC configurado reutiliza la clave preparada."""
+
+    def __init__(self, key: bytes, algorithm: str):
+        super().__init__()
+        default_algorithm = get_default_algorithms().get(algorithm)
+        if isinstance(default_algorithm, HMACAlgorithm):
+            self._jws.unregister_algorithm(algorithm)
+            self._jws.register_algorithm(
+                algorithm, _PreparedKeyHMACAlgorithm(default_algorithm.hash_alg, key)
+            )
+
+
+# Decodificador JWT y clave preparados una sola vez para todo el proceso
+_JWT_KEY = settings.SECRET_KEY.encode("utf-8")
+_JWT_ALGORITHMS = [settings.ALGORITHM]
+_JWT = _PreparedKeyJWT(_JWT_KEY, settings.ALGORITHM)
+
+# Cache en memoria de profesores autenticados: username -> (expires_at, datos)
+PROFESOR_CACHE_TTL = 60
+PROFESOR_CACHE_MAX_SIZE = 1024
+_profesor_cache: dict[str, tuple[float, dict]] = {}
+
+
+def invalidate_profesor_cache(username: str | None = None) -> None:
+    """Invalida la cache de profesores autenticados.
+
+    Debe llamarse cuando un profesor se actualiza o se elimina para que
+    el siguiente request vuelva a consultar la base de datos.
+
+    Args:
+        username: Username a invalidar. Si es None, se vacía toda la cache.
+    """
+    if username is None:
+        _profesor_cache.clear()
+    else:
+        _profesor_cache.pop(username, None)
+
+
+def _get_profesor_data(db: Session, username: str) -> dict | None:
+    """Obtiene los datos del profesor desde la cache o la base de datos.
+
+    Args:
+        db: Database session
+        username: Username del profesor
+
+    Returns:
+        Copia del diccionario con los datos del profesor (el caller puede
+        modificarla sin alterar la cache), o None si no existe
+    """
+    now = time.time()
+    entry = _profesor_cache.get(username)
+    if entry is not None and entry[0] > now:
+        return dict(entry[1])
+
+    # Solo las columnas necesarias, sin hidratar el modelo ORM
+    row = db.execute(
+        select(Profesor.id, Profesor.nombre, Profesor.apellido).where(Profesor.username == username)
+    ).first()
+    if row is None:
+        return None
+
+    data = {
+        "username": username,
+        "type": "profesor",
+        "profesor_id": row.id,
+        "nombre": row.nombre,
+        "apellido": row.apellido,
+    }
+    if len(_profesor_cache) >= PROFESOR_CACHE_MAX_SIZE:
+        _profesor_cache.clear()
+    _profesor_cache[username] = (now + PROFESOR_CACHE_TTL, data)
+    return dict(data)
+
+
 def get_current_user_from_token(
     credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)
 ) -> dict:
@@ -47,7 +144,7 @@ def get_current_user_from_token(
     try:
         token = credentials.credentials
         # Decode JWT token
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _JWT.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
 
         username: str = payload.get("sub")
         user_type: str = payload.get("type")  # "profesor" or None for usuario
@@ -55,19 +152,13 @@ def get_current_user_from_token(
         if username is None:
             raise credentials_exception
 
-        # If it's a profesor, get profesor data
+        # If it's a profesor, get profesor data (cached for PROFESOR_CACHE_TTL seconds)
         if user_type == "profesor":
-            profesor = db.query(Profesor).filter(Profesor.username == username).first()
-            if not profesor:
+            profesor_data = _get_profesor_data(db, username)
+            if profesor_data is None:
                 raise credentials_exception
 
-            return {
-                "username": username,
-                "type": "profesor",
-                "profesor_id": profesor.id,
-                "nombre": profesor.nombre,
-                "apellido": profesor.apellido,
-            }
+            return profesor_data
 
         # For regular usuarios (not yet implemented, but structure ready)
         return {"username": username, "type": "usuario"}
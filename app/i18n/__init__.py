@@ -7,6 +7,11 @@ Autor: Gernibide
 """
 
 from app.i18n.helpers import get_language_from_request, get_translator
-from app.i18n.loader import load_translations
+from app.i18n.loader import load_flat_translations, load_translations
 
-__all__ = ["get_translator", "get_language_from_request", "load_translations"]
+__all__ = [
+    "get_translator",
+    "get_language_from_request",
+    "load_translations",
+    "load_flat_translations",
+]
@@ -7,14 +7,20 @@ Autor: Gernibide
 """
 
 import contextlib
+import re
 from collections.abc import Callable
 
 from fastapi import Request
 
-from app.i18n.loader import get_nested_value, load_translations
+from app.i18n.loader import (
+    DEFAULT_LANGUAGE,
+    SUPPORTED_LANGUAGES,
+    load_flat_translations,
+)
 
-SUPPORTED_LANGUAGES = ["es", "eu"]
-DEFAULT_LANGUAGE = "es"
+_SUPPORTED_SET = frozenset(SUPPORTED_LANGUAGES)
+# Subetiqueta primaria de cada entrada de Accept-Language ("eu-ES;q=0.9" -> "eu")
+_ACCEPT_LANGUAGE_RE = re.compile(r"(?:^|,)\s*([a-z]+)")
 
 
 def get_language_from_request(request: Request) -> str:
@@ -34,19 +40,19 @@ def get_language_from_request(request: Request) -> str:
     """
     # Priority 1: Cookie
     lang = request.cookies.get("language")
-    if lang and lang in SUPPORTED_LANGUAGES:
+    if lang in _SUPPORTED_SET:
         return lang
 
     # Priority 2: Query param
     lang = request.query_params.get("lang")
-    if lang and lang in SUPPORTED_LANGUAGES:
+    if lang in _SUPPORTED_SET:
         return lang
 
-    # Priority 3: Accept-Language header
-    accept_lang = request.headers.get("Accept-Language", "")
-    for supported in SUPPORTED_LANGUAGES:
-        if supported in accept_lang:
-            return supported
+    # Priority 3: Accept-Language header (first supported tag in header order)
+    accept_lang = request.headers.get("Accept-Language", "").lower()
+    for tag in _ACCEPT_LANGUAGE_RE.findall(accept_lang):
+        if tag in _SUPPORTED_SET:
+            return tag
 
     # Priority 4: Default
     return DEFAULT_LANGUAGE
@@ -69,7 +75,7 @@ def get_translator(request: Request) -> tuple[Callable[[str], str], str]:
         'Inicio'  # or 'Hasiera' if language is 'eu'
     """
     lang = get_language_from_request(request)
-    translations = load_translations(lang)
+    translations = load_flat_translations(lang)
 
     def translate(key: str, **kwargs) -> str:
         """Translate key with optional format arguments.
@@ -81,7 +87,7 @@ def get_translator(request: Request) -> tuple[Callable[[str], str], str]:
         Returns:
             Translated string with format args applied.
         """
-        value = get_nested_value(translations, key, default=key)
+        value = translations.get(key, key)
         if kwargs:
             # If formatting fails, return unformatted value
             with contextlib.suppress(KeyError, ValueError):
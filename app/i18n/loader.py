@@ -1,44 +1,118 @@
 """Loader de traducciones con caché en memoria.
 
-Este módulo carga archivos JSON de traducciones y los mantiene
-en caché para mejorar el rendimiento.
+Este módulo carga los archivos JSON de traducciones de todos los
+idiomas soportados una sola vez al importarse y los mantiene en caché.
 
 Autor: Gernibide
 """
 
 import json
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-_translations_cache: dict[str, dict[str, Any]] = {}
+I18N_DIR = Path(__file__).parent
+SUPPORTED_LANGUAGES = ["es", "eu"]
+DEFAULT_LANGUAGE = "es"
 
 
-def load_translations(lang: str) -> dict[str, Any]:
-    """Load translations from JSON file with caching.
+def _read_translations(lang: str) -> dict[str, Any]:
+    """Read the JSON translation file for a language.
 
     Args:
         lang: Language code (e.g., 'es', 'eu').
 
     Returns:
-        Dictionary with all translations for the specified language.
-        Falls back to Spanish if language file not found.
+        Dictionary with all translations for the language.
     """
-    if lang in _translations_cache:
-        return _translations_cache[lang]
+    with open(I18N_DIR / f"{lang}.json", encoding="utf-8") as f:
+        return json.load(f)
 
-    file_path = Path(__file__).parent / f"{lang}.json"
-    if not file_path.exists():
-        # Fallback to Spanish if lang not found
-        file_path = Path(__file__).parent / "es.json"
 
-    with open(file_path, encoding="utf-8") as f:
-        translations = json.load(f)
+def flatten_translations(data: dict[str, Any], prefix: str = "") -> dict[str, str]:
+    """Flatten nested translations into a single-level dict keyed by dot path.
+
+    Args:
+        data: Nested translations dictionary.
+        prefix: Key prefix used while recursing.
+
+    Returns:
+        Dictionary mapping dot-separated keys to their string values.
+
+    Example:
+        >>> flatten_translations({'common': {'nav': {'home': 'Inicio'}}})
+        {'common.nav.home': 'Inicio'}
+    """
+    flat: dict[str, str] = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_translations(value, f"{path}."))
+        else:
+            flat[path] = value
+    return flat
+
+
+def _freeze(data: dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a nested dict (recursively) in read-only MappingProxyType views.
+
+    Args:
+        data: Dictionary to freeze.
+
+    Returns:
+        Read-only mapping with the same content.
+    """
+    return MappingProxyType(
+        {key: _freeze(value) if isinstance(value, dict) else value for key, value in data.items()}
+    )
+
+
+# Precargadas al importar y de solo lectura: no hay lecturas de disco ni
+# escrituras en el camino del request, por lo que no hace falta ningún lock
+_raw_translations = {lang: _read_translations(lang) for lang in SUPPORTED_LANGUAGES}
+_translations_cache: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {lang: _freeze(translations) for lang, translations in _raw_translations.items()}
+)
+_flat_translations_cache: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        lang: MappingProxyType(flatten_translations(translations))
+        for lang, translations in _raw_translations.items()
+    }
+)
+del _raw_translations
 
-    _translations_cache[lang] = translations
-    return translations
 
+def load_translations(lang: str) -> Mapping[str, Any]:
+    """Return the preloaded translations for a language.
 
-def get_nested_value(data: dict, key: str, default: str = "") -> str:
+    Args:
+        lang: Language code (e.g., 'es', 'eu').
+
+    Returns:
+        Read-only mapping with all translations for the specified language.
+        Falls back to Spanish if language is not supported.
+    """
+    return _translations_cache.get(lang) or _translations_cache[DEFAULT_LANGUAGE]
+
+
+def load_flat_translations(lang: str) -> Mapping[str, str]:
+    """Return the preloaded translations for a language keyed by dot path.
+
+    A translation lookup is a single ``dict.get`` on this mapping, with no
+    key splitting or nested traversal.
+
+    Args:
+        lang: Language code (e.g., 'es', 'eu').
+
+    Returns:
+        Flat read-only mapping with all translations for the specified language.
+        Falls back to Spanish if language is not supported.
+    """
+    return _flat_translations_cache.get(lang) or _flat_translations_cache[DEFAULT_LANGUAGE]
+
+
+def get_nested_value(data: Mapping, key: str, default: str = "") -> str:
     """Get value from nested dict using dot notation.
 
     Args:
@@ -56,7 +130,7 @@ def get_nested_value(data: dict, key: str, default: str = "") -> str:
     keys = key.split(".")
     value = data
     for k in keys:
-        if isinstance(value, dict):
+        if isinstance(value, Mapping):
             value = value.get(k)
         else:
             return default
@@ -19,6 +19,8 @@ from .logger import (
     log_with_context,
     logger,
     setup_logging,
+    start_log_listener,
+    stop_log_listener,
 )
 from .middleware import LoggingMiddleware
 
@@ -26,6 +28,8 @@ __all__ = [
     "logger",
     "log_with_context",
     "setup_logging",
+    "start_log_listener",
+    "stop_log_listener",
     "log_debug",
     "log_info",
     "log_warning",
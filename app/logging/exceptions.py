@@ -16,6 +16,20 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from .logger import log_with_context, logger
 
+# Headers que se incluyen en los logs de error (en lugar de copiar todos)
+LOGGED_HEADERS = ("user-agent", "referer", "x-request-id", "x-forwarded-for")
+
+# Bytes del body que se incluyen en el log de errores de validación
+BODY_PREVIEW_BYTES = 200
+
+
+def _headers_for_log(request: Request) -> dict[str, str]:
+    """
+    Extrae solo los headers relevantes para diagnóstico de la petición
+    """
+    headers = request.headers
+    return {name: headers[name] for name in LOGGED_HEADERS if name in headers}
+
 
 async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
     """
@@ -31,13 +45,14 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
 
     log_with_context(
         log_level,
-        f"HTTP Exception: {exc.status_code}",
+        "HTTP Exception: %d",
+        exc.status_code,
         status_code=exc.status_code,
         detail=exc.detail,
         path=str(request.url.path),
         method=request.method,
         client_ip=request.client.host if request.client else "unknown",
-        headers=dict(request.headers) if log_level == "error" else None,
+        headers=_headers_for_log(request) if log_level == "error" else None,
     )
 
     return JSONResponse(
@@ -73,12 +88,10 @@ async def validation_exception_handler(
             error_detail["input_received"] = str(error["input"])[:100]  # Limitar longitud
         errors.append(error_detail)
 
-    # Intentar obtener el body para logging
-    try:
-        body = await request.body()
-        body_preview = body.decode("utf-8")[:200] if body else "empty"
-    except Exception:
-        body_preview = "unable_to_read"
+    # Usar solo el body que Starlette ya haya leído: nunca forzar una lectura
+    # completa del request dentro del handler (payloads grandes)
+    body = getattr(request, "_body", b"")
+    body_preview = body[:BODY_PREVIEW_BYTES].decode("utf-8", errors="replace") if body else "empty"
 
     log_with_context(
         "warning",
@@ -124,7 +137,8 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -
         status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
 
     logger.error(
-        f"Error de base de datos: {error_type}",
+        "Error de base de datos: %s",
+        error_type,
         exc_info=True,
         extra={
             "extra_fields": {
@@ -154,7 +168,8 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
     """
     # Log completo del error con traceback
     logger.critical(
-        f"Excepción no controlada: {type(exc).__name__}",
+        "Excepción no controlada: %s",
+        type(exc).__name__,
         exc_info=True,
         extra={
             "extra_fields": {
@@ -164,7 +179,7 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
                 "error_type": type(exc).__name__,
                 "error_message": str(exc),
                 "traceback": traceback.format_exc(),
-                "request_headers": dict(request.headers),
+                "request_headers": _headers_for_log(request),
             }
         },
     )
@@ -189,10 +204,6 @@ def register_exception_handlers(app):
     Args:
         app: Instancia de FastAPI
     """
-    from fastapi.exceptions import RequestValidationError
-    from sqlalchemy.exc import SQLAlchemyError
-    from starlette.exceptions import HTTPException as StarletteHTTPException
-
     app.add_exception_handler(StarletteHTTPException, http_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
     app.add_exception_handler(SQLAlchemyError, sqlalchemy_exception_handler)
@@ -6,12 +6,30 @@ formateadores personalizados para logs estructurados y legibles.
 Autor: Gernibide
 """
 
+import atexit
+import io
 import logging
+import os
+import queue
 import sys
-from datetime import UTC, datetime
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+# Tamaño del buffer de escritura de los archivos de log
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Intervalo máximo (segundos) que un log puede quedar en buffer sin escribirse
+LOG_FLUSH_INTERVAL = 0.2
+
+# Railway (u otro entorno de producción) define alguna de estas variables.
+# Se evalúa una vez al importar: en producción solo se registra en consola
+IS_PRODUCTION = os.getenv("RAILWAY_ENVIRONMENT") is not None or os.getenv("PORT") is not None
+
+# Hilo que escribe los logs en consola/archivos (ver setup_logging)
+_listener: QueueListener | None = None
+
 
 class StructuredFormatter(logging.Formatter):
     """
@@ -19,24 +37,44 @@ class StructuredFormatter(logging.Formatter):
     Facilita el análisis de logs sin necesidad de JSON
     """
 
-    def format(self, record: logging.LogRecord) -> str:
-        # Formato base del log
-        timestamp = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-        base = f"[{timestamp}] [{record.levelname:8}] [{record.module}:{record.lineno}] - {record.getMessage()}"
+    # Timestamps siempre en UTC (también en formatTime/asctime si se usaran)
+    converter = time.gmtime
 
-        # Añadir campos extra si existen
-        if hasattr(record, "extra_fields") and record.extra_fields:
-            extras = []
-            for key, value in record.extra_fields.items():
-                extras.append(f"{key}={value}")
-            if extras:
-                base += " | " + " | ".join(extras)
+    # Último segundo formateado: (segundo epoch, "YYYY-MM-DDTHH:MM:SS")
+    _ts_cache: tuple[int, str] = (0, "")
 
-        # Añadir información de excepción si existe
-        if record.exc_info:
-            base += "\n" + self.formatException(record.exc_info)
+    def _second_prefix(self, sec: int) -> str:
+        """Parte "YYYY-MM-DDTHH:MM:SS" (UTC) del timestamp, formateada una vez por segundo."""
+        cached_sec, prefix = self._ts_cache
+        if sec != cached_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", self.converter(sec))
+            self._ts_cache = (sec, prefix)
+        return prefix
 
-        return base
+    def format(self, record: logging.LogRecord) -> str:
+        # La línea se compone en un único f-string: sin strings intermedios para
+        # el timestamp ni concatenaciones sucesivas de extras/traceback
+        created = record.created
+        sec = int(created)
+
+        # Campos extra si existen, en un solo join
+        extra_fields = getattr(record, "extra_fields", None)
+        extras = (
+            "".join([f" | {key}={value}" for key, value in extra_fields.items()])
+            if extra_fields
+            else ""
+        )
+
+        # Información de excepción si existe (cacheada en exc_text como en logging.Formatter)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        exc_text = f"\n{record.exc_text}" if record.exc_info else ""
+
+        return (
+            f"[{self._second_prefix(sec)}.{int((created - sec) * 1e6):06d}Z]"
+            f" [{record.levelname:8}] [{record.module}:{record.lineno}]"
+            f" - {record.getMessage()}{extras}{exc_text}"
+        )
 
 
 class SimpleFormatter(logging.Formatter):
@@ -66,28 +104,219 @@ class SimpleFormatter(logging.Formatter):
         "CRITICAL": "[!!]",
     }
 
-    def format(self, record: logging.LogRecord) -> str:
-        # Obtener emoji
-        icon = self.ICONS.get(record.levelname, "•")
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Prefijos ya compuestos por nivel: (antes del timestamp, después del timestamp)
+        self._level_prefix = {
+            level: (
+                f"{self.ICONS[level]} {self.DIM}",
+                f"{self.RESET} {color}{self.BOLD}{level:8}{self.RESET} {self.DIM}",
+            )
+            for level, color in self.COLORS.items()
+        }
+        # Último segundo formateado: (segundo epoch, "HH:MM:SS")
+        self._ts_cache: tuple[int, str] = (0, "")
+
+    def _timestamp(self, created: float) -> str:
+        """Hora local compacta del registro, formateando cada segundo una sola vez."""
+        sec = int(created)
+        cached_sec, timestamp = self._ts_cache
+        if sec != cached_sec:
+            timestamp = time.strftime("%H:%M:%S", self.converter(sec))
+            self._ts_cache = (sec, timestamp)
+        return timestamp
 
-        # Añadir color al nivel de log
+    def format(self, record: logging.LogRecord) -> str:
         levelname = record.levelname
-        if levelname in self.COLORS:
-            colored_level = f"{self.COLORS[levelname]}{self.BOLD}{levelname:8}{self.RESET}"
-        else:
-            colored_level = f"{levelname:8}"
+        prefix = self._level_prefix.get(levelname)
+        if prefix is None:
+            # Nivel personalizado: sin color
+            prefix = (f"• {self.DIM}", f"{self.RESET} {levelname:8} {self.DIM}")
+        before_ts, after_ts = prefix
+
+        # Formato final bonito: [D] 14:23:45 INFO     auth:42 → Usuario autenticado
+        return (
+            f"{before_ts}{self._timestamp(record.created)}{after_ts}"
+            f"{record.module}:{record.lineno}{self.RESET} → {record.getMessage()}"
+        )
+
 
-        # Timestamp con formato más compacto
-        timestamp = self.formatTime(record, "%H:%M:%S")
+class _InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler para una cola en el mismo proceso
+    No formatea en el hilo que loguea: los handlers del listener lo hacen
+    """
 
-        # Módulo y línea en gris tenue
-        location = f"{self.DIM}{record.module}:{record.lineno}{self.RESET}"
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Ni el mensaje (msg % args) ni exc_info se resuelven aquí: lo hace el
+        # formateador en el hilo del listener. La app solo pasa como args valores
+        # inmutables (str, números), que no cambian entre el encolado y el formateo
+        return record
 
-        # Mensaje
-        message = record.getMessage()
 
-        # Formato final bonito: [D] 14:23:45 INFO     auth:42 → Usuario autenticado
-        return f"{icon} {self.DIM}{timestamp}{self.RESET} {colored_level} {location} → {message}"
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler que escribe a través de un buffer de LOG_BUFFER_SIZE
+    Solo vuelca a disco en registros ERROR o superiores; el resto lo vuelca
+    periódicamente el listener (ver _FlushingQueueListener)
+    Al rotar, el desplazamiento de backups (.1 → .2 ...) se hace en otro hilo
+    """
+
+    # Hilo que está desplazando los backups de la última rotación (si lo hay)
+    _rotation_thread: threading.Thread | None = None
+
+    def _open(self):
+        # El handler es dueño del stream y lo cierra en close()/doRollover()
+        raw = open(self.baseFilename, self.mode + "b", buffering=0)  # noqa: SIM115
+        # Tamaño actual del archivo, para decidir la rotación sin hacer seek/tell
+        self._stream_size = os.fstat(raw.fileno()).st_size
+        return io.TextIOWrapper(
+            io.BufferedWriter(raw, buffer_size=LOG_BUFFER_SIZE),
+            encoding=self.encoding,
+            errors=self.errors,
+            write_through=False,
+        )
+
+    def write_line(self, line: str, levelno: int) -> None:
+        """Escribe una línea ya formateada, rotando el archivo si hace falta."""
+        if self.stream is None:
+            self.stream = self._open()
+        # Tamaño aproximado (en caracteres) para no codificar dos veces
+        if self.maxBytes > 0 and self._stream_size + len(line) >= self.maxBytes:
+            self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+        self.stream.write(line)
+        self._stream_size += len(line)
+        if levelno >= logging.ERROR:
+            self.stream.flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.write_line(self.format(record) + self.terminator, record.levelno)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:  # noqa: N802 - método de RotatingFileHandler
+        """
+        Rota el archivo sin bloquear la escritura durante los renombrados
+        Aquí solo se aparta el archivo actual (un rename) y se abre uno nuevo;
+        el resto de renombrados de backups los hace un hilo en segundo plano
+        """
+        self._wait_rotation()
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if self.backupCount > 0 and os.path.exists(self.baseFilename):
+            pending = f"{self.baseFilename}.rotating"
+            os.replace(self.baseFilename, pending)
+            self._rotation_thread = threading.Thread(
+                target=self._shift_backups, args=(pending,), name="log-rotation"
+            )
+            self._rotation_thread.start()
+        if not self.delay:
+            self.stream = self._open()
+
+    def _shift_backups(self, pending: str) -> None:
+        """Desplaza app.log.N-1 → app.log.N ... y deja el archivo apartado como app.log.1."""
+        for i in range(self.backupCount - 1, 0, -1):
+            sfn = self.rotation_filename(f"{self.baseFilename}.{i}")
+            dfn = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+            if os.path.exists(sfn):
+                if os.path.exists(dfn):
+                    os.remove(dfn)
+                os.rename(sfn, dfn)
+        dfn = self.rotation_filename(f"{self.baseFilename}.1")
+        if os.path.exists(dfn):
+            os.remove(dfn)
+        self.rotate(pending, dfn)
+
+    def _wait_rotation(self) -> None:
+        """Espera a que termine la rotación en segundo plano anterior."""
+        if self._rotation_thread is not None:
+            self._rotation_thread.join()
+            self._rotation_thread = None
+
+    def close(self) -> None:
+        self._wait_rotation()
+        super().close()
+
+
+class MultiFileHandler(logging.Handler):
+    """
+    Handler único para varios archivos de log con distinto nivel mínimo
+    Formatea cada registro una sola vez y escribe la misma línea en cada
+    archivo cuyo nivel lo admite (p. ej. un ERROR va a app, debug y error.log)
+    """
+
+    def __init__(self, targets: list[BufferedRotatingFileHandler]):
+        super().__init__(min(target.level for target in targets))
+        self.targets = targets
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record) + "\n"
+            for target in self.targets:
+                if record.levelno >= target.level:
+                    target.write_line(line, record.levelno)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        for target in self.targets:
+            target.flush()
+
+    def close(self) -> None:
+        for target in self.targets:
+            target.close()
+        super().close()
+
+
+class _FlushingQueueListener(QueueListener):
+    """
+    QueueListener que vuelca los handlers cada LOG_FLUSH_INTERVAL segundos
+    Reutiliza su propio hilo: espera en la cola como mucho hasta el próximo volcado
+    """
+
+    def __init__(self, log_queue, *handlers, respect_handler_level: bool = False):
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self._next_flush = time.monotonic() + LOG_FLUSH_INTERVAL
+
+    def _flush_handlers(self) -> None:
+        for handler in self.handlers:
+            handler.flush()
+        self._next_flush = time.monotonic() + LOG_FLUSH_INTERVAL
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            timeout = self._next_flush - time.monotonic()
+            if timeout <= 0:
+                self._flush_handlers()
+                continue
+            try:
+                return self.queue.get(block, timeout)
+            except queue.Empty:
+                self._flush_handlers()
+
+    def stop(self) -> None:
+        super().stop()
+        self._flush_handlers()
+
+
+def start_log_listener() -> None:
+    """Arranca el hilo de escritura de logs si está parado."""
+    if _listener is not None and _listener._thread is None:
+        _listener.start()
+
+
+def stop_log_listener() -> None:
+    """Vacía la cola de logs pendientes y detiene el hilo de escritura."""
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
 
 
 def setup_logging(
@@ -111,20 +340,25 @@ def setup_logging(
         max_bytes: Tamaño máximo de cada archivo de log antes de rotar
         backup_count: Número de archivos de respaldo a mantener
 
+    Los handlers reales (consola y archivos) los gestiona un QueueListener en
+    un hilo propio; el logger solo tiene un QueueHandler, así que cada llamada
+    de log en el camino del request es un simple encolado. Los archivos se
+    escriben con buffer y se vuelcan cada LOG_FLUSH_INTERVAL segundos (o al
+    momento en registros ERROR).
+
     Returns:
         Logger configurado
     """
-    import os
-
-    # Detectar si estamos en Railway o entorno de producción
-    is_production = os.getenv("RAILWAY_ENVIRONMENT") is not None or os.getenv("PORT") is not None
+    global _listener
 
     # Obtener o crear el logger principal
     logger = logging.getLogger(app_name)
-    logger.setLevel(logging.DEBUG)  # Nivel más bajo para capturar todo
 
     # Limpiar handlers existentes para evitar duplicados
     logger.handlers.clear()
+    stop_log_listener()
+    handlers: list[logging.Handler] = []
+    file_handlers_error = None
 
     # ====================================
     # Handler 1: Consola (salida estándar)
@@ -133,10 +367,10 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, console_level.upper()))
     console_handler.setFormatter(SimpleFormatter())
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # Solo añadir file handlers en desarrollo local
-    if not is_production:
+    if not IS_PRODUCTION:
         try:
             # Crear directorio de logs si no existe
             log_path = Path(log_dir)
@@ -146,60 +380,78 @@ def setup_logging(
             # Handler 2: Archivo principal (app.log)
             # ====================================
             app_log_file = log_path / "app.log"
-            app_file_handler = RotatingFileHandler(
+            app_file_handler = BufferedRotatingFileHandler(
                 app_log_file,
                 maxBytes=max_bytes,
                 backupCount=backup_count,
                 encoding="utf-8",
             )
             app_file_handler.setLevel(getattr(logging, file_level.upper()))
-            app_file_handler.setFormatter(StructuredFormatter())
-            logger.addHandler(app_file_handler)
 
             # ====================================
             # Handler 3: Archivo de debug (debug.log)
             # ====================================
             debug_log_file = log_path / "debug.log"
-            debug_file_handler = RotatingFileHandler(
+            debug_file_handler = BufferedRotatingFileHandler(
                 debug_log_file,
                 maxBytes=max_bytes,
                 backupCount=backup_count,
                 encoding="utf-8",
             )
             debug_file_handler.setLevel(getattr(logging, debug_level.upper()))
-            debug_file_handler.setFormatter(StructuredFormatter())
-            logger.addHandler(debug_file_handler)
 
             # ====================================
             # Handler 4: Archivo de errores (error.log)
             # ====================================
             error_log_file = log_path / "error.log"
-            error_file_handler = RotatingFileHandler(
+            error_file_handler = BufferedRotatingFileHandler(
                 error_log_file,
                 maxBytes=max_bytes,
                 backupCount=backup_count,
                 encoding="utf-8",
             )
             error_file_handler.setLevel(logging.ERROR)
-            error_file_handler.setFormatter(StructuredFormatter())
-            logger.addHandler(error_file_handler)
-
-            logger.info(
-                "Sistema de logging inicializado (desarrollo)",
-                extra={
-                    "extra_fields": {
-                        "log_dir": str(log_path),
-                        "max_file_size": f"{max_bytes / 1024 / 1024}MB",
-                        "backup_count": backup_count,
-                    }
-                },
+
+            # Un solo handler formatea cada registro y lo reparte a los tres archivos
+            file_handler = MultiFileHandler(
+                [app_file_handler, debug_file_handler, error_file_handler]
             )
+            file_handler.setFormatter(StructuredFormatter())
+            handlers.append(file_handler)
         except Exception as e:
             # Si falla la creación de archivos, solo usar consola
-            logger.warning(f"No se pudieron crear archivos de log: {e}. Usando solo consola.")
-    else:
+            file_handlers_error = e
+
+    # ====================================
+    # El logger solo encola; el listener escribe en los handlers
+    # ====================================
+    # El nivel del logger es el más bajo de sus handlers: así isEnabledFor
+    # descarta en origen lo que ningún handler va a escribir (p. ej. DEBUG en producción)
+    logger.setLevel(min(handler.level for handler in handlers))
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_InProcessQueueHandler(log_queue))
+    _listener = _FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    if IS_PRODUCTION:
         # En producción (Railway), solo consola
         logger.info("Sistema de logging inicializado (producción - solo consola)")
+    elif file_handlers_error is not None:
+        logger.warning(
+            "No se pudieron crear archivos de log: %s. Usando solo consola.", file_handlers_error
+        )
+    else:
+        logger.info(
+            "Sistema de logging inicializado (desarrollo)",
+            extra={
+                "extra_fields": {
+                    "log_dir": log_dir,
+                    "max_file_size": f"{max_bytes / 1024 / 1024}MB",
+                    "backup_count": backup_count,
+                }
+            },
+        )
 
     # Evitar que los logs se propaguen al logger raíz
     logger.propagate = False
@@ -210,21 +462,70 @@ def setup_logging(
 # Crear una instancia global del logger para usar en toda la aplicación
 logger = setup_logging()
 
+# Escribir los logs pendientes al salir aunque no se llame al shutdown de la app
+atexit.register(stop_log_listener)
+
+# Niveles de log por nombre, resueltos una sola vez
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
 
-def log_with_context(level: str, message: str, **context):
+
+class ContextLogRecord(logging.LogRecord):
+    """
+    LogRecord con los campos de contexto en un slot
+    Evita el paso por extra={...} (un dict extra y su copia en __dict__ por log)
+    """
+
+    __slots__ = ("extra_fields",)
+
+
+def _find_caller() -> tuple[str, int, str]:
+    """Archivo, línea y función del primer frame fuera de este módulo."""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    if frame is None:
+        return "(unknown file)", 0, "(unknown function)"
+    return frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name
+
+
+def _emit(levelno: int, message: str, args: tuple, fields: dict, exc_info: bool = False) -> None:
+    """Crea el registro con los campos de contexto y lo pasa a los handlers.
+
+    El mensaje es una plantilla %-style; ``message % args`` solo se evalúa al
+    formatear el registro en el hilo del listener.
+    """
+    fn, lno, func = _find_caller()
+    record = ContextLogRecord(
+        logger.name, levelno, fn, lno, message, args, sys.exc_info() if exc_info else None, func
+    )
+    record.extra_fields = fields
+    logger.handle(record)
+
+
+def log_with_context(level: str, message: str, *args, **context):
     """
     Función helper para hacer logs con contexto adicional
 
     Args:
         level: Nivel del log (debug, info, warning, error, critical)
-        message: Mensaje del log
+        message: Mensaje del log (admite plantilla %-style con *args)
+        *args: Argumentos de la plantilla; se formatean solo si el log se emite
         **context: Campos adicionales para añadir al log
 
     Ejemplo:
         log_with_context("info", "Usuario autenticado", user_id=123, ip="192.168.1.1")
+        log_with_context("info", "%s %s - %d", method, path, status_code, path=path)
     """
-    log_method = getattr(logger, level.lower())
-    log_method(message, extra={"extra_fields": context})
+    # Los llamadores usan minúsculas: lower() solo si el nombre no está tal cual
+    levelno = _LEVELS.get(level) or _LEVELS[level.lower()]
+    if logger.isEnabledFor(levelno):
+        _emit(levelno, message, args, context)
 
 
 def log_debug(message: str, **context):
@@ -244,51 +545,61 @@ def log_warning(message: str, **context):
 
 def log_error(message: str, exc_info: bool = False, **context):
     """Log de nivel ERROR con contexto y opcionalmente traceback"""
-    if exc_info:
-        logger.error(message, exc_info=True, extra={"extra_fields": context})
-    else:
-        log_with_context("error", message, **context)
+    if logger.isEnabledFor(logging.ERROR):
+        _emit(logging.ERROR, message, (), context, exc_info)
 
 
 def log_critical(message: str, exc_info: bool = True, **context):
     """Log de nivel CRITICAL con contexto y traceback"""
-    logger.critical(message, exc_info=exc_info, extra={"extra_fields": context})
+    if logger.isEnabledFor(logging.CRITICAL):
+        _emit(logging.CRITICAL, message, (), context, exc_info)
 
 
 def log_request(method: str, path: str, status_code: int, duration_ms: float, **extra):
     """Log específico para peticiones HTTP"""
-    level = "error" if status_code >= 500 else "warning" if status_code >= 400 else "info"
-    log_with_context(
-        level,
-        f"{method} {path} - {status_code} ({duration_ms}ms)",
-        http_method=method,
-        path=path,
-        status_code=status_code,
-        duration_ms=duration_ms,
-        **extra,
+    if status_code >= 500:
+        levelno = logging.ERROR
+    elif status_code >= 400:
+        levelno = logging.WARNING
+    else:
+        levelno = logging.INFO
+    if not logger.isEnabledFor(levelno):
+        return
+    _emit(
+        levelno,
+        "%s %s - %s (%sms)",
+        (method, path, status_code, duration_ms),
+        {
+            "http_method": method,
+            "path": path,
+            "status_code": status_code,
+            "duration_ms": duration_ms,
+            **extra,
+        },
     )
 
 
 def log_db_operation(operation: str, table: str, record_id: str = None, **extra):
     """Log específico para operaciones de base de datos"""
-    log_with_context(
-        "debug",
-        f"DB {operation}: {table}" + (f" (id={record_id})" if record_id else ""),
-        db_operation=operation,
-        table=table,
-        record_id=record_id,
-        **extra,
+    # Nivel DEBUG: en producción no se construye ni el mensaje ni el contexto
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    _emit(
+        logging.DEBUG,
+        "DB %s: %s (id=%s)" if record_id else "DB %s: %s",
+        (operation, table, record_id) if record_id else (operation, table),
+        {"db_operation": operation, "table": table, "record_id": record_id, **extra},
     )
 
 
 def log_auth(event: str, username: str = None, success: bool = True, **extra):
     """Log específico para eventos de autenticación"""
-    level = "info" if success else "warning"
-    log_with_context(
-        level,
-        f"Auth: {event}" + (f" - user={username}" if username else ""),
-        auth_event=event,
-        username=username,
-        success=success,
-        **extra,
+    levelno = logging.INFO if success else logging.WARNING
+    if not logger.isEnabledFor(levelno):
+        return
+    _emit(
+        levelno,
+        "Auth: %s - user=%s" if username else "Auth: %s",
+        (event, username) if username else (event,),
+        {"auth_event": event, "username": username, "success": success, **extra},
     )
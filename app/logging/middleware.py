@@ -6,109 +6,112 @@ incluyendo duración, código de estado y información del cliente.
 Autor: Gernibide
 """
 
+import logging
 import time
-from collections.abc import Callable
+from typing import NamedTuple
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .logger import log_with_context, logger
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class _RequestInfo(NamedTuple):
+    """Datos de la petición que se incluyen en cada log."""
+
+    method: str
+    path: str
+    client_host: str
+
+
+def _extract_request_info(scope: Scope) -> _RequestInfo:
     """
-    Middleware que registra automáticamente todas las peticiones HTTP
-    Incluye información sobre método, path, duración, código de estado, etc.
+    Extrae método, path e IP del cliente del scope ASGI
+    En un scope HTTP método y path siempre existen; solo el cliente puede
+    faltar (p. ej. detrás de algunos servidores ASGI)
     """
+    client = scope.get("client")
+    return _RequestInfo(scope["method"], scope["path"], client[0] if client else "unknown")
 
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Timestamp de inicio para calcular duración
-        start_time = time.time()
+def _request_details(scope: Scope) -> dict[str, str]:
+    """User-agent y query string de la petición, leídos solo cuando se van a loguear."""
+    return {
+        "user_agent": Headers(scope=scope).get("user-agent", "unknown"),
+        "query_params": scope.get("query_string", b"").decode("latin-1"),
+    }
 
-        # Extraer información de la petición de forma segura
-        try:
-            method = request.method
-            path = str(request.url.path) if hasattr(request.url, "path") else "unknown"
-            client_host = (
-                request.client.host
-                if (hasattr(request, "client") and request.client)
-                else "unknown"
-            )
-            user_agent = (
-                request.headers.get("user-agent", "unknown")
-                if hasattr(request, "headers")
-                else "unknown"
-            )
-            query_params = str(request.query_params) if hasattr(request, "query_params") else ""
-        except Exception as e:
-            # Si falla la extracción de información, usar valores por defecto
-            method = "UNKNOWN"
-            path = "unknown"
-            client_host = "unknown"
-            user_agent = "unknown"
-            query_params = ""
-            logger.warning(f"Error extrayendo información de request: {e}")
-
-        # Log de petición entrante (nivel DEBUG)
-        try:
-            logger.debug(
-                f"Petición entrante: {method} {path}",
-                extra={
-                    "extra_fields": {
-                        "http_method": method,
-                        "path": path,
-                        "client_ip": client_host,
-                        "user_agent": user_agent,
-                        "query_params": query_params,
-                    }
-                },
-            )
-        except Exception as e:
-            # Si falla el logging, no detener la petición
-            logger.warning(f"Error logging petición entrante: {e}")
 
-        # Procesar la petición y capturar posibles errores
-        try:
-            response = await call_next(request)
-
-            # Calcular duración de la petición
-            duration = time.time() - start_time
-            duration_ms = round(duration * 1000, 2)
-
-            # Determinar nivel de log según código de estado
-            status_code = response.status_code
-            if status_code >= 500:
-                log_level = "error"
-            elif status_code >= 400:
-                log_level = "warning"
-            else:
-                log_level = "info"
-
-            # Log de respuesta
-            log_with_context(
-                log_level,
-                f"{method} {path} - {status_code} - {duration_ms}ms",
-                http_method=method,
-                path=path,
-                status_code=status_code,
-                duration_ms=duration_ms,
-                client_ip=client_host,
-            )
+class LoggingMiddleware:
+    """
+    Middleware ASGI que registra automáticamente todas las peticiones HTTP
+    Incluye información sobre método, path, duración, código de estado, etc.
+
+    Es un middleware ASGI puro (no BaseHTTPMiddleware): no crea Request/Response
+    ni un task group por petición; solo envuelve ``send`` para leer el status.
+    """
 
-            return response
+    def __init__(self, app: ASGIApp, log_incoming: bool = False):
+        """
+        Args:
+            app: Aplicación ASGI
+            log_incoming: Emitir además un log DEBUG al recibir cada petición.
+                Por defecto cada petición produce un único registro, al responder
+        """
+        self.app = app
+        self.log_incoming = log_incoming
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Instante de inicio (reloj monótono, en ns) para calcular duración
+        start_ns = time.perf_counter_ns()
+
+        method, path, client_host = _extract_request_info(scope)
+
+        # Log de petición entrante (nivel DEBUG), solo si se ha activado
+        # explícitamente: normalmente sus datos van en el log de respuesta
+        if self.log_incoming and logger.isEnabledFor(logging.DEBUG):
+            try:
+                logger.debug(
+                    "Petición entrante: %s %s",
+                    method,
+                    path,
+                    extra={
+                        "extra_fields": {
+                            "http_method": method,
+                            "path": path,
+                            "client_ip": client_host,
+                            **_request_details(scope),
+                        }
+                    },
+                )
+            except Exception as e:
+                # Si falla el logging, no detener la petición
+                logger.warning("Error logging petición entrante: %s", e)
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
+        # Procesar la petición y capturar posibles errores
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             # Calcular duración incluso en caso de error
-            duration = time.time() - start_time
-            duration_ms = round(duration * 1000, 2)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             # Log de error
             logger.error(
-                f"Error procesando petición: {method} {path}",
+                "Error procesando petición: %s %s",
+                method,
+                path,
                 exc_info=True,
                 extra={
                     "extra_fields": {
@@ -124,3 +127,30 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
             # Re-lanzar la excepción para que FastAPI la maneje
             raise
+
+        # Calcular duración de la petición (respuesta ya enviada)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+        # Determinar nivel de log según código de estado
+        if status_code >= 500:
+            log_level = "error"
+        elif status_code >= 400:
+            log_level = "warning"
+        else:
+            log_level = "info"
+
+        # Un único log por petición con los datos de petición y respuesta
+        log_with_context(
+            log_level,
+            "%s %s - %d - %dms",
+            method,
+            path,
+            status_code,
+            duration_ms,
+            http_method=method,
+            path=path,
+            status_code=status_code,
+            duration_ms=duration_ms,
+            client_ip=client_host,
+            **_request_details(scope),
+        )
@@ -7,19 +7,34 @@ y todos los routers de la API.
 Autor: Gernibide
 """
 
-from pathlib import Path
-
-from fastapi import FastAPI
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.wsgi import WSGIMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute, request_response
+from fastapi.utils import get_value_or_default
 from slowapi.errors import RateLimitExceeded
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import text
+from starlette.middleware import Middleware
+from starlette.routing import Route
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-# Importar modelos para que SQLAlchemy los conozca
-import app.models  # noqa
 from app.config import settings
 from app.database import Base, engine
-from app.logging import LoggingMiddleware, logger, register_exception_handlers
+from app.logging import (
+    LoggingMiddleware,
+    logger,
+    register_exception_handlers,
+    start_log_listener,
+    stop_log_listener,
+)
 from app.routers import (
     actividad_progreso,
     actividades,
@@ -37,88 +52,297 @@ from app.routers import (
     usuarios,
 )
 from app.utils.rate_limit import close_rate_limiter, init_rate_limiter, limiter, rate_limit_handler
-from app.web.flask_app import flask_app
+from app.web import routes as web_routes
+from app.web.static_files import CachedStaticFiles
+
+
+def _register_routers(app: FastAPI, *routers: APIRouter) -> None:
+    """Registra las rutas de los routers en la app sin copiarlas.
+
+    ``app.include_router`` vuelve a crear cada ``APIRoute`` (recompila el path y
+    reconstruye su árbol de dependencias). Como los routers ya tienen su prefijo
+    final y no se añaden tags ni dependencias al incluirlos, basta con apuntar
+    cada ruta a la app para ``dependency_overrides`` y añadirla a ``app.router``.
+
+    Como ``include_router``, las rutas sin ``response_class`` propia heredan la
+    del router o, si tampoco la tiene, el ``default_response_class`` de la app.
+
+    Args:
+        app: Aplicación FastAPI.
+        *routers: Routers con el prefijo completo de sus rutas.
+    """
+    for router in routers:
+        for route in router.routes:
+            if isinstance(route, APIRoute):
+                route.response_class = get_value_or_default(
+                    route.response_class,
+                    router.default_response_class,
+                    app.router.default_response_class,
+                )
+                route.dependency_overrides_provider = app
+                route.app = request_response(route.get_route_handler())
+        app.router.routes.extend(router.routes)
+
+
+class _LazyFlaskApp:
+    """App ASGI que importa la interfaz web Flask en su primera petición.
+
+    Flask y sus templates no se cargan al arrancar el proceso (solo la API
+    responde hasta entonces); la primera petición web crea el WSGIMiddleware.
+    """
+
+    def __init__(self):
+        self._app: ASGIApp | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._app is None:
+            from fastapi.middleware.wsgi import WSGIMiddleware
+
+            from app.web.flask_app import flask_app
+
+            self._app = WSGIMiddleware(flask_app)
+        await self._app(scope, receive, send)
+
+
+def _prepare_database() -> None:
+    """Crea las tablas (``AUTO_CREATE_SCHEMA``) o comprueba la conexión a la BD.
+
+    Es síncrono (SQLAlchemy); en el arranque se ejecuta en un hilo.
+    """
+    if settings.AUTO_CREATE_SCHEMA:
+        # Crear todas las tablas si no existen (solo desarrollo). create_all
+        # necesita todos los modelos registrados en Base.metadata
+        from app.models import load_all_models
+
+        load_all_models()
+        with engine.connect() as connection:
+            # Una sola consulta al catálogo: en arranques con el esquema ya
+            # creado se evita el has_table por tabla que hace create_all
+            existing = set(sa_inspect(connection).get_table_names())
+        if existing.issuperset(Base.metadata.tables):
+            logger.info("Tablas ya existentes, se omite create_all")
+        else:
+            logger.info("Creando tablas en la base de datos si no existen...")
+            Base.metadata.create_all(bind=engine)
+            logger.info("Tablas creadas/verificadas exitosamente")
+    else:
+        # Comprobación de disponibilidad: una sola ida y vuelta a la BD
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        logger.info("Conexión a la base de datos verificada")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Ciclo de vida de la aplicación (arranque y parada).
+
+    Al arrancar comprueba la conexión a la base de datos (``SELECT 1``),
+    inicializa el rate limiter, genera el schema OpenAPI (si la documentación
+    está activada) y registra el inicio en los logs. Las tablas
+    solo se crean aquí con ``AUTO_CREATE_SCHEMA``; en despliegue las crea
+    ``alembic upgrade head`` antes de arrancar el servidor. La comprobación
+    de Redis del rate limiter corre en segundo plano (``app.state``) mientras
+    se prepara la base de datos: la app no espera a Redis para estar lista.
+    Un fallo en cualquiera de los dos se registra sin detener la app.
+
+    Al parar cierra el rate limiter y vacía los logs pendientes.
+
+    Args:
+        app: Aplicación FastAPI.
+    """
+    start_log_listener()
+
+    app.state.rate_limiter_init = None
+    if settings.RATE_LIMIT_ENABLED:
+        app.state.rate_limiter_init = asyncio.create_task(init_rate_limiter())
+
+    # /ready responde 503 hasta que la base de datos esté preparada
+    app.state.database_ready = False
+    try:
+        # Síncrono (SQLAlchemy): en un hilo para no bloquear el event loop
+        await asyncio.to_thread(_prepare_database)
+        app.state.database_ready = True
+        logger.info("Aplicación iniciada correctamente")
+    except Exception as e:
+        # Sin re-raise para que la app al menos arranque (sin BD)
+        logger.error("Error al iniciar la aplicación: %s", e, exc_info=e)
+
+    # Generar el schema OpenAPI ahora y no en la primera visita a /docs
+    openapi = getattr(app.state, "openapi", None)
+    if openapi is not None:
+        openapi.body()
+
+    try:
+        yield
+    finally:
+        rate_limiter_init = app.state.rate_limiter_init
+        if rate_limiter_init is not None and not rate_limiter_init.done():
+            rate_limiter_init.cancel()
+
+        if settings.RATE_LIMIT_ENABLED:
+            try:
+                await close_rate_limiter()
+            except Exception as e:
+                logger.warning("Error al cerrar rate limiter: %s", e)
+
+        logger.info("Aplicación detenida")
+        stop_log_listener()
+
+
+# Descripción Markdown de la API para /docs y /redoc. Se lee del disco al generar
+# el schema (primera petición a /openapi.json), no al importar la app
+OPENAPI_DESCRIPTION_FILE = os.path.join(os.path.dirname(__file__), "openapi_description.md")
+
+
+class _CachedOpenAPI:
+    """Sirve ``/openapi.json`` serializando el schema una sola vez con orjson.
+
+    FastAPI ya cachea el dict del schema (``app.openapi_schema``), pero lo vuelve
+    a convertir a JSON en cada petición; aquí se guardan directamente los bytes.
+    El schema se completa con la descripción de ``OPENAPI_DESCRIPTION_FILE``.
+    ``lifespan`` llama a :meth:`body` al arrancar, así que ninguna petición a
+    ``/docs`` paga el recorrido de las rutas.
+    """
+
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self._build_schema = app.openapi
+        self._body: bytes | None = None
+
+    def schema(self) -> dict[str, Any]:
+        """Genera (una vez) el schema de FastAPI y le añade la descripción.
+
+        Returns:
+            Schema OpenAPI de la aplicación.
+        """
+        if self.app.openapi_schema is None:
+            schema = self._build_schema()
+            with open(OPENAPI_DESCRIPTION_FILE, encoding="utf-8") as f:
+                description = f.read()
+            # Misma posición de la clave que si se pasara description= a FastAPI
+            title = schema["info"].pop("title")
+            schema["info"] = {"title": title, "description": description, **schema["info"]}
+        return self.app.openapi_schema
+
+    def body(self) -> bytes:
+        """Devuelve (y genera la primera vez) el schema serializado a JSON.
+
+        Returns:
+            Schema OpenAPI en JSON.
+        """
+        if self._body is None:
+            self._body = orjson.dumps(self.app.openapi())
+        return self._body
+
+    async def endpoint(self, request: Request) -> Response:
+        return Response(self.body(), media_type="application/json")
+
+    def install(self) -> None:
+        """Sustituye ``app.openapi`` y la ruta ``openapi_url`` registrada por FastAPI."""
+        self.app.openapi = self.schema
+        self.app.state.openapi = self
+        for i, route in enumerate(self.app.router.routes):
+            if isinstance(route, Route) and route.path == self.app.openapi_url:
+                self.app.router.routes[i] = Route(
+                    self.app.openapi_url, self.endpoint, include_in_schema=False
+                )
+                return
+
+
+class _HealthCheck:
+    """Endpoint ASGI de verificación de salud de la API.
+
+    Responde siempre ``{"status": "healthy"}`` con bytes precalculados: sin
+    Request, sin serialización JSON y sin log por petición (el middleware de
+    logging ya registra cada llamada).
+    """
+
+    _START = {
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", b"20")],
+    }
+    _BODY = {"type": "http.response.body", "body": b'{"status":"healthy"}'}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(self._START)
+        await send(self._BODY)
+
+
+class _ReadinessCheck:
+    """Endpoint ASGI de disponibilidad (``/ready``).
+
+    A diferencia de ``/health`` (el proceso responde), indica si la base de
+    datos quedó preparada al arrancar: 200 si es así, 503 si no (p. ej. la BD
+    no respondía y la app arrancó sin ella).
+    """
+
+    _HEADERS = [(b"content-type", b"application/json")]
+    _READY = b'{"status":"ready"}'
+    _NOT_READY = b'{"status":"not_ready"}'
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        ready = getattr(scope["app"].state, "database_ready", False)
+        body = self._READY if ready else self._NOT_READY
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200 if ready else 503,
+                "headers": [*self._HEADERS, (b"content-length", str(len(body)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+class _ApiCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware aplicado solo a las rutas de la API.
+
+    ``/static``, ``/health`` y la interfaz web se sirven desde el mismo origen,
+    así que esas peticiones pasan directamente sin leer cabeceras CORS.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str, **kwargs):
+        """
+        Args:
+            app: Aplicación ASGI
+            path_prefix: Prefijo de las rutas a las que se aplica CORS
+            **kwargs: Argumentos de ``CORSMiddleware``
+        """
+        super().__init__(app, **kwargs)
+        self.path_prefix = path_prefix
+        # Starlette guarda la lista tal cual y comprueba ``origin in allow_origins``
+        # en cada petición: con un frozenset la comprobación es O(1)
+        self.allow_origins = frozenset(self.allow_origins)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Middlewares de la app, del más externo al más interno. Se pasan todos juntos a
+# FastAPI(middleware=...) en lugar de con add_middleware uno a uno.
+_MIDDLEWARE = [
+    # CORS para la app móvil y otros clientes web. Métodos y cabeceras explícitos:
+    # Starlette precalcula las cabeceras de respuesta. Las credenciales solo se
+    # permiten con una lista concreta de orígenes
+    Middleware(
+        _ApiCORSMiddleware,
+        path_prefix="/api",
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials="*" not in settings.CORS_ORIGINS,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+        # Content-Type ya está en las cabeceras "safelisted" que Starlette añade siempre
+        allow_headers=["Authorization", settings.API_KEY_HEADER],
+    ),
+    # Logging de peticiones, justo por encima de las rutas
+    Middleware(LoggingMiddleware, log_incoming=settings.LOG_INCOMING_REQUESTS),
+]
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    description="""
-## API REST para GerniBide
-
-API completa para la gestión de usuarios, clases, profesores, partidas y actividades educativas.
-
----
-
-## Sistema de Autenticación
-
-Esta API utiliza **dos mecanismos de autenticación**:
-
-### [API-KEY] API Key (Acceso Administrativo)
-Para backends y operaciones administrativas:
-```
-X-API-Key: tu-api-key
-```
-- Acceso completo a todos los endpoints
-- Requerida para: crear usuarios masivos, gestionar profesores/clases, eliminar recursos
-
-### [JWT] Token JWT (Acceso de Usuario/Profesor)
-Para la aplicación móvil y web:
-```
-Authorization: Bearer <token>
-```
-1. Obtén un token en `POST /api/v1/auth/login-app` (usuarios) o `POST /api/v1/auth/login-profesor` (profesores)
-2. El token expira en 30 minutos
-3. Acceso limitado a recursos propios
-
----
-
-## Endpoints por Categoría
-
-### [PUBLIC] Autenticación (sin auth requerida)
-- `GET /` - Verificar que la API está funcionando
-- `GET /health` - Health check
-- `POST /api/v1/auth/login-app` - Login de usuario (estudiante)
-- `POST /api/v1/auth/login-profesor` - Login de profesor
-
-### [API-KEY] Solo Administración
-- **Profesores**: CRUD completo
-- **Clases**: CRUD completo, creación con código compartible (6 chars)
-- **Usuarios**: Importación masiva (bulk), eliminación
-- **Actividades**: POST, PUT, DELETE
-- **Puntos**: POST, PUT, DELETE
-- **Partidas**: GET lista, DELETE
-- **Progreso**: GET lista, DELETE
-
-### [MIXED] API Key o Token JWT
-- **Usuarios**:
-  - `GET /{id}` - Ver perfil (solo propio con token)
-  - `PUT /{id}` - Actualizar perfil (solo propio con token)
-  - `GET /{id}/estadisticas` - Estadísticas de usuario
-- **Partidas**:
-  - `POST` - Crear partida (con token)
-  - `GET /{id}`, `PUT /{id}` - Solo sus propias partidas con token
-- **Actividades**:
-  - `GET`, `GET /{id}` - Lectura pública con token
-  - `GET /{id}/respuestas-publicas` - Ver respuestas públicas (mensaje wall)
-- **Puntos**: `GET`, `GET /{id}` - Lectura pública con token
-- **Progreso**: POST, GET/{id}, PUT/{id} - Vía su partida con token
-- **Estadísticas**: Endpoints de estadísticas de juego y aprendizaje
-- **Audit Logs**: GET con token, POST con API Key
-
----
-
-## Características
-
-✅ Autenticación dual (API Key + JWT)
-✅ Control de acceso por recurso
-✅ Hash de contraseñas con bcrypt
-✅ Validación automática de datos con Pydantic
-✅ Paginación en listados
-✅ Logging estructurado con contexto
-✅ Códigos de clase compartibles (6 caracteres)
-✅ Importación masiva de usuarios (transaccional)
-✅ Sistema de trazabilidad con audit logs
-✅ Internacionalización (i18n) español/euskera
-    """,
     version="1.2.0",
     contact={"name": "Equipo GerniBide"},
     license_info={
@@ -167,107 +391,76 @@ Authorization: Bearer <token>
             "description": "[MIXED] Trazabilidad de acciones. Sistema polimórfico (Web/App logs).",
         },
     ],
+    # Con DOCS_ENABLED=false no se sirve /docs, /redoc ni /openapi.json y el schema
+    # nunca se genera. Si está activo, FastAPI lo genera en la primera petición y lo cachea
+    openapi_url="/openapi.json" if settings.DOCS_ENABLED else None,
+    docs_url="/docs" if settings.DOCS_ENABLED else None,
+    redoc_url="/redoc" if settings.DOCS_ENABLED else None,
+    lifespan=lifespan,
+    # orjson serializa las respuestas JSON de los endpoints (UTF-8 nativo, sin
+    # pasar por json.dumps); los manejadores de errores siguen con JSONResponse
+    default_response_class=ORJSONResponse,
+    middleware=_MIDDLEWARE,
 )
 
+if settings.DOCS_ENABLED:
+    _CachedOpenAPI(app).install()
+
 # Configurar logging al inicio de la aplicación
 logger.info("Iniciando GerniBide API", extra={"extra_fields": {"version": "1.0.0"}})
 
 # Registrar manejadores de excepciones globales
 register_exception_handlers(app)
 
-# Registrar slowapi state y error handler
+# Registrar slowapi state y error handler. El limiter va en app.state desde la
+# importación (no en lifespan) para que los tests puedan sustituirlo antes de arrancar
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_handler)
 
-# Configurar middleware de logging (debe ir ANTES de otros middlewares)
-app.add_middleware(LoggingMiddleware)
-
-# Configurar CORS para permitir peticiones desde la app móvil
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # En producción, especifica los orígenes permitidos
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
 # Montar archivos estáticos para la interfaz web
-STATIC_DIR = Path(__file__).parent / "web" / "static"
-app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
-logger.info(f"Archivos estáticos montados en /static desde {STATIC_DIR}")
-
-# Incluir routers de API
-app.include_router(auth.router, prefix=settings.API_V1_PREFIX)
-app.include_router(usuarios.router, prefix=settings.API_V1_PREFIX)
-app.include_router(profesores.router, prefix=settings.API_V1_PREFIX)
-app.include_router(clases.router, prefix=settings.API_V1_PREFIX)
-app.include_router(puntos.router, prefix=settings.API_V1_PREFIX)
-app.include_router(actividades.router, prefix=settings.API_V1_PREFIX)
-app.include_router(partidas.router, prefix=settings.API_V1_PREFIX)
-app.include_router(actividad_progreso.router, prefix=settings.API_V1_PREFIX)
-app.include_router(audit_logs.router, prefix=settings.API_V1_PREFIX)
-app.include_router(statistics.router)  # Statistics doesn't use API_V1_PREFIX
-app.include_router(gameplay_statistics.router)  # Gameplay statistics doesn't use API_V1_PREFIX
-app.include_router(learning_statistics.router)  # Learning statistics doesn't use API_V1_PREFIX
-app.include_router(teacher_dashboard.router)  # Teacher dashboard doesn't use API_V1_PREFIX
-app.include_router(i18n.router)  # i18n language switching endpoint
-logger.info(f"Routers de API registrados en {settings.API_V1_PREFIX}")
-
-# Incluir router de interfaz web FastAPI (DESACTIVADO - ahora usa Flask)
-# app.include_router(web_routes.router)
-# logger.info("Router de interfaz web FastAPI registrado")
-
-# Montar aplicación Flask para servir interfaz web (requisito académico)
-# Flask maneja: /, /login, /dashboard, /statistics, /gallery, etc.
-# FastAPI maneja: /api/v1/*, /health
-app.mount("/", WSGIMiddleware(flask_app))
-logger.info("Aplicación Flask montada en raíz para interfaz web")
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Evento ejecutado al iniciar la aplicación.
-
-    Crea las tablas en la base de datos si no existen, inicializa
-    el rate limiter con Redis y registra el inicio en los logs.
-
-    Raises:
-        Exception: Si hay un error al crear las tablas (no detiene la app).
-    """
-    try:
-        # Crear todas las tablas si no existen
-        logger.info("Creando tablas en la base de datos si no existen...")
-        Base.metadata.create_all(bind=engine)
-        logger.info("Tablas creadas/verificadas exitosamente")
-
-        # Inicializar rate limiter si está habilitado
-        if settings.RATE_LIMIT_ENABLED:
-            try:
-                await init_rate_limiter()
-            except Exception as e:
-                logger.warning(
-                    f"Rate limiter no pudo inicializarse: {e}. Continuando sin rate limiting."
-                )
-
-        logger.info("Aplicación iniciada correctamente")
-    except Exception as e:
-        logger.error(f"Error al iniciar la aplicación: {e}", exc_info=True)
-        # No re-raise para que la app al menos arranque (sin BD)
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Evento ejecutado al detener la aplicación.
-
-    Cierra la conexión del rate limiter y registra el cierre en los logs.
-    """
-    if settings.RATE_LIMIT_ENABLED:
-        try:
-            await close_rate_limiter()
-        except Exception as e:
-            logger.warning(f"Error al cerrar rate limiter: {e}")
-
-    logger.info("Aplicación detenida")
+# Ruta como str: StaticFiles comprueba que el directorio existe al crearse
+STATIC_DIR = os.path.join(os.path.dirname(__file__), "web", "static")
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
+logger.info("Archivos estáticos montados en /static desde %s", STATIC_DIR)
+
+# Incluir routers de API. Los routers de la API v1 ya llevan API_V1_PREFIX en su
+# propio prefijo, así que sus rutas se registran tal cual (ver _register_routers)
+_register_routers(
+    app,
+    auth.router,
+    usuarios.router,
+    profesores.router,
+    clases.router,
+    puntos.router,
+    actividades.router,
+    partidas.router,
+    actividad_progreso.router,
+    audit_logs.router,
+    statistics.router,
+    gameplay_statistics.router,
+    learning_statistics.router,
+    teacher_dashboard.router,
+    i18n.router,  # i18n language switching endpoint
+)
+logger.info("Routers de API registrados en %s", settings.API_V1_PREFIX)
+
+# Health check y readiness como apps ASGI con la respuesta ya serializada. Se
+# registran antes del montaje de Flask en "/" para que no pasen por el puente WSGI
+# (que tiene su propio /health); Railway consulta /health (healthcheckPath)
+app.router.routes.append(Route("/health", _HealthCheck(), methods=["GET"]))
+app.router.routes.append(Route("/ready", _ReadinessCheck(), methods=["GET"]))
+
+if settings.WEB_USE_FLASK:
+    # Montar aplicación Flask para servir interfaz web (requisito académico)
+    # Flask maneja: /, /login, /dashboard, /statistics, /gallery, etc.
+    # FastAPI maneja: /api/v1/*, /health
+    app.mount("/", _LazyFlaskApp())
+    logger.info("Aplicación Flask montada en raíz para interfaz web")
+else:
+    # Las mismas páginas como rutas ASGI nativas: sin puente WSGI ni un hilo
+    # por petición (ver WEB_USE_FLASK en app.config)
+    _register_routers(app, web_routes.router)
+    logger.info("Router de interfaz web FastAPI registrado")
 
 
 # Endpoint raíz ahora manejado por Flask
@@ -280,14 +473,3 @@ async def shutdown_event():
 #     """
 #     logger.debug("Endpoint raíz accedido")
 #     return {"message": "GerniBide API - Funcionando correctamente"}
-
-
-@app.get("/health")
-def health_check():
-    """Endpoint de verificación de salud de la API.
-
-    Returns:
-        dict: Estado de salud de la aplicación.
-    """
-    logger.debug("Health check realizado")
-    return {"status": "healthy"}
@@ -1,13 +1,43 @@
-from app.models.actividad import Actividad
-from app.models.actividad_progreso import ActividadProgreso
-from app.models.audit_log import AuditLog, AuditLogApp, AuditLogWeb
+"""Modelos SQLAlchemy de la aplicación.
+
+Los modelos básicos (usuarios, clases, profesores y partidas) se importan al
+cargar el paquete. El resto se importa en el primer acceso al atributo
+(``app.models.Punto``, ``from app.models import AuditLog``...) mediante
+``__getattr__`` (PEP 562), de modo que un proceso que no los usa no paga su
+importación.
+
+Todo lo que necesita ``Base.metadata`` completo (``create_all``, Alembic)
+debe llamar antes a :func:`load_all_models`.
+
+Autor: Gernibide
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from app.models.clase import Clase
 from app.models.juego import Partida
 from app.models.profesor import Profesor
-from app.models.punto import Punto
-from app.models.sesion import Sesion
 from app.models.usuario import Usuario
 
+if TYPE_CHECKING:
+    from app.models.actividad import Actividad
+    from app.models.actividad_progreso import ActividadProgreso
+    from app.models.audit_log import AuditLog, AuditLogApp, AuditLogWeb
+    from app.models.punto import Punto
+    from app.models.sesion import Sesion
+
+# Nombre del modelo -> módulo de app.models donde se define (carga diferida)
+_LAZY_MODELS = {
+    "Punto": "punto",
+    "Actividad": "actividad",
+    "Sesion": "sesion",
+    "ActividadProgreso": "actividad_progreso",
+    "AuditLog": "audit_log",
+    "AuditLogWeb": "audit_log",
+    "AuditLogApp": "audit_log",
+}
+
 __all__ = [
     "Usuario",
     "Clase",
@@ -20,4 +50,36 @@ __all__ = [
     "AuditLog",
     "AuditLogWeb",
     "AuditLogApp",
+    "load_all_models",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Importa un modelo de carga diferida en su primer acceso.
+
+    Args:
+        name: Nombre del atributo pedido al paquete.
+
+    Returns:
+        Clase del modelo.
+
+    Raises:
+        AttributeError: Si el nombre no es un modelo del paquete.
+    """
+    module_name = _LAZY_MODELS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    model = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    # Guardarlo en el módulo: los siguientes accesos no pasan por __getattr__
+    globals()[name] = model
+    return model
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def load_all_models() -> None:
+    """Importa todos los modelos para que ``Base.metadata`` tenga todas las tablas."""
+    for name in _LAZY_MODELS:
+        __getattr__(name)
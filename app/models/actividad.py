@@ -5,9 +5,10 @@ Define la tabla de actividades que forman parte de los puntos del juego.
 Autor: Gernibide
 """
 
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, UUIDString
 
 
 class Actividad(Base):
@@ -24,6 +25,6 @@ class Actividad(Base):
 
     __tablename__ = "actividad"
 
-    id = Column(String(36), primary_key=True, nullable=False)
-    id_punto = Column(String(36), ForeignKey("punto.id"), nullable=False)
-    nombre = Column(String(100), nullable=False)
+    id: Mapped[str] = mapped_column(UUIDString(), primary_key=True, nullable=False)
+    id_punto: Mapped[str] = mapped_column(UUIDString(), ForeignKey("punto.id"), nullable=False)
+    nombre: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -7,9 +7,10 @@ Autor: Gernibide
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, UUIDString
 
 
 class ActividadProgreso(Base):
@@ -33,13 +34,24 @@ class ActividadProgreso(Base):
 
     __tablename__ = "actividad_progreso"
 
-    id = Column(String(36), primary_key=True, nullable=False)
-    id_juego = Column(String(36), ForeignKey("juego.id"), nullable=False)
-    id_punto = Column(String(36), ForeignKey("punto.id"), nullable=False)
-    id_actividad = Column(String(36), ForeignKey("actividad.id"), nullable=False)
-    fecha_inicio = Column(DateTime, default=datetime.now, nullable=False)
-    duracion = Column(Integer, nullable=True)
-    fecha_fin = Column(DateTime, nullable=True)
-    estado = Column(String(20), default="en_progreso", nullable=False)
-    puntuacion = Column(Float, nullable=True)
-    respuesta_contenido = Column(Text, nullable=True)
+    id: Mapped[str] = mapped_column(UUIDString(), primary_key=True, nullable=False)
+    id_juego: Mapped[str] = mapped_column(UUIDString(), ForeignKey("juego.id"), nullable=False)
+    id_punto: Mapped[str] = mapped_column(UUIDString(), ForeignKey("punto.id"), nullable=False)
+    id_actividad: Mapped[str] = mapped_column(
+        UUIDString(), ForeignKey("actividad.id"), nullable=False
+    )
+    fecha_inicio: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
+    duracion: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    fecha_fin: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    estado: Mapped[str] = mapped_column(String(20), default="en_progreso", nullable=False)
+    puntuacion: Mapped[float | None] = mapped_column(Float, nullable=True)
+    respuesta_contenido: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        # Progresos completados de las partidas de un usuario (estadísticas)
+        Index("ix_actividad_progreso_juego_estado", id_juego, estado),
+        # Progreso de un usuario en un punto (perfil, módulos completados)
+        Index("ix_actividad_progreso_punto_juego", id_punto, id_juego),
+        # Progreso en curso de una actividad en una partida (iniciar actividad)
+        Index("ix_actividad_progreso_actividad_juego", id_actividad, id_juego),
+    )
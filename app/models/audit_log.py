@@ -7,10 +7,53 @@ Autor: Gernibide
 """
 
 from datetime import datetime
+from enum import IntEnum
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import (
+    DateTime,
+    Dialect,
+    ForeignKey,
+    Index,
+    SmallInteger,
+    String,
+    Text,
+    TypeDecorator,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, UUIDString
+
+
+class AuditLogTipo(IntEnum):
+    """Código que se guarda en la columna ``tipo`` para cada clase de log."""
+
+    AUDIT_LOG = 0
+    WEB = 1
+    APP = 2
+
+
+# Nombre del tipo ("web", "app"...) <-> código guardado en la BD
+_TIPO_CODIGOS = {tipo.name.lower(): tipo.value for tipo in AuditLogTipo}
+_TIPO_NOMBRES = {codigo: nombre for nombre, codigo in _TIPO_CODIGOS.items()}
+
+
+class _TipoAuditLog(TypeDecorator[str]):
+    """Discriminador ``tipo`` guardado como SMALLINT y expuesto como ``str``.
+
+    En Python (identidades polimórficas, filtros, respuestas de la API) sigue
+    siendo ``"web"`` o ``"app"``; en la BD ocupa 2 bytes y su índice es más
+    pequeño. Un nombre desconocido se envía como NULL y no coincide con nada.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> int | None:
+        return _TIPO_CODIGOS.get(value)
+
+    def process_result_value(self, value: int | None, dialect: Dialect) -> str | None:
+        return _TIPO_NOMBRES.get(value)
 
 
 class AuditLog(Base):
@@ -22,36 +65,73 @@ class AuditLog(Base):
 
     __tablename__ = "audit_log"
 
-    id = Column(String(36), primary_key=True, nullable=False)
-    timestamp = Column(DateTime, default=datetime.now, nullable=False, index=True)
-    usuario_id = Column(String(36), ForeignKey("usuario.id"), nullable=True)
-    profesor_id = Column(String(36), ForeignKey("profesor.id"), nullable=True)
-    accion = Column(String(100), nullable=False, index=True)
-    detalles = Column(Text, nullable=True)
-    tipo = Column(String(20), nullable=False, index=True)  # Discriminador: 'web' o 'app'
+    id: Mapped[str] = mapped_column(UUIDString(), primary_key=True, nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, nullable=False, index=True
+    )
+    usuario_id: Mapped[str | None] = mapped_column(
+        UUIDString(), ForeignKey("usuario.id"), nullable=True
+    )
+    profesor_id: Mapped[str | None] = mapped_column(
+        UUIDString(), ForeignKey("profesor.id"), nullable=True
+    )
+    accion: Mapped[str] = mapped_column(String(100), nullable=False)
+    detalles: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Discriminador: 'web' o 'app' (SMALLINT en la BD, ver AuditLogTipo)
+    tipo: Mapped[str] = mapped_column(_TipoAuditLog(), nullable=False)
 
     # Campos específicos de cada tipo (nullable porque dependen del tipo)
     # LogWeb:
-    ip_address = Column(String(45), nullable=True)
-    user_agent = Column(String(500), nullable=True)
-    browser = Column(String(100), nullable=True)
+    ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)
+    user_agent: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    browser: Mapped[str | None] = mapped_column(String(100), nullable=True)
 
     # LogApp:
-    device_type = Column(String(50), nullable=True)
-    app_version = Column(String(20), nullable=True)
-    device_id = Column(String(100), nullable=True)
+    device_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    app_version: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    device_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+
+    __table_args__ = (
+        # Listados filtrados (tipo, acción, usuario o profesor) y ordenados por fecha
+        # (más recientes primero): un único range scan ya ordenado por filtro
+        Index("ix_audit_log_tipo_timestamp", tipo, timestamp.desc()),
+        Index("ix_audit_log_accion_timestamp", accion, timestamp.desc()),
+        # Parciales: cada log es de un usuario o de un profesor, así que cada
+        # índice solo contiene las filas con su columna informada
+        Index(
+            "ix_audit_log_usuario_timestamp",
+            usuario_id,
+            timestamp.desc(),
+            postgresql_where=text("usuario_id IS NOT NULL"),
+            sqlite_where=text("usuario_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_audit_log_profesor_timestamp",
+            profesor_id,
+            timestamp.desc(),
+            postgresql_where=text("profesor_id IS NOT NULL"),
+            sqlite_where=text("profesor_id IS NOT NULL"),
+        ),
+    )
 
     __mapper_args__ = {"polymorphic_on": tipo, "polymorphic_identity": "audit_log"}
 
+    def _autor(self) -> str:
+        """Usuario o profesor que realizó la acción, para las descripciones."""
+        if self.usuario_id:
+            return f"Usuario {self.usuario_id}"
+        return f"Profesor {self.profesor_id}"
+
     def get_description(self) -> str:
         """
         Polimorfismo: Método base que puede ser sobrescrito por subclases.
         Retorna una descripción legible de la acción.
         """
-        usuario = (
-            f"Usuario {self.usuario_id}" if self.usuario_id else f"Profesor {self.profesor_id}"
-        )
-        return f"{self.accion} - {usuario} - {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
+        usuario = self._autor()
+        # isoformat (en C) da lo mismo que strftime("%Y-%m-%d %H:%M:%S") sin
+        # interpretar un formato en cada llamada
+        fecha = self.timestamp.isoformat(sep=" ", timespec="seconds")
+        return f"{self.accion} - {usuario} - {fecha}"
 
 
 class AuditLogWeb(AuditLog):
@@ -68,9 +148,7 @@ class AuditLogWeb(AuditLog):
         Polimorfismo: Implementación específica para logs web.
         Incluye información del navegador y IP.
         """
-        usuario = (
-            f"Usuario {self.usuario_id}" if self.usuario_id else f"Profesor {self.profesor_id}"
-        )
+        usuario = self._autor()
         browser_info = f"desde {self.browser}" if self.browser else "desde web"
         ip_info = f" ({self.ip_address})" if self.ip_address else ""
         return f"🌐 {self.accion} - {usuario} {browser_info}{ip_info}"
@@ -90,9 +168,7 @@ class AuditLogApp(AuditLog):
         Polimorfismo: Implementación específica para logs de app móvil.
         Incluye información del dispositivo y versión de la app.
         """
-        usuario = (
-            f"Usuario {self.usuario_id}" if self.usuario_id else f"Profesor {self.profesor_id}"
-        )
+        usuario = self._autor()
         device_info = f"desde {self.device_type}" if self.device_type else "desde app"
         version_info = f" v{self.app_version}" if self.app_version else ""
         return f"📱 {self.accion} - {usuario} {device_info}{version_info}"
@@ -5,9 +5,10 @@ Define la tabla de clases que agrupan usuarios bajo un profesor.
 Autor: Gernibide
 """
 
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, UUIDString
 
 
 class Clase(Base):
@@ -24,7 +25,9 @@ class Clase(Base):
 
     __tablename__ = "clase"
 
-    id = Column(String(36), primary_key=True, nullable=False)
-    codigo = Column(String(6), unique=True, nullable=True, index=True)
-    id_profesor = Column(String(36), ForeignKey("profesor.id"), nullable=False)
-    nombre = Column(String(100), nullable=False)
+    id: Mapped[str] = mapped_column(UUIDString(), primary_key=True, nullable=False)
+    codigo: Mapped[str | None] = mapped_column(String(6), unique=True, nullable=True, index=True)
+    id_profesor: Mapped[str] = mapped_column(
+        UUIDString(), ForeignKey("profesor.id"), nullable=False
+    )
+    nombre: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -7,9 +7,10 @@ Autor: Gernibide
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, UUIDString
 
 
 class Partida(Base):
@@ -29,9 +30,20 @@ class Partida(Base):
 
     __tablename__ = "juego"
 
-    id = Column(String(36), primary_key=True, nullable=False)
-    id_usuario = Column(String(36), ForeignKey("usuario.id"), nullable=False)
-    fecha_inicio = Column(DateTime, default=datetime.now, nullable=False)
-    fecha_fin = Column(DateTime, nullable=True)
-    duracion = Column(Integer, nullable=True)
-    estado = Column(String(20), default="en_progreso", nullable=False)
+    id: Mapped[str] = mapped_column(UUIDString(), primary_key=True, nullable=False)
+    id_usuario: Mapped[str] = mapped_column(UUIDString(), ForeignKey("usuario.id"), nullable=False)
+    fecha_inicio: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
+    fecha_fin: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    duracion: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    estado: Mapped[str] = mapped_column(String(20), default="en_progreso", nullable=False)
+
+    __table_args__ = (
+        # Partidas de un usuario, por fecha (racha, última partida) o unidas a sus
+        # progresos; en PostgreSQL el id va incluido y el JOIN no lee la tabla
+        Index(
+            "ix_juego_usuario_fecha_inicio",
+            id_usuario,
+            fecha_inicio,
+            postgresql_include=["id"],
+        ),
+    )
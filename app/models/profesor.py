@@ -7,9 +7,10 @@ Autor: Gernibide
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, UUIDString
 
 
 class Profesor(Base):
@@ -28,9 +29,9 @@ class Profesor(Base):
 
     __tablename__ = "profesor"
 
-    id = Column(String(36), primary_key=True, nullable=False)
-    username = Column(String(45), unique=True, nullable=False)
-    nombre = Column(String(45), nullable=False)
-    apellido = Column(String(45), nullable=False)
-    password = Column(String(255), nullable=False)
-    created = Column(DateTime, default=datetime.now, nullable=False)
+    id: Mapped[str] = mapped_column(UUIDString(), primary_key=True, nullable=False)
+    username: Mapped[str] = mapped_column(String(45), unique=True, nullable=False)
+    nombre: Mapped[str] = mapped_column(String(45), nullable=False)
+    apellido: Mapped[str] = mapped_column(String(45), nullable=False)
+    password: Mapped[str] = mapped_column(String(255), nullable=False)
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
@@ -5,9 +5,10 @@ Define la tabla de puntos que representan módulos o temas del juego educativo.
 Autor: Gernibide
 """
 
-from sqlalchemy import Column, String
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, UUIDString
 
 
 class Punto(Base):
@@ -23,5 +24,5 @@ class Punto(Base):
 
     __tablename__ = "punto"
 
-    id = Column(String(36), primary_key=True, nullable=False)
-    nombre = Column(String(100), nullable=False)
+    id: Mapped[str] = mapped_column(UUIDString(), primary_key=True, nullable=False)
+    nombre: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -1,9 +1,9 @@
-from sqlalchemy import Column, String
+from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, UUIDString
 
 
 class Sesion(Base):
     __tablename__ = "sesion"
 
-    id = Column(String(36), primary_key=True, nullable=False)
+    id: Mapped[str] = mapped_column(UUIDString(), primary_key=True, nullable=False)
@@ -7,9 +7,10 @@ Autor: Gernibide
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, UUIDString
 
 
 class Usuario(Base):
@@ -30,11 +31,13 @@ class Usuario(Base):
 
     __tablename__ = "usuario"
 
-    id = Column(String(36), primary_key=True, nullable=False)
-    username = Column(String(45), unique=True, nullable=False)
-    nombre = Column(String(45), nullable=False)
-    apellido = Column(String(45), nullable=False)
-    password = Column(String(255), nullable=False)
-    id_clase = Column(String(36), ForeignKey("clase.id"), nullable=True)
-    creation = Column(DateTime, default=datetime.now, nullable=False)
-    top_score = Column(Integer, default=0, nullable=False)
+    id: Mapped[str] = mapped_column(UUIDString(), primary_key=True, nullable=False)
+    username: Mapped[str] = mapped_column(String(45), unique=True, nullable=False)
+    nombre: Mapped[str] = mapped_column(String(45), nullable=False)
+    apellido: Mapped[str] = mapped_column(String(45), nullable=False)
+    password: Mapped[str] = mapped_column(String(255), nullable=False)
+    id_clase: Mapped[str | None] = mapped_column(
+        UUIDString(), ForeignKey("clase.id"), nullable=True
+    )
+    creation: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
+    top_score: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
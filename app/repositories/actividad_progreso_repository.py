@@ -6,8 +6,8 @@ de negocio de los detalles de implementación de SQLAlchemy.
 Autor: Gernibide
 """
 
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, func
+from sqlalchemy.orm import Session, aliased
 
 from app.models.actividad_progreso import ActividadProgreso
 from app.models.juego import Partida
@@ -27,49 +27,28 @@ class ActividadProgresoRepository:
         """
         self.db = db
 
-    def count_completed_by_user(self, user_id: str) -> int:
-        """Cuenta actividades completadas por el usuario.
+    def get_stats_by_user(self, user_id: str) -> tuple[int, float]:
+        """Cuenta actividades completadas y suma los puntos del usuario en una consulta.
 
-        Args:
-            user_id: ID del usuario.
-
-        Returns:
-            Número de actividades completadas.
-        """
-        count = (
-            self.db.query(func.count(ActividadProgreso.id))
-            .join(Partida, ActividadProgreso.id_juego == Partida.id)
-            .filter(
-                and_(
-                    Partida.id_usuario == user_id,
-                    ActividadProgreso.estado == "completado",
-                )
-            )
-            .scalar()
-        )
-        return count or 0
-
-    def sum_points_by_user(self, user_id: str) -> float:
-        """Suma total de puntos obtenidos por el usuario.
+        Ambos agregados se calculan recorriendo el JOIN con Partida una sola vez.
 
         Args:
             user_id: ID del usuario.
 
         Returns:
-            Suma de puntos (0.0 si no hay puntos).
+            Tupla (actividades completadas, suma de puntos).
         """
-        total = (
-            self.db.query(func.sum(ActividadProgreso.puntuacion))
-            .join(Partida, ActividadProgreso.id_juego == Partida.id)
-            .filter(
-                and_(
-                    Partida.id_usuario == user_id,
-                    ActividadProgreso.puntuacion.isnot(None),
-                )
+        completadas, puntos = (
+            self.db.query(
+                func.count(case((ActividadProgreso.estado == "completado", ActividadProgreso.id))),
+                # SUM ignora los NULL: mismo resultado que filtrar puntuacion no nula
+                func.sum(ActividadProgreso.puntuacion),
             )
-            .scalar()
+            .join(Partida, ActividadProgreso.id_juego == Partida.id)
+            .filter(Partida.id_usuario == user_id)
+            .one()
         )
-        return total or 0.0
+        return completadas or 0, puntos or 0.0
 
     def get_progreso_by_punto_and_user(
         self, punto_id: str, user_id: str
@@ -81,50 +60,36 @@ class ActividadProgresoRepository:
             user_id: ID del usuario.
 
         Returns:
-            Diccionario {id_actividad: ActividadProgreso} con el progreso más reciente.
+            Diccionario {id_actividad: ActividadProgreso} con el progreso más
+            relevante de cada actividad: el completado si lo hay y, si no, el más
+            reciente.
         """
-        # Obtener IDs de partidas del usuario
-        partidas_usuario = self.db.query(Partida.id).filter(Partida.id_usuario == user_id).all()
-        ids_partidas = [p.id for p in partidas_usuario]
-
-        if not ids_partidas:
-            return {}
-
-        # Obtener todos los progresos del punto para el usuario
-        progresos_query = (
-            self.db.query(ActividadProgreso)
+        # Una fila por actividad calculada en la BD: numerar los progresos de cada
+        # actividad (completado primero, luego el más reciente) y quedarse con el 1
+        ranking = (
+            self.db.query(
+                ActividadProgreso,
+                func.row_number()
+                .over(
+                    partition_by=ActividadProgreso.id_actividad,
+                    order_by=[
+                        case((ActividadProgreso.estado == "completado", 0), else_=1),
+                        ActividadProgreso.fecha_inicio.desc(),
+                        ActividadProgreso.id,
+                    ],
+                )
+                .label("rn"),
+            )
+            .join(Partida, ActividadProgreso.id_juego == Partida.id)
             .filter(
                 and_(
+                    Partida.id_usuario == user_id,
                     ActividadProgreso.id_punto == punto_id,
-                    ActividadProgreso.id_juego.in_(ids_partidas),
                 )
             )
-            .all()
+            .subquery()
         )
+        mejor_progreso = aliased(ActividadProgreso, ranking)
 
-        # Crear dict con el progreso más relevante por actividad
-        # Prioridad: completado > en_progreso (por fecha más reciente)
-        progresos_dict = {}
-        for prog in progresos_query:
-            if prog.id_actividad not in progresos_dict:
-                progresos_dict[prog.id_actividad] = prog
-            else:
-                actual = progresos_dict[prog.id_actividad]
-
-                # Determinar si debemos reemplazar el progreso actual
-                debe_reemplazar = False
-
-                # Priorizar completado sobre en_progreso
-                if (
-                    prog.estado == "completado"
-                    and actual.estado != "completado"
-                    or prog.estado == actual.estado
-                    and prog.fecha_inicio > actual.fecha_inicio
-                ):
-                    debe_reemplazar = True
-                # Si actual es completado y nuevo es en_progreso, mantener completado
-
-                if debe_reemplazar:
-                    progresos_dict[prog.id_actividad] = prog
-
-        return progresos_dict
+        progresos = self.db.query(mejor_progreso).filter(ranking.c.rn == 1).all()
+        return {prog.id_actividad: prog for prog in progresos}
@@ -6,17 +6,36 @@ de negocio de los detalles de implementación de SQLAlchemy.
 Autor: Gernibide
 """
 
+import time
+from typing import NamedTuple
+
 from sqlalchemy.orm import Session
 
 from app.models.actividad import Actividad
 
 
+class ActividadCatalogo(NamedTuple):
+    """Datos de catálogo de una actividad, independientes de la sesión."""
+
+    id: str
+    id_punto: str
+    nombre: str
+
+
 class ActividadRepository:
     """Repositorio para gestionar operaciones de Actividad.
 
     Proporciona queries para obtener actividades por punto.
+
+    Attributes:
+        _cache: Caché a nivel de clase de actividades por punto (caducidad, datos).
+        CACHE_TTL: Tiempo de vida de la caché en segundos.
     """
 
+    # El catálogo solo cambia con ediciones de administración
+    _cache: dict[str, tuple[float, tuple[ActividadCatalogo, ...]]] = {}
+    CACHE_TTL = 60
+
     def __init__(self, db: Session):
         """Inicializa el repositorio.
 
@@ -25,18 +44,34 @@ class ActividadRepository:
         """
         self.db = db
 
-    def get_all_by_punto(self, punto_id: str) -> list[Actividad]:
+    @classmethod
+    def clear_cache(cls):
+        """Vacía la caché del catálogo.
+
+        Debe llamarse tras crear, modificar o eliminar actividades o puntos.
+        """
+        cls._cache.clear()
+
+    def get_all_by_punto(self, punto_id: str) -> tuple[ActividadCatalogo, ...]:
         """Obtiene todas las actividades de un punto.
 
+        El resultado se cachea por punto durante CACHE_TTL segundos.
+
         Args:
             punto_id: ID del punto.
 
         Returns:
-            Lista de actividades ordenadas por nombre.
+            Tupla de actividades ordenadas por nombre.
         """
-        return (
-            self.db.query(Actividad)
+        entry = self._cache.get(punto_id)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        actividades = tuple(
+            ActividadCatalogo(*row)
+            for row in self.db.query(Actividad.id, Actividad.id_punto, Actividad.nombre)
             .filter(Actividad.id_punto == punto_id)
             .order_by(Actividad.nombre)
-            .all()
         )
+        self._cache[punto_id] = (time.monotonic() + self.CACHE_TTL, actividades)
+        return actividades
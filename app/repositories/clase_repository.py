@@ -35,7 +35,8 @@ class ClaseRepository:
         Returns:
             Clase si existe, None si no.
         """
-        return self.db.query(Clase).filter(Clase.id == clase_id).first()
+        # Session.get consulta primero el identity map: sin SQL si ya está cargada
+        return self.db.get(Clase, clase_id)
 
     def exists(self, clase_id: str) -> bool:
         """Verifica si existe una clase con el ID dado.
@@ -46,7 +47,8 @@ class ClaseRepository:
         Returns:
             True si existe, False si no.
         """
-        return self.db.query(Clase).filter(Clase.id == clase_id).first() is not None
+        # Solo la columna id: no se construye ningún objeto Clase
+        return self.db.query(Clase.id).filter(Clase.id == clase_id).first() is not None
 
     def exists_by_codigo(self, codigo: str) -> bool:
         """Verifica si existe una clase con el código dado.
@@ -57,7 +59,7 @@ class ClaseRepository:
         Returns:
             True si existe, False si no.
         """
-        return self.db.query(Clase).filter(Clase.codigo == codigo).first() is not None
+        return self.db.query(Clase.id).filter(Clase.codigo == codigo).first() is not None
 
     def get_by_codigo(self, codigo: str) -> Clase | None:
         """Obtiene una clase por su código.
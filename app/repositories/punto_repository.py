@@ -6,6 +6,9 @@ de negocio de los detalles de implementación de SQLAlchemy.
 Autor: Gernibide
 """
 
+import time
+from typing import NamedTuple
+
 from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
@@ -14,12 +17,27 @@ from app.models.juego import Partida
 from app.models.punto import Punto
 
 
+class PuntoCatalogo(NamedTuple):
+    """Datos de catálogo de un punto, independientes de la sesión."""
+
+    id: str
+    nombre: str
+
+
 class PuntoRepository:
     """Repositorio para gestionar operaciones de Punto.
 
     Proporciona queries especializadas para estadísticas de usuarios.
+
+    Attributes:
+        _cache: Caché a nivel de clase del catálogo de puntos (caducidad, datos).
+        CACHE_TTL: Tiempo de vida de la caché en segundos.
     """
 
+    # El catálogo solo cambia con ediciones de administración
+    _cache: dict[str, tuple[float, tuple[PuntoCatalogo, ...]]] = {}
+    CACHE_TTL = 60
+
     def __init__(self, db: Session):
         """Inicializa el repositorio.
 
@@ -28,13 +46,32 @@ class PuntoRepository:
         """
         self.db = db
 
-    def get_all_ordered(self) -> list[Punto]:
+    @classmethod
+    def clear_cache(cls):
+        """Vacía la caché del catálogo.
+
+        Debe llamarse tras crear, modificar o eliminar puntos.
+        """
+        cls._cache.clear()
+
+    def get_all_ordered(self) -> tuple[PuntoCatalogo, ...]:
         """Obtiene todos los puntos ordenados por nombre.
 
+        El resultado se cachea durante CACHE_TTL segundos.
+
         Returns:
-            Lista de todos los puntos ordenados alfabéticamente.
+            Tupla de todos los puntos ordenados alfabéticamente.
         """
-        return self.db.query(Punto).order_by(Punto.nombre).all()
+        entry = self._cache.get("all")
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        puntos = tuple(
+            PuntoCatalogo(*row)
+            for row in self.db.query(Punto.id, Punto.nombre).order_by(Punto.nombre)
+        )
+        self._cache["all"] = (time.monotonic() + self.CACHE_TTL, puntos)
+        return puntos
 
     def get_completed_modules_by_user(self, user_id: str) -> list[str]:
         """Obtiene nombres de módulos/puntos completados por el usuario.
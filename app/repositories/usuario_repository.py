@@ -6,10 +6,17 @@ de negocio de los detalles de implementación de SQLAlchemy.
 Autor: Gernibide
 """
 
+from datetime import datetime
+
+from sqlalchemy import Row, insert, inspect, select
 from sqlalchemy.orm import Session
 
 from app.models.usuario import Usuario
 
+# Número máximo de valores por cláusula IN en las consultas por lista (por debajo
+# del límite de 999 parámetros de SQLite anterior a 3.32)
+IN_CHUNK_SIZE = 900
+
 
 class UsuarioRepository:
     """Repositorio para gestionar operaciones CRUD de Usuario.
@@ -26,6 +33,20 @@ class UsuarioRepository:
         """
         self.db = db
 
+    def _commit_sin_expirar(self) -> None:
+        """Hace commit sin expirar los objetos de la sesión.
+
+        El modelo Usuario no tiene valores generados por el servidor, así que
+        lo que hay en memoria tras el flush coincide con la BD. Evita la SELECT
+        de refresh() (o la carga perezosa al serializar) después de cada commit.
+        """
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            self.db.commit()
+        finally:
+            self.db.expire_on_commit = expire_on_commit
+
     def get_by_id(self, usuario_id: str) -> Usuario | None:
         """Obtiene un usuario por ID.
 
@@ -35,7 +56,8 @@ class UsuarioRepository:
         Returns:
             Usuario si existe, None si no.
         """
-        return self.db.query(Usuario).filter(Usuario.id == usuario_id).first()
+        # Session.get consulta primero el identity map: sin SQL si ya está cargado
+        return self.db.get(Usuario, usuario_id)
 
     def get_by_username(self, username: str) -> Usuario | None:
         """Obtiene un usuario por username.
@@ -48,17 +70,41 @@ class UsuarioRepository:
         """
         return self.db.query(Usuario).filter(Usuario.username == username).first()
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> list[Usuario]:
+    def get_all(self, skip: int = 0, limit: int = 100, after_id: str | None = None) -> list[Row]:
         """Obtiene lista paginada de usuarios.
 
+        Devuelve filas con las columnas públicas (sin contraseña) en lugar de
+        objetos Usuario: el listado solo se serializa, así que no se hidratan
+        instancias ni se llenan el identity map. Se ordena por id para que la
+        paginación sea estable.
+
+        Con ``after_id`` la paginación es por clave (``WHERE id > :after_id``):
+        el índice de la PK posiciona directamente el inicio de la página, sin
+        leer y descartar las ``skip`` filas anteriores como hace OFFSET.
+
         Args:
             skip: Número de registros a saltar.
             limit: Número máximo de registros.
+            after_id: ID del último usuario de la página anterior (cursor).
 
         Returns:
-            Lista de usuarios.
+            Lista de filas con atributos id, username, nombre, apellido,
+            id_clase, creation y top_score.
         """
-        return self.db.query(Usuario).offset(skip).limit(limit).all()
+        stmt = select(
+            Usuario.id,
+            Usuario.username,
+            Usuario.nombre,
+            Usuario.apellido,
+            Usuario.id_clase,
+            Usuario.creation,
+            Usuario.top_score,
+        ).order_by(Usuario.id)
+        if after_id is not None:
+            stmt = stmt.where(Usuario.id > after_id)
+        if skip:
+            stmt = stmt.offset(skip)
+        return list(self.db.execute(stmt.limit(limit)))
 
     def create(self, usuario: Usuario) -> Usuario:
         """Crea un nuevo usuario.
@@ -70,8 +116,9 @@ class UsuarioRepository:
             Usuario creado con datos actualizados.
         """
         self.db.add(usuario)
-        self.db.commit()
-        self.db.refresh(usuario)
+        # Los valores por defecto (creation, top_score) se calculan en Python y
+        # quedan en el objeto tras el flush: no hace falta refresh()
+        self._commit_sin_expirar()
         return usuario
 
     def update(self, usuario: Usuario) -> Usuario:
@@ -83,8 +130,7 @@ class UsuarioRepository:
         Returns:
             Usuario actualizado.
         """
-        self.db.commit()
-        self.db.refresh(usuario)
+        self._commit_sin_expirar()
         return usuario
 
     def delete(self, usuario: Usuario) -> None:
@@ -105,12 +151,15 @@ class UsuarioRepository:
         Returns:
             True si existe, False si no.
         """
-        return self.db.query(Usuario).filter(Usuario.username == username).first() is not None
+        # Solo la columna id: no se construye ningún objeto Usuario
+        return self.db.query(Usuario.id).filter(Usuario.username == username).first() is not None
 
     def get_by_usernames(self, usernames: list[str]) -> list[Usuario]:
         """Obtiene usuarios por lista de usernames.
 
-        Útil para validar duplicados en importación bulk.
+        Para comprobar solo qué usernames existen (p. ej. en la importación
+        bulk) es más barato :meth:`get_existing_usernames`. La lista se divide
+        en bloques de ``IN_CHUNK_SIZE`` y una lista vacía no consulta la BD.
 
         Args:
             usernames: Lista de usernames a buscar.
@@ -118,11 +167,44 @@ class UsuarioRepository:
         Returns:
             Lista de usuarios encontrados.
         """
-        return self.db.query(Usuario).filter(Usuario.username.in_(usernames)).all()
+        usuarios: list[Usuario] = []
+        for i in range(0, len(usernames), IN_CHUNK_SIZE):
+            bloque = usernames[i : i + IN_CHUNK_SIZE]
+            usuarios.extend(self.db.query(Usuario).filter(Usuario.username.in_(bloque)))
+        return usuarios
+
+    def get_existing_usernames(self, usernames: list[str]) -> set[str]:
+        """Obtiene cuáles de los usernames dados ya existen en la BD.
+
+        Solo lee la columna ``username`` (sin construir objetos Usuario) y
+        divide la lista en bloques de ``IN_CHUNK_SIZE`` para no enviar
+        consultas con miles de parámetros.
+
+        Args:
+            usernames: Lista de usernames a buscar.
+
+        Returns:
+            Conjunto con los usernames que ya existen.
+        """
+        existentes: set[str] = set()
+        for i in range(0, len(usernames), IN_CHUNK_SIZE):
+            bloque = usernames[i : i + IN_CHUNK_SIZE]
+            existentes.update(
+                username
+                for (username,) in self.db.query(Usuario.username).filter(
+                    Usuario.username.in_(bloque)
+                )
+            )
+        return existentes
 
     def bulk_create(self, usuarios: list[Usuario]) -> list[Usuario]:
         """Crea múltiples usuarios de forma transaccional.
 
+        Se insertan con un único ``INSERT`` por lotes (insertmanyvalues) en
+        lugar de un flush de la unidad de trabajo por objeto, y sin volver a
+        leerlos: todos los valores (id, fecha de creación, puntuación) se fijan
+        en Python antes de insertar.
+
         Args:
             usuarios: Lista de instancias de Usuario a crear.
 
@@ -132,9 +214,19 @@ class UsuarioRepository:
         Note:
             Si falla, el caller debe hacer rollback.
         """
+        ahora = datetime.now()
         for usuario in usuarios:
-            self.db.add(usuario)
+            if usuario.creation is None:
+                usuario.creation = ahora
+            if usuario.top_score is None:
+                usuario.top_score = 0
+
+        columnas = [attr.key for attr in inspect(Usuario).column_attrs]
+        self.db.execute(
+            insert(Usuario),
+            [{columna: getattr(usuario, columna) for columna in columnas} for usuario in usuarios],
+        )
         self.db.commit()
-        for usuario in usuarios:
-            self.db.refresh(usuario)
+        # Los objetos no se añaden a la sesión: el commit no los expira y se
+        # devuelven con sus valores sin ninguna SELECT adicional
         return usuarios
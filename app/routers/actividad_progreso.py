@@ -10,8 +10,10 @@ import uuid
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.logging import log_with_context
 from app.models.actividad import Actividad as ActividadModel
@@ -26,6 +28,7 @@ from app.schemas.actividad_progreso import (
     ActividadProgresoUpdate,
     PuntoResumen,
 )
+from app.schemas.common import UUIDStr
 from app.utils.dependencies import (
     AuthResult,
     require_api_key_only,
@@ -33,7 +36,7 @@ from app.utils.dependencies import (
     validate_partida_ownership,
 )
 
-router = APIRouter(prefix="/actividad-progreso", tags=["📊 Progreso"])
+router = APIRouter(prefix=f"{settings.API_V1_PREFIX}/actividad-progreso", tags=["📊 Progreso"])
 
 
 @router.post("/iniciar", response_model=ActividadProgresoResponse)
@@ -63,15 +66,19 @@ def iniciar_actividad(
     """
     validate_partida_ownership(auth, estado_data.id_juego, db)
 
-    punto = db.query(Punto).filter(Punto.id == estado_data.id_punto).first()
-    if not punto:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="El punto especificado no existe",
-        )
-
+    # Una sola consulta: la actividad (que debe pertenecer al punto) y, si lo hay,
+    # su progreso "en_progreso" en esta partida. Si la actividad es del punto, el
+    # punto existe (FK), así que solo se consulta el punto para elegir el error
     actividad = (
-        db.query(ActividadModel)
+        db.query(ActividadModel.id, ActividadProgreso)
+        .outerjoin(
+            ActividadProgreso,
+            and_(
+                ActividadProgreso.id_actividad == ActividadModel.id,
+                ActividadProgreso.id_juego == estado_data.id_juego,
+                ActividadProgreso.estado == "en_progreso",
+            ),
+        )
         .filter(
             ActividadModel.id == estado_data.id_actividad,
             ActividadModel.id_punto == estado_data.id_punto,
@@ -79,21 +86,17 @@ def iniciar_actividad(
         .first()
     )
     if not actividad:
+        if not db.query(Punto.id).filter(Punto.id == estado_data.id_punto).first():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="El punto especificado no existe",
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="La actividad especificada no existe o no pertenece a este punto",
         )
 
-    # Buscar si ya existe un progreso "en_progreso"
-    progreso_existente = (
-        db.query(ActividadProgreso)
-        .filter(
-            ActividadProgreso.id_juego == estado_data.id_juego,
-            ActividadProgreso.id_actividad == estado_data.id_actividad,
-            ActividadProgreso.estado == "en_progreso",
-        )
-        .first()
-    )
+    progreso_existente = actividad.ActividadProgreso
 
     # Si ya existe en progreso, devolverlo (IDEMPOTENTE)
     if progreso_existente:
@@ -132,7 +135,7 @@ def iniciar_actividad(
 
 @router.put("/{estado_id}/completar", response_model=ActividadProgresoResponse)
 def completar_actividad(
-    estado_id: str,
+    estado_id: UUIDStr,
     data: ActividadProgresoCompletar,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
@@ -250,8 +253,8 @@ def completar_actividad(
 
 @router.get("/punto/{id_juego}/{id_punto}/resumen", response_model=PuntoResumen)
 def obtener_resumen_punto(
-    id_juego: str,
-    id_punto: str,
+    id_juego: UUIDStr,
+    id_punto: UUIDStr,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
 ):
@@ -393,7 +396,7 @@ def listar_actividad_progresos(skip: int = 0, limit: int = 100, db: Session = De
 
 @router.get("/{estado_id}", response_model=ActividadProgresoResponse)
 def obtener_actividad_progreso(
-    estado_id: str,
+    estado_id: UUIDStr,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
 ):
@@ -417,7 +420,7 @@ def obtener_actividad_progreso(
 
 @router.put("/{estado_id}", response_model=ActividadProgresoResponse)
 def actualizar_actividad_progreso(
-    estado_id: str,
+    estado_id: UUIDStr,
     estado_data: ActividadProgresoUpdate,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
@@ -461,8 +464,8 @@ def actualizar_actividad_progreso(
 
 @router.post("/punto/{id_juego}/{id_punto}/reset", status_code=status.HTTP_200_OK)
 def resetear_punto(
-    id_juego: str,
-    id_punto: str,
+    id_juego: UUIDStr,
+    id_punto: UUIDStr,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
 ):
@@ -531,7 +534,7 @@ def resetear_punto(
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(require_api_key_only)],
 )
-def eliminar_actividad_progreso(estado_id: str, db: Session = Depends(get_db)):
+def eliminar_actividad_progreso(estado_id: UUIDStr, db: Session = Depends(get_db)):
     """Eliminar un progreso de actividad. Requiere API Key."""
     estado = db.query(ActividadProgreso).filter(ActividadProgreso.id == estado_id).first()
     if not estado:
@@ -11,6 +11,7 @@ import uuid
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.logging import log_with_context
 from app.models.actividad import Actividad
@@ -18,6 +19,7 @@ from app.models.actividad_progreso import ActividadProgreso
 from app.models.juego import Partida
 from app.models.punto import Punto
 from app.models.usuario import Usuario
+from app.repositories.actividad_repository import ActividadRepository
 from app.schemas.actividad import (
     ActividadCreate,
     ActividadResponse,
@@ -25,9 +27,10 @@ from app.schemas.actividad import (
     RespuestaPublica,
     RespuestasPublicasResponse,
 )
+from app.schemas.common import UUIDStr
 from app.utils.dependencies import require_api_key_only, require_auth
 
-router = APIRouter(prefix="/actividades", tags=["📝 Actividades"])
+router = APIRouter(prefix=f"{settings.API_V1_PREFIX}/actividades", tags=["📝 Actividades"])
 
 
 @router.post(
@@ -38,7 +41,7 @@ router = APIRouter(prefix="/actividades", tags=["📝 Actividades"])
 )
 def crear_actividad(actividad_data: ActividadCreate, db: Session = Depends(get_db)):
     """Crear una nueva actividad. Requiere API Key."""
-    punto = db.query(Punto).filter(Punto.id == actividad_data.id_punto).first()
+    punto = db.query(Punto.id).filter(Punto.id == actividad_data.id_punto).first()
     if not punto:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -54,6 +57,7 @@ def crear_actividad(actividad_data: ActividadCreate, db: Session = Depends(get_d
     db.add(nueva_actividad)
     db.commit()
     db.refresh(nueva_actividad)
+    ActividadRepository.clear_cache()
 
     log_with_context(
         "info", "Actividad creada", actividad_id=nueva_actividad.id, nombre=nueva_actividad.nombre
@@ -83,7 +87,7 @@ def listar_actividades(
     dependencies=[Depends(require_api_key_only)],
 )
 def obtener_actividad(
-    actividad_id: str,
+    actividad_id: UUIDStr,
     db: Session = Depends(get_db),
 ):
     """Obtener una actividad por ID. Requiere API Key."""
@@ -99,7 +103,7 @@ def obtener_actividad(
     dependencies=[Depends(require_api_key_only)],
 )
 def actualizar_actividad(
-    actividad_id: str,
+    actividad_id: UUIDStr,
     actividad_data: ActividadUpdate,
     db: Session = Depends(get_db),
 ):
@@ -109,7 +113,7 @@ def actualizar_actividad(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Actividad no encontrada")
 
     if actividad_data.id_punto:
-        punto = db.query(Punto).filter(Punto.id == actividad_data.id_punto).first()
+        punto = db.query(Punto.id).filter(Punto.id == actividad_data.id_punto).first()
         if not punto:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -122,6 +126,7 @@ def actualizar_actividad(
 
     db.commit()
     db.refresh(actividad)
+    ActividadRepository.clear_cache()
 
     log_with_context("info", "Actividad actualizada", actividad_id=actividad.id)
 
@@ -135,7 +140,7 @@ def actualizar_actividad(
     description="Returns public responses (messages) from students who completed the activity",
 )
 def obtener_respuestas_publicas(
-    actividad_id: str,
+    actividad_id: UUIDStr,
     limit: int = Query(20, ge=1, le=100, description="Maximum number of responses to return"),
     db: Session = Depends(get_db),
     auth=Depends(require_auth),
@@ -225,7 +230,7 @@ def obtener_respuestas_publicas(
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(require_api_key_only)],
 )
-def eliminar_actividad(actividad_id: str, db: Session = Depends(get_db)):
+def eliminar_actividad(actividad_id: UUIDStr, db: Session = Depends(get_db)):
     """Eliminar una actividad. Requiere API Key."""
     actividad = db.query(Actividad).filter(Actividad.id == actividad_id).first()
     if not actividad:
@@ -233,5 +238,6 @@ def eliminar_actividad(actividad_id: str, db: Session = Depends(get_db)):
 
     db.delete(actividad)
     db.commit()
+    ActividadRepository.clear_cache()
 
     log_with_context("info", "Actividad eliminada", actividad_id=actividad_id)
@@ -10,13 +10,15 @@ Autor: Gernibide
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.logging import log_with_context
 from app.models.audit_log import AuditLog
 from app.schemas.audit_log import AuditLogResponse
+from app.schemas.common import UUIDStr
 from app.utils.dependencies import AuthResult, require_auth
 
-router = APIRouter(prefix="/audit-logs", tags=["📋 Audit Logs"])
+router = APIRouter(prefix=f"{settings.API_V1_PREFIX}/audit-logs", tags=["📋 Audit Logs"])
 
 # Los audit logs se crean automáticamente por el sistema (login, completar puntos, etc.)
 # Solo se pueden leer, no crear ni eliminar manualmente
@@ -28,8 +30,8 @@ def listar_audit_logs(
     limit: int = Query(100, ge=1, le=500),
     tipo: str = Query(None, description="Filtrar por tipo: 'web' o 'app'"),
     accion: str = Query(None, description="Filtrar por acción"),
-    usuario_id: str = Query(None, description="Filtrar por usuario"),
-    profesor_id: str = Query(None, description="Filtrar por profesor"),
+    usuario_id: UUIDStr | None = Query(None, description="Filtrar por usuario"),
+    profesor_id: UUIDStr | None = Query(None, description="Filtrar por profesor"),
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
 ):
@@ -62,7 +64,7 @@ def listar_audit_logs(
 
 @router.get("/{log_id}", response_model=AuditLogResponse)
 def obtener_audit_log(
-    log_id: str,
+    log_id: UUIDStr,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
 ):
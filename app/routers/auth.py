@@ -63,7 +63,7 @@ class LoginProfesorResponse(BaseModel):
 
 
 router = APIRouter(
-    prefix="/auth",
+    prefix=f"{settings.API_V1_PREFIX}/auth",
     tags=["🔐 Autenticación"],
     responses={
         401: {"description": "Credenciales inválidas"},
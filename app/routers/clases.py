@@ -13,6 +13,7 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.logging import log_info, log_warning
 from app.models.audit_log import AuditLogWeb
@@ -20,10 +21,11 @@ from app.models.clase import Clase
 from app.models.profesor import Profesor
 from app.repositories.clase_repository import ClaseRepository
 from app.schemas.clase import ClaseCreate, ClaseResponse, ClaseUpdate
+from app.schemas.common import UUIDStr
 from app.utils.dependencies import AuthResult, require_auth
 from app.utils.security import generar_codigo_clase
 
-router = APIRouter(prefix="/clases", tags=["🏫 Clases"])
+router = APIRouter(prefix=f"{settings.API_V1_PREFIX}/clases", tags=["🏫 Clases"])
 
 
 @router.post("", response_model=ClaseResponse, status_code=status.HTTP_201_CREATED)
@@ -126,7 +128,7 @@ def listar_clases(
 
 @router.get("/{clase_id}", response_model=ClaseResponse)
 def obtener_clase(
-    clase_id: str,
+    clase_id: UUIDStr,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
 ):
@@ -151,7 +153,7 @@ def obtener_clase(
 
 @router.put("/{clase_id}", response_model=ClaseResponse)
 def actualizar_clase(
-    clase_id: str,
+    clase_id: UUIDStr,
     clase_data: ClaseUpdate,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
@@ -163,7 +165,7 @@ def actualizar_clase(
 
     # Validar profesor si se proporciona
     if clase_data.id_profesor:
-        profesor = db.query(Profesor).filter(Profesor.id == clase_data.id_profesor).first()
+        profesor = db.query(Profesor.id).filter(Profesor.id == clase_data.id_profesor).first()
         if not profesor:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -206,7 +208,7 @@ def actualizar_clase(
 
 @router.delete("/{clase_id}", status_code=status.HTTP_204_NO_CONTENT)
 def eliminar_clase(
-    clase_id: str,
+    clase_id: UUIDStr,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
 ):
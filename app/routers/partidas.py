@@ -11,10 +11,12 @@ import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.logging import log_with_context
 from app.models.juego import Partida
 from app.models.usuario import Usuario
+from app.schemas.common import UUIDStr
 from app.schemas.partida import PartidaCreate, PartidaResponse, PartidaUpdate
 from app.utils.dependencies import (
     AuthResult,
@@ -23,12 +25,12 @@ from app.utils.dependencies import (
     validate_user_ownership,
 )
 
-router = APIRouter(prefix="/partidas", tags=["🎮 Partidas"])
+router = APIRouter(prefix=f"{settings.API_V1_PREFIX}/partidas", tags=["🎮 Partidas"])
 
 
 @router.get("/activa/usuario/{usuario_id}", response_model=PartidaResponse)
 def obtener_partida_activa(
-    usuario_id: str,
+    usuario_id: UUIDStr,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
 ):
@@ -42,7 +44,7 @@ def obtener_partida_activa(
     """
     validate_user_ownership(auth, usuario_id)
 
-    usuario = db.query(Usuario).filter(Usuario.id == usuario_id).first()
+    usuario = db.query(Usuario.id).filter(Usuario.id == usuario_id).first()
     if not usuario:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -69,7 +71,7 @@ def obtener_partida_activa(
 
 @router.post("/activa/usuario/{usuario_id}/obtener-o-crear", response_model=PartidaResponse)
 def obtener_o_crear_partida_activa(
-    usuario_id: str,
+    usuario_id: UUIDStr,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
 ):
@@ -84,7 +86,7 @@ def obtener_o_crear_partida_activa(
     """
     validate_user_ownership(auth, usuario_id)
 
-    usuario = db.query(Usuario).filter(Usuario.id == usuario_id).first()
+    usuario = db.query(Usuario.id).filter(Usuario.id == usuario_id).first()
     if not usuario:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -141,7 +143,7 @@ def crear_partida(
 
     Restricción: Un usuario solo puede tener una partida activa a la vez.
     """
-    usuario = db.query(Usuario).filter(Usuario.id == partida_data.id_usuario).first()
+    usuario = db.query(Usuario.id).filter(Usuario.id == partida_data.id_usuario).first()
     if not usuario:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -195,7 +197,7 @@ def listar_partidas(skip: int = 0, limit: int = 100, db: Session = Depends(get_d
 
 @router.get("/{partida_id}", response_model=PartidaResponse)
 def obtener_partida(
-    partida_id: str,
+    partida_id: UUIDStr,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
 ):
@@ -216,7 +218,7 @@ def obtener_partida(
 
 @router.put("/{partida_id}", response_model=PartidaResponse)
 def actualizar_partida(
-    partida_id: str,
+    partida_id: UUIDStr,
     partida_data: PartidaUpdate,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
@@ -261,7 +263,7 @@ def actualizar_partida(
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(require_api_key_only)],
 )
-def eliminar_partida(partida_id: str, db: Session = Depends(get_db)):
+def eliminar_partida(partida_id: UUIDStr, db: Session = Depends(get_db)):
     """Eliminar una partida. Requiere API Key."""
     partida = db.query(Partida).filter(Partida.id == partida_id).first()
     if not partida:
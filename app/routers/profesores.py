@@ -12,15 +12,18 @@ import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
+from app.dependencies import invalidate_profesor_cache
 from app.logging import log_with_context
 from app.models.profesor import Profesor
+from app.schemas.common import UUIDStr
 from app.schemas.profesor import ProfesorCreate, ProfesorResponse, ProfesorUpdate
 from app.utils.dependencies import require_api_key_only
 from app.utils.security import hash_password
 
 router = APIRouter(
-    prefix="/profesores",
+    prefix=f"{settings.API_V1_PREFIX}/profesores",
     tags=["👨‍🏫 Profesores"],
     dependencies=[Depends(require_api_key_only)],
 )
@@ -41,7 +44,7 @@ def crear_profesor(profesor_data: ProfesorCreate, db: Session = Depends(get_db))
         HTTPException: Si el username ya está en uso.
     """
     # Validar que el username no exista
-    existe = db.query(Profesor).filter(Profesor.username == profesor_data.username).first()
+    existe = db.query(Profesor.id).filter(Profesor.username == profesor_data.username).first()
     if existe:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="El username ya está en uso"
@@ -87,7 +90,7 @@ def listar_profesores(skip: int = 0, limit: int = 100, db: Session = Depends(get
 
 
 @router.get("/{profesor_id}", response_model=ProfesorResponse)
-def obtener_profesor(profesor_id: str, db: Session = Depends(get_db)):
+def obtener_profesor(profesor_id: UUIDStr, db: Session = Depends(get_db)):
     """Obtener un profesor por ID.
 
     Args:
@@ -108,7 +111,7 @@ def obtener_profesor(profesor_id: str, db: Session = Depends(get_db)):
 
 @router.put("/{profesor_id}", response_model=ProfesorResponse)
 def actualizar_profesor(
-    profesor_id: str, profesor_data: ProfesorUpdate, db: Session = Depends(get_db)
+    profesor_id: UUIDStr, profesor_data: ProfesorUpdate, db: Session = Depends(get_db)
 ):
     """Actualizar un profesor existente.
 
@@ -129,7 +132,7 @@ def actualizar_profesor(
 
     # Validar username único si se está actualizando
     if profesor_data.username and profesor_data.username != profesor.username:
-        existe = db.query(Profesor).filter(Profesor.username == profesor_data.username).first()
+        existe = db.query(Profesor.id).filter(Profesor.username == profesor_data.username).first()
         if existe:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -141,11 +144,13 @@ def actualizar_profesor(
     if "password" in update_data:
         update_data["password"] = hash_password(update_data["password"])
 
+    previous_username = profesor.username
     for field, value in update_data.items():
         setattr(profesor, field, value)
 
     db.commit()
     db.refresh(profesor)
+    invalidate_profesor_cache(previous_username)
 
     log_with_context("info", "Profesor actualizado", profesor_id=profesor.id)
 
@@ -153,7 +158,7 @@ def actualizar_profesor(
 
 
 @router.delete("/{profesor_id}", status_code=status.HTTP_204_NO_CONTENT)
-def eliminar_profesor(profesor_id: str, db: Session = Depends(get_db)):
+def eliminar_profesor(profesor_id: UUIDStr, db: Session = Depends(get_db)):
     """Eliminar un profesor del sistema.
 
     Args:
@@ -167,7 +172,9 @@ def eliminar_profesor(profesor_id: str, db: Session = Depends(get_db)):
     if not profesor:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profesor no encontrado")
 
+    username = profesor.username
     db.delete(profesor)
     db.commit()
+    invalidate_profesor_cache(username)
 
     log_with_context("info", "Profesor eliminado", profesor_id=profesor_id)
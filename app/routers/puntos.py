@@ -11,13 +11,17 @@ import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.logging import log_with_context
 from app.models.punto import Punto
+from app.repositories.actividad_repository import ActividadRepository
+from app.repositories.punto_repository import PuntoRepository
+from app.schemas.common import UUIDStr
 from app.schemas.punto import PuntoCreate, PuntoResponse, PuntoUpdate
 from app.utils.dependencies import require_api_key_only
 
-router = APIRouter(prefix="/puntos", tags=["📍 Puntos"])
+router = APIRouter(prefix=f"{settings.API_V1_PREFIX}/puntos", tags=["📍 Puntos"])
 
 
 @router.post(
@@ -33,6 +37,7 @@ def crear_punto(punto_data: PuntoCreate, db: Session = Depends(get_db)):
     db.add(nuevo_punto)
     db.commit()
     db.refresh(nuevo_punto)
+    PuntoRepository.clear_cache()
 
     log_with_context(
         "info",
@@ -65,7 +70,7 @@ def listar_puntos(
     dependencies=[Depends(require_api_key_only)],
 )
 def obtener_punto(
-    punto_id: str,
+    punto_id: UUIDStr,
     db: Session = Depends(get_db),
 ):
     """Obtener un punto por ID. Requiere API Key."""
@@ -80,7 +85,7 @@ def obtener_punto(
     response_model=PuntoResponse,
     dependencies=[Depends(require_api_key_only)],
 )
-def actualizar_punto(punto_id: str, punto_data: PuntoUpdate, db: Session = Depends(get_db)):
+def actualizar_punto(punto_id: UUIDStr, punto_data: PuntoUpdate, db: Session = Depends(get_db)):
     """Actualizar un punto existente. Requiere API Key."""
     punto = db.query(Punto).filter(Punto.id == punto_id).first()
     if not punto:
@@ -92,6 +97,7 @@ def actualizar_punto(punto_id: str, punto_data: PuntoUpdate, db: Session = Depen
 
     db.commit()
     db.refresh(punto)
+    PuntoRepository.clear_cache()
 
     log_with_context("info", "Punto actualizado", punto_id=punto.id)
 
@@ -103,7 +109,7 @@ def actualizar_punto(punto_id: str, punto_data: PuntoUpdate, db: Session = Depen
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(require_api_key_only)],
 )
-def eliminar_punto(punto_id: str, db: Session = Depends(get_db)):
+def eliminar_punto(punto_id: UUIDStr, db: Session = Depends(get_db)):
     """Eliminar un punto. Requiere API Key."""
     punto = db.query(Punto).filter(Punto.id == punto_id).first()
     if not punto:
@@ -111,5 +117,7 @@ def eliminar_punto(punto_id: str, db: Session = Depends(get_db)):
 
     db.delete(punto)
     db.commit()
+    PuntoRepository.clear_cache()
+    ActividadRepository.clear_cache()
 
     log_with_context("info", "Punto eliminado", punto_id=punto_id)
@@ -25,6 +25,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.dependencies import get_current_user_from_token
 from app.logging.logger import log_info, log_with_context
+from app.schemas.common import UUIDStr
 from app.services.teacher_dashboard_service import TeacherDashboardService
 
 router = APIRouter(
@@ -67,16 +68,11 @@ def get_profesor_classes(
 
     clases = TeacherDashboardService.get_profesor_classes(db, profesor_id)
 
-    # Log detallado para debug
-    from app.models.clase import Clase
-
-    clases_db = db.query(Clase).filter(Clase.id_profesor == profesor_id).all()
     log_info(
-        f"Clases de profesor consultadas - profesor_id={profesor_id}, "
-        f"total_clases={len(clases)}, "
-        f"clases_nombres={[c['nombre'] for c in clases]}, "
-        f"clases_ids={[c['id'] for c in clases]}, "
-        f"db_clases_count={len(clases_db)}"
+        "Clases de profesor consultadas",
+        profesor_id=profesor_id,
+        total_clases=len(clases),
+        clases_ids=[c["id"] for c in clases],
     )
 
     return clases
@@ -89,7 +85,9 @@ def get_profesor_classes(
     description="Returns summary metrics for a class: students, progress, time, grade",
 )
 def get_class_summary(
-    clase_id: str = Query(None, description="Optional class ID (if None, aggregates all classes)"),
+    clase_id: UUIDStr | None = Query(
+        None, description="Optional class ID (if None, aggregates all classes)"
+    ),
     days: int = Query(7, ge=1, le=365, description="Number of days to look back"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_from_token),
@@ -138,7 +136,7 @@ def get_class_summary(
     description="Returns progress percentage for each student",
 )
 def get_student_progress(
-    clase_id: str = Query(None, description="Optional class ID"),
+    clase_id: UUIDStr | None = Query(None, description="Optional class ID"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_from_token),
 ) -> dict[str, list]:
@@ -180,7 +178,7 @@ def get_student_progress(
     description="Returns time spent for each student",
 )
 def get_student_time(
-    clase_id: str = Query(None, description="Optional class ID"),
+    clase_id: UUIDStr | None = Query(None, description="Optional class ID"),
     days: int = Query(7, ge=1, le=365, description="Number of days to look back"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_from_token),
@@ -225,7 +223,7 @@ def get_student_time(
     description="Returns activity completion status (completed, in progress, not started)",
 )
 def get_activities_by_class(
-    clase_id: str = Query(None, description="Optional class ID"),
+    clase_id: UUIDStr | None = Query(None, description="Optional class ID"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_from_token),
 ) -> dict[str, Any]:
@@ -269,7 +267,7 @@ def get_activities_by_class(
     description="Returns progress and grade evolution over time",
 )
 def get_class_evolution(
-    clase_id: str = Query(None, description="Optional class ID"),
+    clase_id: UUIDStr | None = Query(None, description="Optional class ID"),
     days: int = Query(14, ge=1, le=365, description="Number of days to retrieve"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_from_token),
@@ -315,7 +313,7 @@ def get_class_evolution(
     description="Returns detailed list of students with progress, time, and grades",
 )
 def get_students_list(
-    clase_id: str = Query(None, description="Optional class ID"),
+    clase_id: UUIDStr | None = Query(None, description="Optional class ID"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_from_token),
 ) -> list[dict[str, Any]]:
@@ -374,7 +372,7 @@ def get_students_list(
     description="Downloads students list as CSV file",
 )
 def export_students_csv(
-    clase_id: str = Query(None, description="Optional class ID"),
+    clase_id: UUIDStr | None = Query(None, description="Optional class ID"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_from_token),
 ):
@@ -424,7 +422,7 @@ def export_students_csv(
     description="Downloads students list as Excel file",
 )
 def export_students_excel(
-    clase_id: str = Query(None, description="Optional class ID"),
+    clase_id: UUIDStr | None = Query(None, description="Optional class ID"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_from_token),
 ):
@@ -510,7 +508,7 @@ def clear_teacher_dashboard_cache(
     description="Returns images (Cloudinary URLs) from student activity responses",
 )
 def get_gallery(
-    clase_id: str = Query(None, description="Optional class ID to filter"),
+    clase_id: UUIDStr | None = Query(None, description="Optional class ID to filter"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_from_token),
 ) -> list[dict[str, Any]]:
@@ -558,7 +556,7 @@ def get_gallery(
     description="Returns text messages from student activity responses",
 )
 def get_message_wall(
-    clase_id: str = Query(None, description="Optional class ID to filter"),
+    clase_id: UUIDStr | None = Query(None, description="Optional class ID to filter"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_from_token),
 ) -> list[dict[str, Any]]:
@@ -19,14 +19,17 @@ Autor: Gernibide
 
 import uuid
 from datetime import datetime
+from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.logging import log_info, log_warning
 from app.models.audit_log import AuditLogWeb
 from app.repositories.clase_repository import ClaseRepository
+from app.schemas.common import UUIDStr
 from app.schemas.usuario import (
     PerfilProgreso,
     UsuarioBulkCreate,
@@ -51,7 +54,7 @@ from app.utils.dependencies import (
 )
 
 router = APIRouter(
-    prefix="/usuarios",
+    prefix=f"{settings.API_V1_PREFIX}/usuarios",
     tags=["👥 Usuarios"],
     responses={
         404: {"description": "Usuario no encontrado"},
@@ -207,22 +210,28 @@ def crear_usuarios_bulk(
 def listar_usuarios(
     skip: int = Query(0, ge=0, description="Número de registros a saltar (para paginación)"),
     limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros a retornar"),
+    after_id: UUIDStr | None = Query(
+        None, description="ID del último usuario de la página anterior (paginación por cursor)"
+    ),
     usuario_service: UsuarioService = Depends(get_usuario_service),
 ):
     """
     ## Listar Todos los Usuarios
 
-    Retorna una lista paginada de usuarios. Requiere API Key.
+    Retorna una lista paginada de usuarios ordenada por ID. Requiere API Key.
 
     ### Paginación
     - **skip**: Número de registros a saltar (default: 0)
     - **limit**: Número máximo de registros (default: 100, max: 1000)
+    - **after_id**: Cursor; devuelve los usuarios posteriores a este ID.
+      Más eficiente que `skip` en páginas altas
 
     ### Ejemplo
     - Para obtener los primeros 10: `?skip=0&limit=10`
     - Para obtener la segunda página: `?skip=10&limit=10`
+    - Por cursor: `?after_id=<id del último usuario recibido>&limit=10`
     """
-    return usuario_service.listar_usuarios(skip, limit)
+    return usuario_service.listar_usuarios(skip, limit, after_id)
 
 
 @router.get(
@@ -232,7 +241,7 @@ def listar_usuarios(
     description="Obtiene los detalles de un usuario específico por su ID.",
 )
 def obtener_usuario(
-    usuario_id: str = Path(..., description="ID único del usuario (UUID)"),
+    usuario_id: Annotated[UUIDStr, Path(description="ID único del usuario (UUID)")],
     auth: AuthResult = Depends(require_auth),
     usuario_service: UsuarioService = Depends(get_usuario_service),
 ):
@@ -260,7 +269,7 @@ def obtener_usuario(
 
 @router.put("/{usuario_id}", response_model=UsuarioResponse)
 def actualizar_usuario(
-    usuario_id: str,
+    usuario_id: UUIDStr,
     usuario_data: UsuarioUpdate,
     auth: AuthResult = Depends(require_auth),
     usuario_service: UsuarioService = Depends(get_usuario_service),
@@ -293,7 +302,7 @@ def actualizar_usuario(
 
 @router.post("/{usuario_id}/remove-from-class", status_code=status.HTTP_204_NO_CONTENT)
 def remover_alumno_de_clase(
-    usuario_id: str,
+    usuario_id: UUIDStr,
     db: Session = Depends(get_db),
     auth: AuthResult = Depends(require_auth),
     usuario_service: UsuarioService = Depends(get_usuario_service),
@@ -318,8 +327,10 @@ def remover_alumno_de_clase(
 
     # Log de inicio ANTES de cualquier validación
     log_info(
-        f"=== INICIO remover_alumno_de_clase === usuario_id={usuario_id}, "
-        f"is_api_key={auth.is_api_key}, profesor_id={auth.user_id if not auth.is_api_key else 'N/A'}"
+        "=== INICIO remover_alumno_de_clase ===",
+        usuario_id=usuario_id,
+        is_api_key=auth.is_api_key,
+        profesor_id=auth.user_id if not auth.is_api_key else "N/A",
     )
 
     # Si es JWT token (profesor), verificar que el alumno está en una de sus clases
@@ -329,8 +340,10 @@ def remover_alumno_de_clase(
 
         # Log de debug
         log_info(
-            f"Intentando remover alumno - alumno_id={usuario_id}, "
-            f"clase_id={alumno.id_clase}, profesor_id={auth.user_id}"
+            "Intentando remover alumno",
+            alumno_id=usuario_id,
+            clase_id=alumno.id_clase,
+            profesor_id=auth.user_id,
         )
 
         # Verificar que el alumno tiene clase asignada
@@ -349,10 +362,12 @@ def remover_alumno_de_clase(
         clase = clase_repo.get_by_id(alumno.id_clase)
         if not clase or clase.id_profesor != auth.user_id:
             log_warning(
-                f"Profesor sin permisos - alumno_id={usuario_id}, "
-                f"clase_id={alumno.id_clase}, profesor_id={auth.user_id}, "
-                f"clase_profesor_id={clase.id_profesor if clase else 'NULL'}, "
-                f"clase_existe={clase is not None}"
+                "Profesor sin permisos",
+                alumno_id=usuario_id,
+                clase_id=alumno.id_clase,
+                profesor_id=auth.user_id,
+                clase_profesor_id=clase.id_profesor if clase else "NULL",
+                clase_existe=clase is not None,
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -379,7 +394,7 @@ def remover_alumno_de_clase(
     dependencies=[Depends(require_api_key_only)],
 )
 def eliminar_usuario(
-    usuario_id: str,
+    usuario_id: UUIDStr,
     usuario_service: UsuarioService = Depends(get_usuario_service),
 ):
     """Eliminar un usuario del sistema.
@@ -404,7 +419,7 @@ def eliminar_usuario(
     description="Obtiene estadísticas detalladas para el perfil del usuario en la app móvil",
 )
 def obtener_estadisticas_usuario(
-    usuario_id: str = Path(..., description="ID único del usuario (UUID)"),
+    usuario_id: Annotated[UUIDStr, Path(description="ID único del usuario (UUID)")],
     auth: AuthResult = Depends(require_auth),
     usuario_service: UsuarioService = Depends(get_usuario_service),
     stats_service: UsuarioStatsService = Depends(get_usuario_stats_service),
@@ -446,7 +461,7 @@ def obtener_estadisticas_usuario(
     description="Obtiene el perfil completo con progreso detallado de todas las actividades para la app móvil",
 )
 def obtener_perfil_progreso(
-    usuario_id: str = Path(..., description="ID único del usuario (UUID)"),
+    usuario_id: Annotated[UUIDStr, Path(description="ID único del usuario (UUID)")],
     auth: AuthResult = Depends(require_auth),
     usuario_service: UsuarioService = Depends(get_usuario_service),
     perfil_service: UsuarioPerfilService = Depends(get_usuario_perfil_service),
@@ -10,6 +10,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import UUIDStr
+
 
 class ActividadCreate(BaseModel):
     """Datos para crear una nueva actividad.
@@ -22,7 +24,7 @@ class ActividadCreate(BaseModel):
         nombre: Nombre de la actividad (1-100 caracteres).
     """
 
-    id_punto: str = Field(..., min_length=36, max_length=36)
+    id_punto: UUIDStr = Field(..., min_length=36, max_length=36)
     nombre: str = Field(..., min_length=1, max_length=100)
 
 
@@ -37,7 +39,7 @@ class ActividadUpdate(BaseModel):
         nombre: Nuevo nombre de la actividad (1-100 caracteres), opcional.
     """
 
-    id_punto: str | None = Field(None, min_length=36, max_length=36)
+    id_punto: UUIDStr | None = Field(None, min_length=36, max_length=36)
     nombre: str | None = Field(None, min_length=1, max_length=100)
 
 
@@ -10,6 +10,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import UUIDStr
+
 
 class ActividadProgresoCreate(BaseModel):
     """Datos para crear un nuevo registro de progreso de actividad.
@@ -23,9 +25,9 @@ class ActividadProgresoCreate(BaseModel):
         id_actividad: ID de la actividad educativa (UUID, 36 caracteres).
     """
 
-    id_juego: str = Field(..., min_length=36, max_length=36)
-    id_punto: str = Field(..., min_length=36, max_length=36)
-    id_actividad: str = Field(..., min_length=36, max_length=36)
+    id_juego: UUIDStr = Field(..., min_length=36, max_length=36)
+    id_punto: UUIDStr = Field(..., min_length=36, max_length=36)
+    id_actividad: UUIDStr = Field(..., min_length=36, max_length=36)
 
 
 class ActividadProgresoUpdate(BaseModel):
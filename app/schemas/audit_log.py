@@ -11,6 +11,8 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import UUIDStr
+
 
 # Schemas base
 class AuditLogBase(BaseModel):
@@ -26,8 +28,8 @@ class AuditLogBase(BaseModel):
         detalles: Información adicional sobre la acción, opcional.
     """
 
-    usuario_id: str | None = Field(None, min_length=36, max_length=36)
-    profesor_id: str | None = Field(None, min_length=36, max_length=36)
+    usuario_id: UUIDStr | None = Field(None, min_length=36, max_length=36)
+    profesor_id: UUIDStr | None = Field(None, min_length=36, max_length=36)
     accion: str = Field(..., min_length=1, max_length=100, description="Acción realizada")
     detalles: str | None = Field(None, description="Detalles adicionales de la acción")
 
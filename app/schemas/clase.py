@@ -8,6 +8,8 @@ Autor: Gernibide
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import UUIDStr
+
 
 class ClaseCreate(BaseModel):
     """Datos para crear una nueva clase.
@@ -19,7 +21,7 @@ class ClaseCreate(BaseModel):
         nombre: Nombre de la clase (1-100 caracteres).
     """
 
-    id_profesor: str = Field(..., min_length=36, max_length=36)
+    id_profesor: UUIDStr = Field(..., min_length=36, max_length=36)
     nombre: str = Field(..., min_length=1, max_length=100)
 
 
@@ -34,7 +36,7 @@ class ClaseUpdate(BaseModel):
         nombre: Nuevo nombre de la clase (1-100 caracteres), opcional.
     """
 
-    id_profesor: str | None = Field(None, min_length=36, max_length=36)
+    id_profesor: UUIDStr | None = Field(None, min_length=36, max_length=36)
     nombre: str | None = Field(None, min_length=1, max_length=100)
 
 
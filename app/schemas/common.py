@@ -0,0 +1,28 @@
+"""Tipos Pydantic compartidos por los schemas y los routers.
+
+Autor: Gernibide
+"""
+
+import uuid
+from typing import Annotated
+
+from pydantic import AfterValidator
+
+
+def _validar_uuid(value: str) -> str:
+    """Comprueba que el valor es un UUID y lo devuelve en forma canónica.
+
+    Raises:
+        ValueError: Si el valor no es un UUID válido.
+    """
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        raise ValueError("Debe ser un UUID válido") from None
+
+
+# Identificador UUID expuesto como str (los ids de la API y de los modelos son str).
+# Un valor mal formado se rechaza con 422 antes de llegar a la base de datos.
+# En parámetros de ruta con metadatos usar ``Annotated[UUIDStr, Path(...)]``:
+# con ``UUIDStr = Path(...)`` FastAPI descarta el validador.
+UUIDStr = Annotated[str, AfterValidator(_validar_uuid)]
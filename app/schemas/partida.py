@@ -10,6 +10,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import UUIDStr
+
 
 class PartidaCreate(BaseModel):
     """Datos para crear una nueva partida.
@@ -21,7 +23,7 @@ class PartidaCreate(BaseModel):
         id_usuario: ID del usuario que inicia la partida (UUID, 36 caracteres).
     """
 
-    id_usuario: str = Field(..., min_length=36, max_length=36)
+    id_usuario: UUIDStr = Field(..., min_length=36, max_length=36)
 
 
 class PartidaUpdate(BaseModel):
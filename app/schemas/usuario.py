@@ -11,6 +11,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import UUIDStr
+
 
 class LoginAppRequest(BaseModel):
     """Credenciales para autenticación de usuario.
@@ -74,7 +76,7 @@ class UsuarioCreate(BaseModel):
         description="Contraseña (será hasheada con bcrypt)",
         example="password123",
     )
-    id_clase: str | None = Field(
+    id_clase: UUIDStr | None = Field(
         None,
         description="ID de la clase asignada (opcional, usar codigo_clase es más fácil)",
         example="550e8400-e29b-41d4-a716-446655440000",
@@ -141,7 +143,7 @@ class UsuarioUpdate(BaseModel):
         description="Nueva contraseña",
         example="newpassword123",
     )
-    id_clase: str | None = Field(
+    id_clase: UUIDStr | None = Field(
         None,
         description="Nueva clase asignada",
         example="550e8400-e29b-41d4-a716-446655440000",
@@ -312,7 +314,7 @@ class UsuarioBulkCreate(BaseModel):
         description="Lista de usuarios a crear",
         min_length=1,
     )
-    id_clase: str | None = Field(
+    id_clase: UUIDStr | None = Field(
         None,
         description="ID de la clase para asignar a todos los usuarios (opcional)",
         example="550e8400-e29b-41d4-a716-446655440000",
@@ -13,8 +13,6 @@ from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import Any
 
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
 from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
 
@@ -117,6 +115,66 @@ class TeacherDashboardService:
         """
         cls._cache.clear()
 
+    @staticmethod
+    def _completed_activities_by_student(db: Session, student_ids: list[str]) -> dict[str, int]:
+        """Count distinct completed activities per student in a single GROUP BY query.
+
+        Args:
+            db: Database session for querying.
+            student_ids: IDs of the students to include.
+
+        Returns:
+            Mapping of student ID to completed activity count. Students without
+            completed activities are missing from the mapping.
+        """
+        rows = (
+            db.query(
+                Partida.id_usuario,
+                func.count(func.distinct(ActividadProgreso.id_actividad)),
+            )
+            .join(ActividadProgreso, ActividadProgreso.id_juego == Partida.id)
+            .filter(
+                and_(
+                    Partida.id_usuario.in_(student_ids),
+                    ActividadProgreso.estado == "completado",
+                )
+            )
+            .group_by(Partida.id_usuario)
+            .all()
+        )
+        return dict(rows)
+
+    @staticmethod
+    def _completed_time_by_student(
+        db: Session, student_ids: list[str], fecha_limite: datetime
+    ) -> dict[str, int]:
+        """Sum completed activity durations per student in a single GROUP BY query.
+
+        Args:
+            db: Database session for querying.
+            student_ids: IDs of the students to include.
+            fecha_limite: Only games started on or after this date are counted.
+
+        Returns:
+            Mapping of student ID to total duration in seconds. Students without
+            timed completed activities are missing from the mapping.
+        """
+        rows = (
+            db.query(Partida.id_usuario, func.sum(ActividadProgreso.duracion))
+            .join(ActividadProgreso, ActividadProgreso.id_juego == Partida.id)
+            .filter(
+                and_(
+                    Partida.id_usuario.in_(student_ids),
+                    Partida.fecha_inicio >= fecha_limite,
+                    ActividadProgreso.duracion.isnot(None),
+                    ActividadProgreso.estado == "completado",
+                )
+            )
+            .group_by(Partida.id_usuario)
+            .all()
+        )
+        return dict(rows)
+
     @staticmethod
     def get_class_summary(
         db: Session, profesor_id: str, clase_id: str | None = None, days: int = 7
@@ -185,22 +243,13 @@ class TeacherDashboardService:
         # Progress = (completed events / total unique events per student) * 100
         total_events = db.query(func.count(func.distinct(Actividad.id))).scalar() or 1
 
-        completed_events_per_student = []
-        for student_id in student_ids:
-            completed = (
-                db.query(func.count(func.distinct(ActividadProgreso.id_actividad)))
-                .filter(
-                    and_(
-                        ActividadProgreso.id_juego.in_(
-                            db.query(Partida.id).filter(Partida.id_usuario == student_id)
-                        ),
-                        ActividadProgreso.estado == "completado",
-                    )
-                )
-                .scalar()
-                or 0
-            )
-            completed_events_per_student.append(completed)
+        # One grouped query for all students instead of one query per student
+        completed_by_student = TeacherDashboardService._completed_activities_by_student(
+            db, student_ids
+        )
+        completed_events_per_student = [
+            completed_by_student.get(student_id, 0) for student_id in student_ids
+        ]
 
         avg_completed = (
             sum(completed_events_per_student) / len(completed_events_per_student)
@@ -213,29 +262,14 @@ class TeacherDashboardService:
         fecha_limite = datetime.now() - timedelta(days=days)
 
         # Sum all activity durations per student, then average across students
-        total_time_per_student = []
-        for student_id in student_ids:
-            student_time = (
-                db.query(func.sum(ActividadProgreso.duracion))
-                .filter(
-                    and_(
-                        ActividadProgreso.id_juego.in_(
-                            db.query(Partida.id).filter(
-                                and_(
-                                    Partida.id_usuario == student_id,
-                                    Partida.fecha_inicio >= fecha_limite,
-                                )
-                            )
-                        ),
-                        ActividadProgreso.duracion.isnot(None),
-                        ActividadProgreso.estado == "completado",
-                    )
-                )
-                .scalar()
-                or 0
-            )
-            if student_time > 0:
-                total_time_per_student.append(student_time)
+        time_by_student = TeacherDashboardService._completed_time_by_student(
+            db, student_ids, fecha_limite
+        )
+        total_time_per_student = [
+            time_by_student[student_id]
+            for student_id in student_ids
+            if time_by_student.get(student_id, 0) > 0
+        ]
 
         avg_time = (
             sum(total_time_per_student) / len(total_time_per_student)
@@ -338,22 +372,12 @@ class TeacherDashboardService:
         student_names = []
         progress_values = []
 
-        for student in students:
-            # Calculate progress for this student
-            completed = (
-                db.query(func.count(func.distinct(ActividadProgreso.id_actividad)))
-                .filter(
-                    and_(
-                        ActividadProgreso.id_juego.in_(
-                            db.query(Partida.id).filter(Partida.id_usuario == student.id)
-                        ),
-                        ActividadProgreso.estado == "completado",
-                    )
-                )
-                .scalar()
-                or 0
-            )
+        completed_by_student = TeacherDashboardService._completed_activities_by_student(
+            db, [student.id for student in students]
+        )
 
+        for student in students:
+            completed = completed_by_student.get(student.id, 0)
             progress = min(100, (completed / total_events) * 100)
 
             student_names.append(f"{student.nombre} {student.apellido}")
@@ -421,28 +445,12 @@ class TeacherDashboardService:
         student_names = []
         time_values = []
 
-        for student in students:
-            # Calculate total time for this student from activity durations
-            total_time = (
-                db.query(func.sum(ActividadProgreso.duracion))
-                .filter(
-                    and_(
-                        ActividadProgreso.id_juego.in_(
-                            db.query(Partida.id).filter(
-                                and_(
-                                    Partida.id_usuario == student.id,
-                                    Partida.fecha_inicio >= fecha_limite,
-                                )
-                            )
-                        ),
-                        ActividadProgreso.duracion.isnot(None),
-                        ActividadProgreso.estado == "completado",
-                    )
-                )
-                .scalar()
-                or 0
-            )
+        time_by_student = TeacherDashboardService._completed_time_by_student(
+            db, [student.id for student in students], fecha_limite
+        )
 
+        for student in students:
+            total_time = time_by_student.get(student.id) or 0
             time_minutes = round(total_time / 60, 0) if total_time else 0
 
             # Only include students with time > 0
@@ -971,6 +979,10 @@ class TeacherDashboardService:
         Returns:
             Excel file as bytes, ready for download.
         """
+        # openpyxl tarda ~300 ms en importarse y solo se usa aquí: import diferido
+        from openpyxl import Workbook
+        from openpyxl.styles import Alignment, Font, PatternFill
+
         students_data = TeacherDashboardService.get_students_list(db, profesor_id, clase_id)
 
         # Create workbook
@@ -9,6 +9,7 @@ Autor: Gernibide
 import uuid
 
 from fastapi import HTTPException, status
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
 from app.logging import log_db_operation
@@ -184,17 +185,20 @@ class UsuarioService:
         # Log de operación DB
         log_db_operation("DELETE", "usuario", usuario_id)
 
-    def listar_usuarios(self, skip: int = 0, limit: int = 100) -> list[Usuario]:
+    def listar_usuarios(
+        self, skip: int = 0, limit: int = 100, after_id: str | None = None
+    ) -> list[Row]:
         """Lista usuarios paginados.
 
         Args:
             skip: Número de registros a saltar.
             limit: Número máximo de registros.
+            after_id: ID del último usuario de la página anterior (cursor).
 
         Returns:
-            Lista de usuarios.
+            Lista de filas con los campos públicos de cada usuario.
         """
-        return self.usuario_repo.get_all(skip, limit)
+        return self.usuario_repo.get_all(skip, limit, after_id)
 
     def crear_usuarios_bulk(
         self, usuarios_data: UsuarioBulkCreate, db: Session
@@ -234,9 +238,9 @@ class UsuarioService:
                 )
 
             # 3. Validar que ningún username existe en BD
-            existentes = self.usuario_repo.get_by_usernames(usernames)
+            existentes = self.usuario_repo.get_existing_usernames(usernames)
             if existentes:
-                usernames_existentes = [u.username for u in existentes]
+                usernames_existentes = [u for u in usernames if u in existentes]
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Los siguientes usernames ya existen: {', '.join(usernames_existentes)}",
@@ -52,8 +52,8 @@ class UsuarioStatsService:
             - Fecha de última partida
             - Total de puntos acumulados
         """
-        # 1. Actividades completadas
-        actividades_completadas = self.actividad_repo.count_completed_by_user(usuario_id)
+        # 1. Actividades completadas y total de puntos (una sola consulta)
+        actividades_completadas, total_puntos = self.actividad_repo.get_stats_by_user(usuario_id)
 
         # 2. Racha de días consecutivos
         racha_dias = self._calcular_racha_dias(usuario_id)
@@ -64,9 +64,6 @@ class UsuarioStatsService:
         # 4. Última partida
         ultima_partida = self.partida_repo.get_last_partida_date(usuario_id)
 
-        # 5. Total puntos
-        total_puntos = self.actividad_repo.sum_points_by_user(usuario_id)
-
         return UsuarioStatsResponse(
             actividades_completadas=actividades_completadas,
             racha_dias=racha_dias,
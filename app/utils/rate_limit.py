@@ -9,6 +9,7 @@ En desarrollo o si Redis no está disponible, usa memoria local.
 Autor: Gernibide
 """
 
+import asyncio
 import os
 
 from fastapi import Request
@@ -59,7 +60,8 @@ def get_storage_uri() -> str:
     redis_url = settings.REDIS_URL if hasattr(settings, "REDIS_URL") else os.getenv("REDIS_URL")
     if redis_url:
         logger.info(
-            f"Rate limiting usando Redis: {redis_url.split('@')[0] if '@' in redis_url else 'redis'}@***"
+            "Rate limiting usando Redis: %s@***",
+            redis_url.split("@")[0] if "@" in redis_url else "redis",
         )
         return redis_url
 
@@ -79,11 +81,15 @@ def get_storage_uri() -> str:
     return "memory://"
 
 
-# Inicializar limiter
+# Inicializar limiter. Si Redis deja de responder, slowapi pasa a contar en
+# memoria y vuelve a probar Redis con backoff exponencial, registrando en el log
+# cuándo se recupera: las peticiones nunca fallan por Redis caído
+STORAGE_URI = get_storage_uri()
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=[],
-    storage_uri=get_storage_uri(),
+    storage_uri=STORAGE_URI,
+    in_memory_fallback_enabled=True,
 )
 
 
@@ -141,16 +147,43 @@ def rate_limit_handler(_request: Request, exc: RateLimitExceeded) -> JSONRespons
     )
 
 
-# Funciones de compatibilidad (no-op para slowapi)
+def _ping_redis(url: str) -> None:
+    """Hace PING a Redis con timeout corto (bloqueante, se ejecuta en un hilo).
+
+    Args:
+        url: URL de Redis.
+
+    Raises:
+        Exception: Si Redis no responde.
+    """
+    import redis
+
+    redis.Redis.from_url(url, socket_connect_timeout=1, socket_timeout=1).ping()
+
+
 async def init_rate_limiter():
-    """Inicializa el rate limiter.
+    """Comprueba que el storage del rate limiter responde.
 
-    Con slowapi, la inicialización es automática al crear el limiter.
-    Esta función se mantiene por compatibilidad.
+    Pensada para lanzarse en segundo plano al arrancar: la app no espera a
+    Redis para estar lista. Si Redis no responde solo se avisa; el limiter
+    usa memoria hasta que Redis vuelva (``in_memory_fallback_enabled``).
     """
-    logger.info("Rate limiter inicializado con slowapi")
+    if not STORAGE_URI.startswith("redis"):
+        logger.info("Rate limiter inicializado con slowapi (memoria)")
+        return
+
+    try:
+        await asyncio.to_thread(_ping_redis, STORAGE_URI)
+    except Exception as e:
+        logger.warning(
+            "Redis no disponible para rate limiting (%s). Usando memoria hasta que responda.",
+            e,
+        )
+        return
+    logger.info("Rate limiter inicializado con slowapi (Redis)")
 
 
+# Función de compatibilidad (no-op para slowapi)
 async def close_rate_limiter():
     """Cierra el rate limiter.
 
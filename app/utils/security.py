@@ -6,6 +6,8 @@ using bcrypt and JWT token generation/validation for authentication.
 Autor: Gernibide
 """
 
+import random
+import string
 from datetime import UTC, datetime, timedelta
 
 import bcrypt
@@ -14,6 +16,9 @@ from jwt.exceptions import InvalidTokenError
 
 from app.config import settings
 
+# Solo mayúsculas y dígitos para evitar confusión (sin 0/O, 1/I/l)
+_ALPHABET = (string.ascii_uppercase + string.digits).translate(str.maketrans("", "", "OI01"))
+
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt.
@@ -111,11 +116,4 @@ def generar_codigo_clase() -> str:
         >>> codigo.isupper()
         True
     """
-    import random
-    import string
-
-    # Solo mayúsculas y dígitos para evitar confusión (sin 0/O, 1/I/l)
-    caracteres = string.ascii_uppercase.replace("O", "").replace("I", "") + string.digits.replace(
-        "0", ""
-    ).replace("1", "")
-    return "".join(random.choices(caracteres, k=6))
+    return "".join(random.choices(_ALPHABET, k=6))
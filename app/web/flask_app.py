@@ -14,6 +14,8 @@ from pathlib import Path
 
 from flask import Flask, render_template, request
 
+from app.i18n.loader import load_flat_translations
+
 # Crear app Flask
 flask_app = Flask(
     __name__,
@@ -38,23 +40,13 @@ def get_translator_flask():
     if lang not in ["es", "eu"]:
         lang = "es"
 
-    # Cargar traducciones
-    import json
-
-    i18n_path = Path(__file__).parent.parent / "i18n" / f"{lang}.json"
-    with open(i18n_path, encoding="utf-8") as f:
-        translations = json.load(f)
+    # Traducciones precargadas en memoria (sin leer el JSON en cada request)
+    translations = load_flat_translations(lang)
 
     def translate(key: str, **kwargs) -> str:
         """Traducir una clave usando dot notation."""
-        keys = key.split(".")
-        value = translations
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k, key)
-            else:
-                return key
-        return str(value).format(**kwargs) if kwargs else str(value)
+        value = translations.get(key, key)
+        return value.format(**kwargs) if kwargs else value
 
     return translate, lang
 
@@ -30,9 +30,7 @@ async def login_page(request: Request):
     Returns the HTML login interface for Gernibide
     """
     translate, lang = get_translator(request)
-    return templates.TemplateResponse(
-        "login.html", {"request": request, "_": translate, "current_lang": lang}
-    )
+    return templates.TemplateResponse(request, "login.html", {"_": translate, "current_lang": lang})
 
 
 @router.get("/dashboard", response_class=HTMLResponse, name="dashboard_page")
@@ -44,7 +42,7 @@ async def dashboard_page(request: Request):
     """
     translate, lang = get_translator(request)
     return templates.TemplateResponse(
-        "dashboard.html", {"request": request, "_": translate, "current_lang": lang}
+        request, "dashboard.html", {"_": translate, "current_lang": lang}
     )
 
 
@@ -56,9 +54,7 @@ async def home_page(request: Request):
     Public landing page with app description, stats, and download section
     """
     translate, lang = get_translator(request)
-    return templates.TemplateResponse(
-        "home.html", {"request": request, "_": translate, "current_lang": lang}
-    )
+    return templates.TemplateResponse(request, "home.html", {"_": translate, "current_lang": lang})
 
 
 @router.get("/statistics", response_class=HTMLResponse, name="statistics_page")
@@ -70,7 +66,7 @@ async def statistics_page(request: Request):
     """
     translate, lang = get_translator(request)
     return templates.TemplateResponse(
-        "statistics.html", {"request": request, "_": translate, "current_lang": lang}
+        request, "statistics.html", {"_": translate, "current_lang": lang}
     )
 
 
@@ -83,7 +79,7 @@ async def statistics_gameplay_page(request: Request):
     """
     translate, lang = get_translator(request)
     return templates.TemplateResponse(
-        "statistics-gameplay.html", {"request": request, "_": translate, "current_lang": lang}
+        request, "statistics-gameplay.html", {"_": translate, "current_lang": lang}
     )
 
 
@@ -96,7 +92,7 @@ async def statistics_learning_page(request: Request):
     """
     translate, lang = get_translator(request)
     return templates.TemplateResponse(
-        "statistics-learning.html", {"request": request, "_": translate, "current_lang": lang}
+        request, "statistics-learning.html", {"_": translate, "current_lang": lang}
     )
 
 
@@ -110,7 +106,7 @@ async def dashboard_teacher_page(request: Request):
     """
     translate, lang = get_translator(request)
     return templates.TemplateResponse(
-        "dashboard-teacher.html", {"request": request, "_": translate, "current_lang": lang}
+        request, "dashboard-teacher.html", {"_": translate, "current_lang": lang}
     )
 
 
@@ -125,7 +121,7 @@ async def gallery_wall_page(request: Request):
     """
     translate, lang = get_translator(request)
     return templates.TemplateResponse(
-        "gallery-wall.html", {"request": request, "_": translate, "current_lang": lang}
+        request, "gallery-wall.html", {"_": translate, "current_lang": lang}
     )
 
 
@@ -139,5 +135,5 @@ async def manuals_page(request: Request):
     """
     translate, lang = get_translator(request)
     return templates.TemplateResponse(
-        "manuals.html", {"request": request, "_": translate, "current_lang": lang}
+        request, "manuals.html", {"_": translate, "current_lang": lang}
     )
@@ -0,0 +1,218 @@
+"""Servidor de archivos estáticos con caché en memoria y revalidación HTTP.
+
+Extiende ``StaticFiles`` de Starlette para guardar en RAM los archivos
+pequeños (CSS, JS, imágenes) y responder con ``ETag``, ``Last-Modified`` y
+``Cache-Control``, devolviendo un 304 sin cuerpo si el navegador ya tiene
+la versión actual. Los de texto (HTML, CSS, JS, SVG...) se guardan además
+comprimidos con gzip y se envían así a los clientes que lo aceptan. Los
+archivos grandes (vídeos, PDFs) se envían desde disco en bloques de 1 MiB,
+y el ``stat()`` de cada archivo se reutiliza durante un minuto.
+
+Autor: Gernibide
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import stat
+import time
+from email.utils import formatdate
+from typing import NamedTuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+# Cabecera Cache-Control enviada con todos los archivos estáticos (1 día)
+STATIC_CACHE_CONTROL = "public, max-age=86400"
+
+# Tamaño máximo de un archivo para guardarlo en memoria. Los mayores (vídeos,
+# manuales PDF) se siguen sirviendo en streaming desde disco con FileResponse,
+# que además soporta peticiones Range
+MAX_CACHED_FILE_SIZE = 1024 * 1024
+
+# Segundos durante los que se reutiliza el resultado de buscar y hacer stat()
+# de un archivo; un cambio en disco se ve como mucho tras este tiempo
+STAT_CACHE_TTL = 60
+
+# Tipos MIME que se guardan también comprimidos con gzip (además de text/*)
+COMPRESSIBLE_TYPES = frozenset(
+    {"application/javascript", "application/json", "application/xml", "image/svg+xml"}
+)
+
+
+class _LargeFileResponse(FileResponse):
+    """FileResponse que lee y envía el archivo en bloques de 1 MiB (por defecto 64 KiB)."""
+
+    chunk_size = 1024 * 1024
+
+
+class _Lookup(NamedTuple):
+    """Ruta absoluta y stat de un archivo estático, válidos hasta ``expires_at``."""
+
+    full_path: str
+    stat_result: os.stat_result
+    expires_at: float
+
+
+class _CachedFile(NamedTuple):
+    """Contenido y metadatos de un archivo estático guardado en memoria."""
+
+    data: bytes
+    etag: str
+    # Versión gzip y su ETag; None si el tipo no se comprime o no gana tamaño
+    gzip_data: bytes | None
+    gzip_etag: str | None
+    content_type: str
+    last_modified: str
+    mtime_ns: int
+    size: int
+
+
+def _load_file(full_path: str, stat_result: os.stat_result) -> _CachedFile:
+    """Lee un archivo del disco y precalcula sus cabeceras de caché.
+
+    Args:
+        full_path: Ruta absoluta del archivo
+        stat_result: Resultado de ``os.stat`` del archivo
+
+    Returns:
+        Entrada de caché con el contenido (y su versión gzip), ETag, tipo MIME
+        y fecha de modificación
+    """
+    with open(full_path, "rb") as f:
+        data = f.read()
+    content_type = mimetypes.guess_type(full_path)[0] or "text/plain"
+    etag_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    gzip_data = None
+    if content_type.startswith("text/") or content_type in COMPRESSIBLE_TYPES:
+        # mtime=0: la misma entrada produce siempre los mismos bytes
+        compressed = gzip.compress(data, compresslevel=6, mtime=0)
+        if len(compressed) < len(data):
+            gzip_data = compressed
+
+    if content_type.startswith("text/") or content_type == "application/javascript":
+        content_type += "; charset=utf-8"
+    return _CachedFile(
+        data=data,
+        etag=f'"{etag_hash}"',
+        # Cada codificación es una representación distinta y necesita su ETag
+        gzip_data=gzip_data,
+        gzip_etag=f'"{etag_hash}-gzip"' if gzip_data is not None else None,
+        content_type=content_type,
+        last_modified=formatdate(stat_result.st_mtime, usegmt=True),
+        mtime_ns=stat_result.st_mtime_ns,
+        size=stat_result.st_size,
+    )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Comprueba si la cabecera If-None-Match incluye el ETag (o es ``*``)."""
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in tags or "*" in tags
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Comprueba si la cabecera Accept-Encoding admite gzip (``q=0`` lo rechaza)."""
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            q = params.strip().lower().removeprefix("q=")
+            try:
+                return not q or float(q) > 0
+            except ValueError:
+                return True
+    return False
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles que mantiene en memoria los archivos pequeños
+
+    Cada archivo se lee del disco en la primera petición y se reutiliza mientras
+    su mtime y tamaño no cambien, por lo que una edición en disco se detecta sin
+    reiniciar el servidor (tras ``STAT_CACHE_TTL`` como mucho). Todas las
+    respuestas incluyen ``Cache-Control``.
+    """
+
+    def __init__(self, *args, max_cached_size: int = MAX_CACHED_FILE_SIZE, **kwargs):
+        """
+        Args:
+            max_cached_size: Tamaño máximo en bytes de un archivo cacheado en memoria
+            *args, **kwargs: Argumentos de ``StaticFiles``
+        """
+        super().__init__(*args, **kwargs)
+        self.max_cached_size = max_cached_size
+        self._cache: dict[str, _CachedFile] = {}
+        # Solo se guardan búsquedas de archivos existentes: el tamaño está
+        # acotado por el contenido del directorio, no por las URLs pedidas
+        self._lookups: dict[str, _Lookup] = {}
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        # Archivos grandes: streaming desde disco (con soporte de Range) como en
+        # Starlette, pero en bloques de 1 MiB
+        response = _LargeFileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        response.headers["Cache-Control"] = STATIC_CACHE_CONTROL
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        lookup = self._lookups.get(path)
+        if lookup is None or lookup.expires_at < time.monotonic():
+            try:
+                full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path)
+            except OSError:
+                # Starlette traduce estos errores a 401/404
+                return await super().get_response(path, scope)
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                # Directorios y 404 siguen el camino de Starlette
+                return await super().get_response(path, scope)
+            lookup = _Lookup(full_path, stat_result, time.monotonic() + STAT_CACHE_TTL)
+            self._lookups[path] = lookup
+
+        full_path, stat_result = lookup.full_path, lookup.stat_result
+        if stat_result.st_size > self.max_cached_size:
+            return self.file_response(full_path, stat_result, scope)
+
+        cached = self._cache.get(full_path)
+        if (
+            cached is None
+            or cached.mtime_ns != stat_result.st_mtime_ns
+            or cached.size != stat_result.st_size
+        ):
+            cached = await anyio.to_thread.run_sync(_load_file, full_path, stat_result)
+            self._cache[full_path] = cached
+
+        request_headers = Headers(scope=scope)
+        data, etag = cached.data, cached.etag
+        headers = {"Cache-Control": STATIC_CACHE_CONTROL, "Last-Modified": cached.last_modified}
+        if cached.gzip_data is not None:
+            headers["Vary"] = "Accept-Encoding"
+            if _accepts_gzip(request_headers.get("accept-encoding", "")):
+                data, etag = cached.gzip_data, cached.gzip_etag
+                headers["Content-Encoding"] = "gzip"
+        headers["ETag"] = etag
+
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
+        body = data if scope["method"] == "GET" else b""
+        response = Response(body, media_type=cached.content_type, headers=headers)
+        if scope["method"] == "HEAD":
+            response.headers["Content-Length"] = str(len(data))
+        return response
@@ -18,6 +18,7 @@ os.environ["DATABASE_URL"] = "sqlite:///:memory:"
 
 from app.config import settings
 from app.database import Base, get_db
+from app.dependencies import invalidate_profesor_cache
 from app.main import app
 from app.models.actividad import Actividad
 from app.models.clase import Clase
@@ -25,6 +26,8 @@ from app.models.juego import Partida
 from app.models.profesor import Profesor
 from app.models.punto import Punto
 from app.models.usuario import Usuario
+from app.repositories.actividad_repository import ActividadRepository
+from app.repositories.punto_repository import PuntoRepository
 from app.utils.security import generar_codigo_clase, hash_password
 
 # API Key para tests
@@ -44,6 +47,10 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engin
 @pytest.fixture(scope="function")
 def db_session():
     """Crea una sesión de base de datos para tests"""
+    # Las cachés de proceso sobrevivirían a la base de datos de cada test
+    PuntoRepository.clear_cache()
+    ActividadRepository.clear_cache()
+    invalidate_profesor_cache()
     Base.metadata.create_all(bind=engine)
     session = TestingSessionLocal()
     try:
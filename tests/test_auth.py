@@ -56,3 +56,13 @@ class TestAuth:
 
         # Puede ser 401 (usuario no encontrado) o 422 (validación) dependiendo de la implementación
         assert response.status_code in [401, 422]
+
+    def test_cache_profesor_devuelve_copia(self, db_session, test_profesor):
+        """Test: Modificar los datos devueltos no altera la cache del profesor"""
+        from app.dependencies import _get_profesor_data
+
+        primero = _get_profesor_data(db_session, test_profesor.username)
+        primero["nombre"] = "Modificado"
+        segundo = _get_profesor_data(db_session, test_profesor.username)
+
+        assert segundo["nombre"] == "Profesor"
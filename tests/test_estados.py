@@ -99,6 +99,24 @@ class TestActividadProgreso:
         error_msg = data.get("detail", data.get("error", {}).get("message", ""))
         assert "no pertenece" in error_msg.lower()
 
+    def test_iniciar_evento_punto_inexistente(self, admin_client, test_partida, test_actividades):
+        """Test: Iniciar actividad en un punto inexistente debe indicar que falta el punto"""
+        import uuid
+
+        response = admin_client.post(
+            "/api/v1/actividad-progreso/iniciar",
+            json={
+                "id_juego": test_partida.id,
+                "id_punto": str(uuid.uuid4()),
+                "id_actividad": test_actividades[0].id,
+            },
+        )
+
+        assert response.status_code == 404
+        data = response.json()
+        error_msg = data.get("detail", data.get("error", {}).get("message", ""))
+        assert "punto especificado no existe" in error_msg.lower()
+
     def test_completar_evento_exitoso(
         self, admin_client, test_partida, test_punto, test_actividades
     ):
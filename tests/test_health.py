@@ -25,3 +25,70 @@ class TestHealth:
         response = client.get("/docs")
 
         assert response.status_code == 200
+
+    def test_static_etag_y_304(self, client):
+        """Test: Los estáticos llevan ETag/Cache-Control y se revalidan con 304"""
+        response = client.get("/static/images/usuariosyactividad-green.svg")
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=86400"
+        etag = response.headers["etag"]
+
+        revalidated = client.get(
+            "/static/images/usuariosyactividad-green.svg", headers={"If-None-Match": etag}
+        )
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+
+    def test_static_gzip(self, client):
+        """Test: Los estáticos de texto se sirven comprimidos a quien acepta gzip"""
+        path = "/static/images/usuariosyactividad-green.svg"
+        plain = client.get(path, headers={"Accept-Encoding": "identity"})
+        compressed = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in plain.headers
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.headers["vary"] == "Accept-Encoding"
+        assert compressed.headers["etag"] != plain.headers["etag"]
+        # httpx descomprime el cuerpo: el contenido debe ser el mismo
+        assert compressed.content == plain.content
+
+    def test_cors_solo_en_api(self, client):
+        """Test: CORS responde al preflight de /api y no se aplica a /health"""
+        preflight = client.options(
+            "/api/v1/auth/login-app",
+            headers={
+                "Origin": "https://ejemplo.com",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "authorization",
+            },
+        )
+        assert preflight.status_code == 200
+        assert preflight.headers["access-control-allow-origin"] == "*"
+
+        response = client.get("/health", headers={"Origin": "https://ejemplo.com"})
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_ready(self, client):
+        """Test: /ready indica que la base de datos está preparada"""
+        response = client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}
+
+    def test_respuestas_api_con_orjson(self, admin_client, monkeypatch):
+        """Test: Los endpoints de los routers serializan con ORJSONResponse"""
+        from fastapi.responses import ORJSONResponse
+
+        renderizados = []
+        render_original = ORJSONResponse.render
+
+        def render(self, content):
+            renderizados.append(content)
+            return render_original(self, content)
+
+        monkeypatch.setattr(ORJSONResponse, "render", render)
+        response = admin_client.get("/api/v1/puntos")
+
+        assert response.status_code == 200
+        assert renderizados == [[]]
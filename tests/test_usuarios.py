@@ -8,6 +8,11 @@ Autor: Gernibide
 
 import uuid
 
+import pytest
+from sqlalchemy.exc import StatementError
+
+from app.models.usuario import Usuario
+
 
 class TestUsuariosEndpoints:
     """Tests de integración para endpoints de usuarios"""
@@ -80,6 +85,37 @@ class TestUsuariosEndpoints:
         assert response.status_code == 404
         assert "clase" in response.json()["error"]["message"].lower()
 
+    def test_crear_usuario_id_clase_mal_formado(self, client):
+        """Test: Un id_clase que no es UUID se rechaza con 422 en lugar de guardarse como NULL"""
+        response = client.post(
+            "/api/v1/usuarios",
+            json={
+                "username": "estudiante_nuevo",
+                "nombre": "Estudiante",
+                "apellido": "Nuevo",
+                "password": "password123",
+                "id_clase": "not-a-uuid",
+            },
+        )
+
+        assert response.status_code == 422
+
+    def test_id_mal_formado_no_se_guarda_como_null(self, db_session):
+        """Test: La columna UUID rechaza un valor mal formado en lugar de insertar NULL"""
+        usuario = Usuario(
+            id=str(uuid.uuid4()),
+            username="estudiante_nuevo",
+            nombre="Estudiante",
+            apellido="Nuevo",
+            password="hash",
+            id_clase="not-a-uuid",
+        )
+        db_session.add(usuario)
+
+        with pytest.raises(StatementError):
+            db_session.commit()
+        db_session.rollback()
+
     def test_crear_usuario_con_codigo_clase(self, client, test_clase):
         """Test: Crear usuario usando código de clase en lugar de UUID"""
         response = client.post(
@@ -139,6 +175,24 @@ class TestUsuariosEndpoints:
         data = response.json()
         assert len(data) <= 1
 
+    def test_listar_usuarios_paginacion_cursor(
+        self, admin_client, test_usuario, test_usuario_secundario
+    ):
+        """Test: Paginación por cursor (after_id) recorre todos los usuarios sin repetir"""
+        primera = admin_client.get("/api/v1/usuarios?limit=1").json()
+        segunda = admin_client.get(f"/api/v1/usuarios?limit=1&after_id={primera[0]['id']}").json()
+        final = admin_client.get(f"/api/v1/usuarios?limit=1&after_id={segunda[0]['id']}").json()
+
+        ids = {primera[0]["id"], segunda[0]["id"]}
+        assert ids == {test_usuario.id, test_usuario_secundario.id}
+        assert final == []
+
+    def test_listar_usuarios_cursor_invalido(self, admin_client, test_usuario):
+        """Test: Un cursor after_id mal formado responde 422 en lugar de una lista vacía"""
+        response = admin_client.get("/api/v1/usuarios?after_id=not-a-uuid")
+
+        assert response.status_code == 422
+
     def test_obtener_usuario_propio_con_token(self, client, test_usuario, auth_headers):
         """Test: Usuario puede ver su propio perfil con token"""
         response = client.get(f"/api/v1/usuarios/{test_usuario.id}", headers=auth_headers)
@@ -156,6 +210,12 @@ class TestUsuariosEndpoints:
         # Debería fallar con 403 (sin permiso) o 404 (no existe)
         assert response.status_code in [403, 404]
 
+    def test_obtener_usuario_id_mal_formado(self, admin_client):
+        """Test: Un id de ruta que no es UUID responde 422 sin llegar a la base de datos"""
+        response = admin_client.get("/api/v1/usuarios/not-a-uuid")
+
+        assert response.status_code == 422
+
     def test_obtener_usuario_con_api_key(self, admin_client, test_usuario):
         """Test: API Key puede ver cualquier usuario"""
         response = admin_client.get(f"/api/v1/usuarios/{test_usuario.id}")
@@ -456,3 +516,56 @@ class TestUsuariosEstadisticas:
         response = admin_client.get(f"/api/v1/usuarios/{usuario_id}/estadisticas")
 
         assert response.status_code == 404
+
+    def test_perfil_progreso_prioriza_completado(
+        self, client, db_session, test_usuario, auth_headers, test_partida, test_actividades
+    ):
+        """Test: El perfil muestra el progreso completado aunque haya uno posterior en curso"""
+        from datetime import datetime, timedelta
+
+        from app.models.actividad_progreso import ActividadProgreso
+
+        actividad = test_actividades[0]
+        inicio = datetime.now()
+        for estado, minutos in (("completado", 0), ("en_progreso", 10)):
+            db_session.add(
+                ActividadProgreso(
+                    id=str(uuid.uuid4()),
+                    id_juego=test_partida.id,
+                    id_actividad=actividad.id,
+                    id_punto=actividad.id_punto,
+                    estado=estado,
+                    fecha_inicio=inicio + timedelta(minutes=minutos),
+                    puntuacion=80.0 if estado == "completado" else None,
+                )
+            )
+        db_session.commit()
+
+        response = client.get(
+            f"/api/v1/usuarios/{test_usuario.id}/perfil-progreso", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        punto = response.json()["puntos"][0]
+        estados = {a["id_actividad"]: a["estado"] for a in punto["actividades"]}
+        assert estados[actividad.id] == "completado"
+        assert estados[test_actividades[1].id] == "no_iniciada"
+        assert punto["actividades_completadas"] == 1
+
+    def test_perfil_progreso_refleja_actividad_nueva(
+        self, client, test_usuario, auth_headers, api_key_headers, test_actividades
+    ):
+        """Test: Crear una actividad invalida el catálogo cacheado del perfil"""
+        url = f"/api/v1/usuarios/{test_usuario.id}/perfil-progreso"
+        response = client.get(url, headers=auth_headers)
+        assert response.json()["puntos"][0]["total_actividades"] == 3
+
+        response = client.post(
+            "/api/v1/actividades",
+            json={"id_punto": test_actividades[0].id_punto, "nombre": "Actividad 4"},
+            headers=api_key_headers,
+        )
+        assert response.status_code == 201
+
+        response = client.get(url, headers=auth_headers)
+        assert response.json()["puntos"][0]["total_actividades"] == 4
@@ -0,0 +1,39 @@
+"""Tests unitarios para las descripciones de los audit logs.
+
+Comprueban el texto de get_description() en cada tipo de log
+(sin base de datos).
+
+Autor: Gernibide
+"""
+
+from datetime import datetime
+
+from app.models.audit_log import AuditLog, AuditLogApp, AuditLogWeb
+
+
+class TestAuditLogDescription:
+    """Tests unitarios para AuditLog.get_description y sus subclases"""
+
+    def test_descripcion_base_con_fecha(self):
+        """Test: El log base incluye acción, usuario y fecha sin microsegundos"""
+        log = AuditLog(
+            accion="LOGIN",
+            usuario_id="u-1",
+            timestamp=datetime(2026, 10, 17, 9, 5, 3, 123456),
+        )
+
+        assert log.get_description() == "LOGIN - Usuario u-1 - 2026-10-17 09:05:03"
+
+    def test_descripcion_web_profesor(self):
+        """Test: El log web de un profesor incluye navegador e IP"""
+        log = AuditLogWeb(
+            accion="LOGIN", profesor_id="p-1", browser="Firefox", ip_address="10.0.0.1"
+        )
+
+        assert log.get_description() == "🌐 LOGIN - Profesor p-1 desde Firefox (10.0.0.1)"
+
+    def test_descripcion_app_sin_dispositivo(self):
+        """Test: El log de app sin datos del dispositivo usa los textos por defecto"""
+        log = AuditLogApp(accion="PARTIDA", usuario_id="u-1")
+
+        assert log.get_description() == "📱 PARTIDA - Usuario u-1 desde app"
@@ -0,0 +1,105 @@
+"""Tests de migraciones Alembic sobre SQLite.
+
+Aplican la migración directamente sobre una BD SQLite en memoria con el
+esquema anterior y comprueban que los datos existentes siguen siendo legibles.
+
+Autor: Gernibide
+"""
+
+import importlib.util
+import uuid
+from pathlib import Path
+
+import pytest
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.database import Base
+from app.models.audit_log import AuditLog, AuditLogApp, AuditLogWeb
+
+VERSIONS_DIR = Path(__file__).resolve().parents[2] / "alembic" / "versions"
+
+
+def _cargar_migracion(revision: str):
+    """Importa el módulo de la migración con el revision id dado."""
+    (path,) = VERSIONS_DIR.glob(f"*_{revision}_*.py")
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _ejecutar(engine, funcion) -> None:
+    with (
+        engine.begin() as connection,
+        Operations.context(MigrationContext.configure(connection)),
+    ):
+        funcion()
+
+
+@pytest.fixture
+def engine_tipo_texto():
+    """BD SQLite con audit_log.tipo como VARCHAR y logs guardados con el nombre."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    tabla = AuditLog.__table__
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE audit_log"))
+        ddl = str(CreateTable(tabla).compile(engine)).replace("tipo SMALLINT", "tipo VARCHAR(20)")
+        connection.execute(text(ddl))
+        for index in tabla.indexes:
+            connection.execute(CreateIndex(index))
+        for tipo in ("web", "app", "audit_log"):
+            connection.execute(
+                text(
+                    "INSERT INTO audit_log (id, timestamp, accion, tipo) "
+                    "VALUES (:id, '2026-01-01 00:00:00', 'LOGIN', :tipo)"
+                ),
+                {"id": uuid.uuid4().hex, "tipo": tipo},
+            )
+    yield engine
+    engine.dispose()
+
+
+class TestMigracionAuditLogTipo:
+    """Tests de la migración 5e8a3b91c2d4 (audit_log.tipo a SMALLINT)"""
+
+    def test_upgrade_convierte_tipos_existentes(self, engine_tipo_texto):
+        """Test: Tras el upgrade los logs antiguos se cargan y filtran por tipo"""
+        migracion = _cargar_migracion("5e8a3b91c2d4")
+
+        _ejecutar(engine_tipo_texto, migracion.upgrade)
+
+        with Session(engine_tipo_texto) as session:
+            tipos = sorted(type(log).__name__ for log in session.query(AuditLog).all())
+            assert tipos == ["AuditLog", "AuditLogApp", "AuditLogWeb"]
+            assert session.query(AuditLogWeb).count() == 1
+            assert session.query(AuditLog).filter(AuditLog.tipo == "app").count() == 1
+            assert session.query(AuditLogApp).one().tipo == "app"
+
+        indices = {index["name"] for index in inspect(engine_tipo_texto).get_indexes("audit_log")}
+        assert indices >= {index.name for index in AuditLog.__table__.indexes}
+
+    def test_downgrade_restaura_nombres(self, engine_tipo_texto):
+        """Test: El downgrade vuelve a guardar el tipo como texto"""
+        migracion = _cargar_migracion("5e8a3b91c2d4")
+
+        _ejecutar(engine_tipo_texto, migracion.upgrade)
+        _ejecutar(engine_tipo_texto, migracion.downgrade)
+
+        with engine_tipo_texto.connect() as connection:
+            tipos = connection.execute(text("SELECT tipo FROM audit_log ORDER BY tipo")).scalars()
+            assert list(tipos) == ["app", "audit_log", "web"]
+
+    def test_upgrade_rechaza_tipo_desconocido(self, engine_tipo_texto):
+        """Test: Un tipo que no se puede convertir aborta la migración"""
+        migracion = _cargar_migracion("5e8a3b91c2d4")
+        with engine_tipo_texto.begin() as connection:
+            connection.execute(text("UPDATE audit_log SET tipo = 'otro' WHERE tipo = 'web'"))
+
+        with pytest.raises(RuntimeError, match="tipo desconocido"):
+            _ejecutar(engine_tipo_texto, migracion.upgrade)
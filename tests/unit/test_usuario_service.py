@@ -297,9 +297,7 @@ class TestUsuarioServiceBulk:
 
         mock_clase_repo.exists.return_value = True
         # Simular que un username ya existe
-        usuario_existente = Mock()
-        usuario_existente.username = "existente"
-        mock_usuario_repo.get_by_usernames.return_value = [usuario_existente]
+        mock_usuario_repo.get_existing_usernames.return_value = {"existente"}
 
         service = UsuarioService(mock_usuario_repo, mock_clase_repo)
         bulk_data = UsuarioBulkCreate(
@@ -330,7 +328,7 @@ class TestUsuarioServiceBulk:
         mock_db = Mock()
 
         mock_clase_repo.exists.return_value = True
-        mock_usuario_repo.get_by_usernames.return_value = []  # Ninguno existe
+        mock_usuario_repo.get_existing_usernames.return_value = set()  # Ninguno existe
         mock_usuario_repo.bulk_create.return_value = [
             Usuario(
                 id=str(uuid.uuid4()),
@@ -435,7 +433,7 @@ class TestUsuarioServiceConsultas:
 
         # Assert
         assert len(resultado) == 2
-        mock_usuario_repo.get_all.assert_called_once_with(10, 20)
+        mock_usuario_repo.get_all.assert_called_once_with(10, 20, None)
 
     def test_eliminar_usuario_existente(self):
         """Test: Eliminar usuario que existe"""
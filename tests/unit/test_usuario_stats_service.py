@@ -24,11 +24,10 @@ class TestUsuarioStatsService:
         mock_punto_repo = Mock()
 
         # Simular usuario sin actividad
-        mock_actividad_repo.count_completed_by_user.return_value = 0
+        mock_actividad_repo.get_stats_by_user.return_value = (0, 0.0)
         mock_partida_repo.get_distinct_dates_for_user.return_value = []
         mock_punto_repo.get_completed_modules_by_user.return_value = []
         mock_partida_repo.get_last_partida_date.return_value = None
-        mock_actividad_repo.sum_points_by_user.return_value = 0.0
 
         service = UsuarioStatsService(mock_partida_repo, mock_actividad_repo, mock_punto_repo)
         usuario_id = str(uuid.uuid4())
@@ -50,11 +49,10 @@ class TestUsuarioStatsService:
         mock_actividad_repo = Mock()
         mock_punto_repo = Mock()
 
-        mock_actividad_repo.count_completed_by_user.return_value = 5
+        mock_actividad_repo.get_stats_by_user.return_value = (5, 450.5)
         mock_partida_repo.get_distinct_dates_for_user.return_value = []
         mock_punto_repo.get_completed_modules_by_user.return_value = ["Módulo 1", "Módulo 2"]
         mock_partida_repo.get_last_partida_date.return_value = datetime.now()
-        mock_actividad_repo.sum_points_by_user.return_value = 450.5
 
         service = UsuarioStatsService(mock_partida_repo, mock_actividad_repo, mock_punto_repo)
         usuario_id = str(uuid.uuid4())
@@ -75,10 +73,9 @@ class TestUsuarioStatsService:
         mock_punto_repo = Mock()
 
         mock_partida_repo.get_distinct_dates_for_user.return_value = []
-        mock_actividad_repo.count_completed_by_user.return_value = 0
+        mock_actividad_repo.get_stats_by_user.return_value = (0, 0.0)
         mock_punto_repo.get_completed_modules_by_user.return_value = []
         mock_partida_repo.get_last_partida_date.return_value = None
-        mock_actividad_repo.sum_points_by_user.return_value = 0.0
 
         service = UsuarioStatsService(mock_partida_repo, mock_actividad_repo, mock_punto_repo)
         usuario_id = str(uuid.uuid4())
@@ -107,10 +104,9 @@ class TestUsuarioStatsService:
             anteayer,
         ]
 
-        mock_actividad_repo.count_completed_by_user.return_value = 0
+        mock_actividad_repo.get_stats_by_user.return_value = (0, 0.0)
         mock_punto_repo.get_completed_modules_by_user.return_value = []
         mock_partida_repo.get_last_partida_date.return_value = datetime.now()
-        mock_actividad_repo.sum_points_by_user.return_value = 0.0
 
         service = UsuarioStatsService(mock_partida_repo, mock_actividad_repo, mock_punto_repo)
         usuario_id = str(uuid.uuid4())
@@ -140,10 +136,9 @@ class TestUsuarioStatsService:
             hace_3_dias,
         ]
 
-        mock_actividad_repo.count_completed_by_user.return_value = 0
+        mock_actividad_repo.get_stats_by_user.return_value = (0, 0.0)
         mock_punto_repo.get_completed_modules_by_user.return_value = []
         mock_partida_repo.get_last_partida_date.return_value = datetime.now()
-        mock_actividad_repo.sum_points_by_user.return_value = 0.0
 
         service = UsuarioStatsService(mock_partida_repo, mock_actividad_repo, mock_punto_repo)
         usuario_id = str(uuid.uuid4())
@@ -170,10 +165,9 @@ class TestUsuarioStatsService:
             anteayer,
         ]
 
-        mock_actividad_repo.count_completed_by_user.return_value = 0
+        mock_actividad_repo.get_stats_by_user.return_value = (0, 0.0)
         mock_punto_repo.get_completed_modules_by_user.return_value = []
         mock_partida_repo.get_last_partida_date.return_value = datetime.now() - timedelta(days=1)
-        mock_actividad_repo.sum_points_by_user.return_value = 0.0
 
         service = UsuarioStatsService(mock_partida_repo, mock_actividad_repo, mock_punto_repo)
         usuario_id = str(uuid.uuid4())
@@ -195,9 +189,8 @@ class TestUsuarioStatsService:
         mock_punto_repo.get_completed_modules_by_user.return_value = modulos
 
         mock_partida_repo.get_distinct_dates_for_user.return_value = []
-        mock_actividad_repo.count_completed_by_user.return_value = 0
+        mock_actividad_repo.get_stats_by_user.return_value = (0, 0.0)
         mock_partida_repo.get_last_partida_date.return_value = None
-        mock_actividad_repo.sum_points_by_user.return_value = 0.0
 
         service = UsuarioStatsService(mock_partida_repo, mock_actividad_repo, mock_punto_repo)
         usuario_id = str(uuid.uuid4())
@@ -221,9 +214,8 @@ class TestUsuarioStatsService:
         mock_partida_repo.get_last_partida_date.return_value = ultima_fecha
 
         mock_partida_repo.get_distinct_dates_for_user.return_value = []
-        mock_actividad_repo.count_completed_by_user.return_value = 0
+        mock_actividad_repo.get_stats_by_user.return_value = (0, 0.0)
         mock_punto_repo.get_completed_modules_by_user.return_value = []
-        mock_actividad_repo.sum_points_by_user.return_value = 0.0
 
         service = UsuarioStatsService(mock_partida_repo, mock_actividad_repo, mock_punto_repo)
         usuario_id = str(uuid.uuid4())
@@ -241,10 +233,9 @@ class TestUsuarioStatsService:
         mock_actividad_repo = Mock()
         mock_punto_repo = Mock()
 
-        mock_actividad_repo.sum_points_by_user.return_value = 1234.56
+        mock_actividad_repo.get_stats_by_user.return_value = (0, 1234.56)
 
         mock_partida_repo.get_distinct_dates_for_user.return_value = []
-        mock_actividad_repo.count_completed_by_user.return_value = 0
         mock_punto_repo.get_completed_modules_by_user.return_value = []
         mock_partida_repo.get_last_partida_date.return_value = None
 
@@ -266,10 +257,9 @@ class TestUsuarioStatsService:
         mock_punto_repo = Mock()
 
         mock_partida_repo.get_distinct_dates_for_user.return_value = []
-        mock_actividad_repo.count_completed_by_user.return_value = 0
+        mock_actividad_repo.get_stats_by_user.return_value = (0, 0.0)
         mock_punto_repo.get_completed_modules_by_user.return_value = []
         mock_partida_repo.get_last_partida_date.return_value = None
-        mock_actividad_repo.sum_points_by_user.return_value = 0.0
 
         service = UsuarioStatsService(mock_partida_repo, mock_actividad_repo, mock_punto_repo)
         usuario_id = str(uuid.uuid4())
@@ -278,8 +268,7 @@ class TestUsuarioStatsService:
         service.obtener_estadisticas(usuario_id)
 
         # Assert
-        mock_actividad_repo.count_completed_by_user.assert_called_once_with(usuario_id)
+        mock_actividad_repo.get_stats_by_user.assert_called_once_with(usuario_id)
         mock_partida_repo.get_distinct_dates_for_user.assert_called_once_with(usuario_id)
         mock_punto_repo.get_completed_modules_by_user.assert_called_once_with(usuario_id)
         mock_partida_repo.get_last_partida_date.assert_called_once_with(usuario_id)
-        mock_actividad_repo.sum_points_by_user.assert_called_once_with(usuario_id)